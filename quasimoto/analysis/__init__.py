@@ -0,0 +1,244 @@
+"""
+A module implementing spectral and level analysis of sample data.
+"""
+
+# built-in
+from typing import Iterable, Iterator, NamedTuple, Optional, cast
+
+# third-party
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import rfft, rfftfreq
+from scipy.signal import get_window
+
+# internal
+from quasimoto.wave.mixins import DEFAULT_BLOCK_FRAMES
+from quasimoto.wave.reader import WaveReader
+
+DEFAULT_FRAME_SIZE = 4096
+DEFAULT_WINDOW = "hann"
+
+# Reading many frames' worth of data at a time keeps transforms batched.
+ANALYSIS_BLOCKS = 16
+
+
+def float_blocks(
+    reader: WaveReader, frames_per_block: int = DEFAULT_BLOCK_FRAMES
+) -> Iterator[np.ndarray]:
+    """Get a reader's sample data as blocks of values in [-1.0, 1.0)."""
+
+    codec = reader.codec
+    for block in reader.blocks(frames_per_block):
+        yield codec.to_float(block)
+
+
+def frame_batches(
+    blocks: Iterable[np.ndarray], frame_size: int, hop: int
+) -> Iterator[np.ndarray]:
+    """
+    Get overlapping (frames, channels, frame_size) views of (frames,
+    channels) blocks, 'hop' frames apart. Samples not covered by a full frame
+    at the end are zero padded into a final frame.
+    """
+
+    assert 0 < hop <= frame_size
+
+    pending: Optional[np.ndarray] = None
+    covered = 0
+
+    for block in blocks:
+        data = block if pending is None else np.concatenate((pending, block))
+
+        count = 0
+        if len(data) >= frame_size:
+            count = (len(data) - frame_size) // hop + 1
+            yield sliding_window_view(data, frame_size, axis=0)[::hop][:count]
+            covered = frame_size - hop
+
+        # Keep whatever the next frame needs.
+        pending = data[count * hop :]
+        if count:
+            pending = pending.copy()
+
+    if pending is not None and len(pending) > covered:
+        padded = np.zeros((frame_size, pending.shape[1]))
+        padded[: len(pending)] = pending
+        yield padded.T[np.newaxis]
+
+
+def stft(
+    blocks: Iterable[np.ndarray],
+    frame_size: int = DEFAULT_FRAME_SIZE,
+    hop: int = None,
+    window: str = DEFAULT_WINDOW,
+) -> Iterator[np.ndarray]:
+    """
+    Get (frames, channels, frame_size // 2 + 1) magnitude spectra of
+    windowed, overlapping frames (half-overlapping by default). Magnitudes
+    are scaled so that a full-scale sinusoid peaks near 1.0.
+    """
+
+    # Scaling is applied to the window (the transform is linear).
+    weights = get_window(window, frame_size)
+    weights *= 2.0 / weights.sum()
+
+    for frames in frame_batches(blocks, frame_size, hop or frame_size // 2):
+        yield np.abs(
+            rfft(frames * weights, axis=-1, overwrite_x=True, workers=-1)
+        )
+
+
+def peak_frequencies(
+    spectrum: np.ndarray, sample_rate: int, frame_size: int
+) -> np.ndarray:
+    """
+    Get the frequency of the largest magnitude in each (channel) row of a
+    spectrum, interpolating between bins.
+    """
+
+    bins = np.argmax(spectrum, axis=-1)
+
+    # Fit a parabola through the peak and its neighbors.
+    inner = np.clip(bins, 1, spectrum.shape[-1] - 2)
+    left, center, right = (
+        np.take_along_axis(spectrum, (inner + x)[..., np.newaxis], axis=-1)[
+            ..., 0
+        ]
+        for x in (-1, 0, 1)
+    )
+    denominator = left - 2.0 * center + right
+    offset = np.divide(
+        0.5 * (left - right),
+        denominator,
+        out=np.zeros_like(denominator),
+        where=(denominator != 0.0) & (inner == bins),
+    )
+
+    return cast(np.ndarray, (bins + offset) * sample_rate / frame_size)
+
+
+class LevelMeter:
+    """A class for accumulating per-channel peak and RMS levels."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        self.count = 0
+        self.peak: Optional[np.ndarray] = None
+        self.squares: Optional[np.ndarray] = None
+
+    def update(self, block: np.ndarray) -> np.ndarray:
+        """Account for a (frames, channels) block (and return it)."""
+
+        if len(block):
+            # Reducing each channel separately is much faster than reducing
+            # across (short) rows.
+            peak = np.array([max(x.max(), -x.min()) for x in block.T])
+            squares = np.einsum("ij,ij->j", block, block, dtype=np.float64)
+
+            if self.peak is None or self.squares is None:
+                self.peak = peak
+                self.squares = squares
+            else:
+                self.peak = np.maximum(self.peak, peak)
+                self.squares += squares
+
+            self.count += len(block)
+
+        return block
+
+    def meter(self, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Account for blocks as they're iterated."""
+
+        for block in blocks:
+            yield self.update(block)
+
+    @property
+    def rms(self) -> np.ndarray:
+        """Get per-channel RMS levels."""
+
+        assert self.squares is not None
+        return np.sqrt(self.squares / self.count)
+
+
+def dbfs(level: np.ndarray) -> np.ndarray:
+    """Convert (full-scale relative) levels to decibels."""
+
+    with np.errstate(divide="ignore"):
+        return cast(np.ndarray, 20.0 * np.log10(level))
+
+
+class Analysis(NamedTuple):
+    """The results of analyzing sample data."""
+
+    sample_rate: int
+    frame_size: int
+    frames: int
+
+    # The mean magnitude spectrum of each channel.
+    spectrum: np.ndarray
+
+    # Per-channel measurements.
+    peak_hz: np.ndarray
+    peak: np.ndarray
+    rms: np.ndarray
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """Get the frequency of each spectrum bin."""
+        return cast(
+            np.ndarray, rfftfreq(self.frame_size, 1.0 / self.sample_rate)
+        )
+
+
+def analyze(
+    blocks: Iterable[np.ndarray],
+    sample_rate: int,
+    frame_size: int = DEFAULT_FRAME_SIZE,
+    hop: int = None,
+    window: str = DEFAULT_WINDOW,
+) -> Analysis:
+    """
+    Analyze (frames, channels) blocks of floating-point sample data in a
+    single pass.
+    """
+
+    meter = LevelMeter()
+
+    frames = 0
+    total: Optional[np.ndarray] = None
+    for spectra in stft(meter.meter(blocks), frame_size, hop, window):
+        frames += len(spectra)
+        summed = spectra.sum(axis=0)
+        total = summed if total is None else total + summed
+
+    assert total is not None, "No samples to analyze."
+    spectrum = total / frames
+
+    return Analysis(
+        sample_rate,
+        frame_size,
+        frames,
+        spectrum,
+        peak_frequencies(spectrum, sample_rate, frame_size),
+        cast(np.ndarray, meter.peak),
+        meter.rms,
+    )
+
+
+def analyze_reader(
+    reader: WaveReader,
+    frame_size: int = DEFAULT_FRAME_SIZE,
+    hop: int = None,
+    window: str = DEFAULT_WINDOW,
+) -> Analysis:
+    """Analyze a WAVE file's sample data (streaming it in blocks)."""
+
+    with reader.log_time("Analyzing samples"):
+        return analyze(
+            float_blocks(reader, ANALYSIS_BLOCKS * frame_size),
+            reader.sample_rate,
+            frame_size=frame_size,
+            hop=hop,
+            window=window,
+        )
@@ -0,0 +1,131 @@
+"""
+A module implementing sample-accurate parameter automation.
+"""
+
+# built-in
+from threading import Lock
+from typing import NamedTuple, Optional
+
+# third-party
+import numpy as np
+from runtimepy.primitives import Double
+
+# internal
+from quasimoto.enums import Ramp
+
+
+class AutomationEvent(NamedTuple):
+    """A parameter value to reach at a specific (sample) time."""
+
+    time: float
+    value: float
+    ramp: Ramp = Ramp.STEP
+
+    def interpolate(
+        self, start: "AutomationEvent", times: np.ndarray
+    ) -> np.ndarray:
+        """
+        Get values for sample times between a starting point and this event.
+        """
+
+        if self.ramp is Ramp.STEP or self.time <= start.time:
+            return np.full(len(times), start.value)
+
+        progress = (times - start.time) / (self.time - start.time)
+
+        if self.ramp is Ramp.EXPONENTIAL:
+            assert start.value * self.value > 0.0, (start, self)
+            return np.asarray(
+                start.value * (self.value / start.value) ** progress
+            )
+
+        return np.asarray(start.value + (self.value - start.value) * progress)
+
+
+class Automation:
+    """
+    Timestamped events for a parameter, applied per sample as blocks are
+    rendered. Events may be scheduled from a different thread than the one
+    rendering.
+    """
+
+    def __init__(self, parameter: Double) -> None:
+        """Initialize this instance."""
+
+        self.parameter = parameter
+        self.events: list[AutomationEvent] = []
+
+        # Where the segment leading to the next event starts.
+        self.start: Optional[AutomationEvent] = None
+
+        self.lock = Lock()
+
+    def __bool__(self) -> bool:
+        """Whether or not any events are pending."""
+        return bool(self.events)
+
+    def schedule(
+        self, time: float, value: float, ramp: Ramp = Ramp.STEP
+    ) -> None:
+        """
+        Schedule the parameter to reach a value at a time (ramps start from
+        the previous event, or from the first sample rendered after
+        scheduling).
+        """
+
+        event = AutomationEvent(time, value, ramp)
+
+        with self.lock:
+            index = len(self.events)
+            while index and self.events[index - 1].time > time:
+                index -= 1
+            self.events.insert(index, event)
+
+    def ramp(
+        self, time: float, value: float, ramp: Ramp = Ramp.LINEAR
+    ) -> None:
+        """Schedule a ramp to a value."""
+        self.schedule(time, value, ramp=ramp)
+
+    def cancel(self) -> None:
+        """Cancel all pending events (the parameter holds its value)."""
+
+        with self.lock:
+            self.events.clear()
+            self.start = None
+
+    def values(self, times: np.ndarray) -> np.ndarray:
+        """
+        Get parameter values for (ascending) sample times and consume the
+        events they pass. The parameter is updated to the last value.
+        """
+
+        result = np.full(len(times), self.parameter.value)
+        if times.size == 0 or not self.events:
+            return result
+
+        with self.lock:
+            start = self.start
+            if start is None:
+                start = AutomationEvent(float(times[0]), self.parameter.value)
+
+            consumed = 0
+            for event in self.events:
+                begin = int(np.searchsorted(times, start.time, side="left"))
+                end = int(np.searchsorted(times, event.time, side="left"))
+
+                result[begin:end] = event.interpolate(start, times[begin:end])
+                result[end:] = event.value
+
+                # Events after this block are still pending.
+                if event.time > times[-1]:
+                    break
+
+                start = event
+                consumed += 1
+
+            del self.events[:consumed]
+            self.start = start if self.events else None
+
+        self.parameter.value = float(result[-1])
+        return result
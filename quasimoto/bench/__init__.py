@@ -0,0 +1,269 @@
+"""
+A module implementing benchmarks for this package's hot paths.
+"""
+
+# built-in
+from contextlib import contextmanager
+from pathlib import Path
+import platform
+from typing import Any, Callable, Iterator
+
+# third-party
+import numpy as np
+from vcorelib.math import default_time_ns
+
+# internal
+from quasimoto import VERSION
+from quasimoto.cache import RenderCache
+from quasimoto.mixer import Mixer
+from quasimoto.riff import RiffInterface
+from quasimoto.sampler import Sampler
+from quasimoto.stereo import StereoInterface
+from quasimoto.wave import WaveReader, WaveWriter
+
+Result = dict[str, Any]
+Benchmark = Callable[[Path, float], Result]
+
+DEFAULT_CALLBACK_FRAMES = 1024
+
+
+@contextmanager
+def timer(result: Result) -> Iterator[Result]:
+    """Record elapsed time (and derived rates) for a benchmark."""
+
+    start = default_time_ns()
+    yield result
+    elapsed_s = (default_time_ns() - start) / 1e9
+
+    result["elapsed_s"] = elapsed_s
+    if elapsed_s > 0.0:
+        if "samples" in result:
+            result["samples_per_s"] = result["samples"] / elapsed_s
+        if "bytes" in result:
+            result["mb_per_s"] = (result["bytes"] / 1e6) / elapsed_s
+
+
+def bench_sampler_next(directory: Path, duration_s: float) -> Result:
+    """Benchmark iterating a sampler one sample at a time."""
+
+    del directory
+
+    sampler = Sampler()
+    count = int(duration_s * sampler.sample_rate)
+
+    with timer({"samples": count}) as result:
+        for _ in range(count):
+            next(sampler)
+
+    return result
+
+
+def bench_sampler_render(directory: Path, duration_s: float) -> Result:
+    """Benchmark rendering a block of samples."""
+
+    del directory
+
+    sampler = Sampler()
+    count = int(duration_s * sampler.sample_rate)
+
+    with timer({"samples": count}) as result:
+        sampler.render(count)
+
+    return result
+
+
+def sample_frames(duration_s: float) -> np.ndarray:
+    """Create stereo frames for read and write benchmarks."""
+
+    left = Sampler()
+    right = left.copy(harmonic=-1)
+    count = int(duration_s * left.sample_rate)
+    return np.column_stack((left.render(count), right.render(count)))
+
+
+def bench_wave_write(directory: Path, duration_s: float) -> Result:
+    """Benchmark writing sample data."""
+
+    frames = sample_frames(duration_s)
+
+    with timer({"samples": frames.size, "bytes": frames.nbytes}) as result:
+        with WaveWriter.from_path(directory.joinpath("write.wav")) as writer:
+            writer.write(frames)
+
+    return result
+
+
+def bench_wave_write_tuples(directory: Path, duration_s: float) -> Result:
+    """Benchmark writing sample data from frame tuples."""
+
+    frames = [tuple(x) for x in sample_frames(duration_s).tolist()]
+
+    with timer({"samples": len(frames) * 2, "bytes": len(frames) * 4}) as res:
+        with WaveWriter.from_path(directory.joinpath("tuples.wav")) as writer:
+            writer.write(frames)
+
+    return res
+
+
+def bench_wave_read_samples(directory: Path, duration_s: float) -> Result:
+    """Benchmark iterating sample frames."""
+
+    path = directory.joinpath("read.wav")
+    with WaveWriter.from_path(path) as writer:
+        writer.write(sample_frames(duration_s))
+
+    with timer({}) as result:
+        with WaveReader.from_path(path) as wave:
+            result["samples"] = wave.num_samples * wave.channels
+            result["bytes"] = wave.data_entry.size
+            for _ in wave.samples:
+                pass
+
+    return result
+
+
+def bench_wave_read_blocks(directory: Path, duration_s: float) -> Result:
+    """Benchmark reading blocks of sample data."""
+
+    path = directory.joinpath("blocks.wav")
+    with WaveWriter.from_path(path) as writer:
+        writer.write(sample_frames(duration_s))
+
+    with timer({}) as result:
+        with WaveReader.from_path(path) as wave:
+            result["samples"] = wave.num_samples * wave.channels
+            result["bytes"] = wave.data_entry.size
+            for _ in wave.blocks():
+                pass
+
+    return result
+
+
+def large_file(directory: Path, duration_s: float) -> Path:
+    """
+    Create a large file (a single, long 'data' chunk written in one-second
+    appends) if it doesn't exist.
+    """
+
+    path = directory.joinpath("chunks.wav")
+    if not path.is_file():
+        with WaveWriter.from_path(path) as writer:
+            frames = sample_frames(1.0)
+            for _ in range(max(int(duration_s * 10), 1)):
+                writer.append(frames)
+
+    return path
+
+
+def bench_riff_chunks(directory: Path, duration_s: float) -> Result:
+    """Benchmark reading every chunk of a large file."""
+
+    path = large_file(directory, duration_s)
+
+    with timer({"bytes": path.stat().st_size}) as result:
+        with RiffInterface.from_path(path, is_writer=False) as riff:
+            result["chunks"] = len(list(riff.chunks()))
+
+    return result
+
+
+def bench_riff_index(directory: Path, duration_s: float) -> Result:
+    """Benchmark indexing the chunks of a large file."""
+
+    path = large_file(directory, duration_s)
+
+    with timer({"bytes": path.stat().st_size}) as result:
+        with RiffInterface.from_path(path, is_writer=False) as riff:
+            result["chunks"] = len(riff.index())
+
+    return result
+
+
+def bench_stereo_frames(directory: Path, duration_s: float) -> Result:
+    """Benchmark getting frames from buffered stereo output."""
+
+    del directory
+
+    stereo = StereoInterface()
+    frames = DEFAULT_CALLBACK_FRAMES
+    callbacks = max(int(duration_s * stereo.left.sample_rate) // frames, 1)
+
+    latencies = []
+    with timer({"samples": callbacks * frames * 2}) as result:
+        for _ in range(callbacks):
+            stereo.buffer_to_duration(frames * 4 / stereo.left.sample_rate)
+
+            start = default_time_ns()
+            stereo.frames(frames)
+            latencies.append(default_time_ns() - start)
+
+    result["callback_frames"] = frames
+    result["callback_mean_us"] = float(np.mean(latencies)) / 1e3
+    result["callback_max_us"] = float(np.max(latencies)) / 1e3
+    return result
+
+
+def mix_notes(duration_s: float, cache: RenderCache = None) -> Result:
+    """Mix a repeated octave stack (a short note every tenth of a second)."""
+
+    note_s = 0.25
+    base = Sampler(duration_s=note_s, cache=cache)
+    notes = [base.copy(harmonic=x, duration_s=note_s) for x in range(-1, 2)]
+
+    with timer({}) as result:
+        mixer = Mixer()
+        for index in range(max(int(duration_s * 10), 1)):
+            for note in notes:
+                mixer.add(note.copy(), start_s=index / 10)
+
+        for _ in mixer.blocks():
+            pass
+
+    result["samples"] = mixer.extent * mixer.num_channels
+    return result
+
+
+def bench_mixer_notes(directory: Path, duration_s: float) -> Result:
+    """Benchmark mixing repeated notes."""
+
+    del directory
+    return mix_notes(duration_s)
+
+
+def bench_mixer_notes_cached(directory: Path, duration_s: float) -> Result:
+    """Benchmark mixing repeated notes (with a render cache)."""
+
+    del directory
+    return mix_notes(duration_s, cache=RenderCache())
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "sampler_next": bench_sampler_next,
+    "sampler_render": bench_sampler_render,
+    "wave_write": bench_wave_write,
+    "wave_write_tuples": bench_wave_write_tuples,
+    "wave_read_samples": bench_wave_read_samples,
+    "wave_read_blocks": bench_wave_read_blocks,
+    "riff_chunks": bench_riff_chunks,
+    "riff_index": bench_riff_index,
+    "stereo_frames": bench_stereo_frames,
+    "mixer_notes": bench_mixer_notes,
+    "mixer_notes_cached": bench_mixer_notes_cached,
+}
+
+
+def run_benchmarks(
+    directory: Path, duration_s: float = 1.0, names: list[str] = None
+) -> Result:
+    """Run benchmarks (writing any files to a directory)."""
+
+    return {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "duration_s": duration_s,
+        "results": {
+            name: BENCHMARKS[name](directory, duration_s)
+            for name in (names or list(BENCHMARKS))
+        },
+    }
@@ -0,0 +1,95 @@
+"""
+A module implementing sample-buffer interfaces.
+"""
+
+# third-party
+import numpy as np
+from numpy.typing import DTypeLike
+
+# internal
+from quasimoto.wave.writer import DEFAULT_CHANNELS
+
+
+class RingBuffer:
+    """
+    A preallocated ring buffer of sample frames for one producer and one
+    consumer (only the producer advances 'head' and only the consumer
+    advances 'tail', each after copying frames).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        num_channels: int = DEFAULT_CHANNELS,
+        dtype: DTypeLike = np.int16,
+    ) -> None:
+        """Initialize this instance."""
+
+        assert capacity > 0
+        self.capacity = capacity
+        self.buffer = np.zeros((capacity, num_channels), dtype=dtype)
+
+        # Total frames written and read (never wrapped).
+        self.head = 0
+        self.tail = 0
+
+    def __len__(self) -> int:
+        """Get the number of frames available to read."""
+        return self.head - self.tail
+
+    @property
+    def free(self) -> int:
+        """Get the number of frames that can be written."""
+        return self.capacity - len(self)
+
+    @property
+    def frame_bytes(self) -> int:
+        """Get the size of each frame in bytes."""
+        return int(self.buffer.itemsize * self.buffer.shape[1])
+
+    def _spans(self, position: int, count: int) -> tuple[slice, slice]:
+        """Get the (up to two) buffer spans for frames from a position."""
+
+        start = position % self.capacity
+        first = min(count, self.capacity - start)
+        return slice(start, start + first), slice(0, count - first)
+
+    def write(self, block: np.ndarray) -> int:
+        """Write as many frames from a block as will fit."""
+
+        count = min(len(block), self.free)
+
+        first, second = self._spans(self.head, count)
+        split = first.stop - first.start
+        self.buffer[first] = block[:split]
+        self.buffer[second] = block[split:count]
+
+        self.head += count
+        return count
+
+    def read(self, count: int) -> np.ndarray:
+        """Read (a copy of) up to 'count' frames."""
+
+        count = min(count, len(self))
+
+        first, second = self._spans(self.tail, count)
+        if second.stop:
+            result = np.concatenate((self.buffer[first], self.buffer[second]))
+        else:
+            result = self.buffer[first].copy()
+
+        self.tail += count
+        return result
+
+    def read_bytes(self, count: int) -> bytes:
+        """Read up to 'count' frames directly as bytes."""
+
+        count = min(count, len(self))
+
+        first, second = self._spans(self.tail, count)
+        result = self.buffer[first].tobytes()
+        if second.stop:
+            result += self.buffer[second].tobytes()
+
+        self.tail += count
+        return result
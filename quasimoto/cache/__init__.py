@@ -0,0 +1,84 @@
+"""
+A module implementing a memory-bounded cache of rendered samples.
+"""
+
+# built-in
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+# third-party
+import numpy as np
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class RenderCache:
+    """
+    A least-recently-used cache of rendered sample arrays (bounded by the
+    total size of the arrays held).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        """Initialize this instance."""
+
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached arrays."""
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Determine if an array is cached."""
+        return key in self.entries
+
+    def evict(self, max_bytes: int) -> None:
+        """
+        Evict least-recently-used arrays until at most 'max_bytes' remain.
+        """
+
+        while self.size > max_bytes:
+            _, array = self.entries.popitem(last=False)
+            self.size -= array.nbytes
+
+    def clear(self) -> None:
+        """Evict all arrays."""
+        self.evict(0)
+
+    def put(self, key: Hashable, array: np.ndarray) -> np.ndarray:
+        """
+        Cache an (immutable) array, if it fits, and return it. Cached arrays
+        are shared so they're made read-only.
+        """
+
+        array.setflags(write=False)
+
+        if key in self.entries:
+            self.size -= self.entries.pop(key).nbytes
+
+        if array.nbytes <= self.max_bytes:
+            self.evict(self.max_bytes - array.nbytes)
+            self.entries[key] = array
+            self.size += array.nbytes
+
+        return array
+
+    def get(
+        self, key: Hashable, render: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """Get a cached array, rendering (and caching) it if necessary."""
+
+        result = self.entries.get(key)
+
+        if result is None:
+            self.misses += 1
+            result = self.put(key, render())
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return result
@@ -16,17 +16,29 @@ from typing import Tuple as _Tuple
 from vcorelib.args import CommandRegister as _CommandRegister
 
 # internal
+from quasimoto.commands.bench import add_bench_cmd
 from quasimoto.commands.gen import add_gen_cmd
+from quasimoto.commands.scan import add_scan_cmd
 
 
 def commands() -> _List[_Tuple[str, str, _CommandRegister]]:
     """Get this package's commands."""
 
     return [
+        (
+            "bench",
+            "benchmark audio processing",
+            add_bench_cmd,
+        ),
         (
             "gen",
             "generate audio",
             add_gen_cmd,
         ),
+        (
+            "scan",
+            "inspect audio files",
+            add_scan_cmd,
+        ),
         ("noop", "command stub (does nothing)", lambda _: lambda _: 0),
     ]
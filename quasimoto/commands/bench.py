@@ -0,0 +1,60 @@
+"""
+An entry-point for the 'bench' command.
+"""
+
+# built-in
+import argparse
+import json
+from logging import getLogger
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+# third-party
+from vcorelib.args import CommandFunction
+
+# internal
+from quasimoto import PKG_NAME
+from quasimoto.bench import BENCHMARKS, run_benchmarks
+from quasimoto.commands.common import add_duration_arg, add_output_arg
+
+
+def bench_cmd(args: argparse.Namespace) -> int:
+    """Execute the bench command."""
+
+    logger = getLogger(__name__)
+
+    with TemporaryDirectory() as tmpdir:
+        data = run_benchmarks(
+            Path(tmpdir), duration_s=args.duration, names=args.benchmark
+        )
+
+    for name, result in data["results"].items():
+        logger.info("%-20s %s", name, result)
+
+    with args.output.open("w", encoding="utf-8") as path_fd:
+        json.dump(data, path_fd, indent=2)
+        path_fd.write("\n")
+
+    logger.info("Wrote '%s'.", args.output)
+
+    return 0
+
+
+def add_bench_cmd(parser: argparse.ArgumentParser) -> CommandFunction:
+    """Add bench-command arguments to its parser."""
+
+    add_output_arg(
+        parser, f"{PKG_NAME}-bench.json", "file to write results (JSON) to"
+    )
+    add_duration_arg(
+        parser, 1.0, "seconds of audio processed by each benchmark"
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmark",
+        action="append",
+        choices=list(BENCHMARKS),
+        help="benchmark to run (default: all)",
+    )
+
+    return bench_cmd
@@ -0,0 +1,44 @@
+"""
+A module implementing command-line argument interfaces shared by commands.
+"""
+
+# built-in
+import argparse
+import os
+from pathlib import Path
+
+
+def add_output_arg(
+    parser: argparse.ArgumentParser, default: str, help_str: str
+) -> None:
+    """Add an output-file argument."""
+
+    parser.add_argument(
+        "-o", "--output", type=Path, default=default, help=help_str
+    )
+
+
+def add_duration_arg(
+    parser: argparse.ArgumentParser, default: float, help_str: str
+) -> None:
+    """Add a duration (in seconds) argument."""
+
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=float,
+        default=default,
+        help=f"{help_str} (default: %(default)s)",
+    )
+
+
+def add_jobs_arg(parser: argparse.ArgumentParser, help_str: str) -> None:
+    """Add a number-of-processes argument."""
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=f"{help_str} (default: %(default)s)",
+    )
@@ -4,6 +4,8 @@ An entry-point for the 'gen' command.
 
 # built-in
 import argparse
+from contextlib import ExitStack
+from logging import getLogger
 from pathlib import Path
 
 # third-party
@@ -11,15 +13,94 @@ from vcorelib.args import CommandFunction
 
 # internal
 from quasimoto import PKG_NAME
-from quasimoto.enums import DEFAULT_FORMAT
-from quasimoto.riff import RiffInterface
+from quasimoto.commands.common import (
+    add_duration_arg,
+    add_jobs_arg,
+    add_output_arg,
+)
+from quasimoto.enums import DEFAULT_FORMAT, MixNormalization, Waveform
+from quasimoto.metrics import METRICS
+from quasimoto.render import (
+    DEFAULT_SEGMENT_S,
+    RenderSpec,
+    render,
+    render_midi,
+)
+from quasimoto.sampler import DEFAULT_FREQUENCY
+from quasimoto.wave import WaveWriter
+from quasimoto.wave.codec import CODECS
+from quasimoto.wave.protocol import WaveType
+from quasimoto.wave.writer import (
+    DEFAULT_BITS,
+    DEFAULT_CHANNELS,
+    DEFAULT_SAMPLE_RATE,
+)
+
+DEFAULT_FLOAT_BITS = 32
+
+
+def sample_bits(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> int:
+    """
+    Get the number of bits per output sample (exiting with a usage error if
+    the sample format isn't supported).
+    """
+
+    bits: int = args.bits
+    if bits is None:
+        bits = DEFAULT_FLOAT_BITS if args.float else DEFAULT_BITS
+
+    kind = WaveType.IEEE_FLOAT if args.float else WaveType.PCM
+    if (kind, bits) not in CODECS:
+        parser.error(
+            f"{bits}-bit samples aren't supported "
+            f"({'with' if args.float else 'without'} --float)"
+        )
+
+    return bits
 
 
 def gen_cmd(args: argparse.Namespace) -> int:
-    """Execute the arbiter command."""
+    """Execute the gen command."""
+
+    spec = RenderSpec(
+        duration_s=args.duration,
+        frequency=args.frequency,
+        amplitude=args.amplitude,
+        harmonics=tuple(args.harmonic or [0]),
+        normalization=MixNormalization(args.normalization),
+        waveform=Waveform(args.waveform),
+        num_channels=args.channels,
+        sample_rate=args.sample_rate,
+        num_bits=args.bits,
+        is_float=args.float,
+    )
+
+    with ExitStack() as stack:
+        if args.metrics is not None:
+            stack.enter_context(METRICS.collecting(args.metrics))
 
-    with RiffInterface.from_path(args.output) as writer:
-        print(writer)
+        writer = stack.enter_context(
+            WaveWriter.from_path(
+                args.output,
+                num_channels=spec.num_channels,
+                sample_rate=spec.sample_rate,
+                bits_per_sample=spec.num_bits,
+                is_float=spec.is_float,
+            )
+        )
+
+        if args.midi is not None:
+            render_midi(spec, args.midi, writer, logger=getLogger(__name__))
+        else:
+            render(
+                spec,
+                writer,
+                jobs=args.jobs,
+                segment_s=args.segment,
+                logger=getLogger(__name__),
+            )
 
     return 0
 
@@ -27,12 +108,108 @@ def gen_cmd(args: argparse.Namespace) -> int:
 def add_gen_cmd(parser: argparse.ArgumentParser) -> CommandFunction:
     """Add gen-command arguments to its parser."""
 
+    add_output_arg(
+        parser, f"{PKG_NAME}.{DEFAULT_FORMAT}", "output file to write"
+    )
+    add_duration_arg(parser, 1.0, "duration (in seconds) to render")
+    parser.add_argument(
+        "-f",
+        "--frequency",
+        type=float,
+        default=DEFAULT_FREQUENCY,
+        help="base frequency (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-a",
+        "--amplitude",
+        type=float,
+        default=1.0,
+        help="amplitude of each voice (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--waveform",
+        choices=[str(x) for x in Waveform],
+        default=str(Waveform.SINE),
+        help="shape of each voice's wave (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--harmonic",
+        type=int,
+        action="append",
+        help=(
+            "add a voice at a harmonic (octave) of the base frequency "
+            "(default: 0)"
+        ),
+    )
+    parser.add_argument(
+        "-m",
+        "--midi",
+        type=Path,
+        help=(
+            "render a MIDI file (with the base frequency used for middle C) "
+            "instead of voices for the duration"
+        ),
+    )
+    parser.add_argument(
+        "-n",
+        "--normalization",
+        choices=[str(x) for x in MixNormalization],
+        default=str(MixNormalization.VOICES),
+        help="how to scale the sum of voices (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-c",
+        "--channels",
+        type=int,
+        default=DEFAULT_CHANNELS,
+        help="number of output channels (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--sample-rate",
+        type=int,
+        default=DEFAULT_SAMPLE_RATE,
+        help="output sample rate (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-b",
+        "--bits",
+        type=int,
+        choices=[8, 16, 24, 32, 64],
+        help=(
+            f"bits per output sample (default: {DEFAULT_BITS}, or "
+            f"{DEFAULT_FLOAT_BITS} with --float)"
+        ),
+    )
+    parser.add_argument(
+        "--float",
+        action="store_true",
+        help="write IEEE floating-point samples (32 or 64-bit)",
+    )
+    add_jobs_arg(parser, "number of processes to render with")
     parser.add_argument(
-        "-o",
-        "--output",
+        "-M",
+        "--metrics",
         type=Path,
-        default=f"{PKG_NAME}.{DEFAULT_FORMAT}",
-        help="output file to write",
+        help=(
+            "write per-stage metrics (as JSON) to this file (rendering in "
+            "other processes isn't measured)"
+        ),
     )
+    parser.add_argument(
+        "-s",
+        "--segment",
+        type=float,
+        default=DEFAULT_SEGMENT_S,
+        help="duration (in seconds) of each rendered segment "
+        "(default: %(default)s)",
+    )
+
+    def command(args: argparse.Namespace) -> int:
+        """Validate arguments and execute the gen command."""
+
+        args.bits = sample_bits(parser, args)
+        return gen_cmd(args)
 
-    return gen_cmd
+    return command
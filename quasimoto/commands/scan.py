@@ -0,0 +1,85 @@
+"""
+An entry-point for the 'scan' command.
+"""
+
+# built-in
+import argparse
+import json
+from logging import getLogger
+from pathlib import Path
+
+# third-party
+from vcorelib.args import CommandFunction
+from vcorelib.math import byte_count_str, default_time_ns
+
+# internal
+from quasimoto import PKG_NAME
+from quasimoto.commands.common import add_jobs_arg, add_output_arg
+from quasimoto.scan import scan
+
+# How often (in files) progress is logged.
+PROGRESS_INTERVAL = 100
+
+
+def scan_cmd(args: argparse.Namespace) -> int:
+    """Execute the scan command."""
+
+    logger = getLogger(__name__)
+
+    files = 0
+    errors = 0
+    size = 0
+    duration_s = 0.0
+
+    start = default_time_ns()
+
+    with args.output.open("w", encoding="utf-8") as path_fd:
+        for result in scan(args.paths, jobs=args.jobs):
+            path_fd.write(json.dumps(result) + "\n")
+
+            files += 1
+            size += result.get("bytes", 0)
+            if "error" in result:
+                errors += 1
+                logger.warning("%s: %s", result["path"], result["error"])
+            else:
+                duration_s += result["duration_s"]
+
+            if files % PROGRESS_INTERVAL == 0:
+                logger.info("Scanned %d file(s).", files)
+
+    elapsed_s = (default_time_ns() - start) / 1e9
+
+    logger.info(
+        "Scanned %d file(s) (%d error(s), %s, %.1fs of audio) in %.2fs "
+        "(%.1f files/s, %.2f MB/s).",
+        files,
+        errors,
+        byte_count_str(size),
+        duration_s,
+        elapsed_s,
+        files / elapsed_s if elapsed_s > 0.0 else 0.0,
+        (size / 1e6) / elapsed_s if elapsed_s > 0.0 else 0.0,
+    )
+    logger.info("Wrote '%s'.", args.output)
+
+    return 1 if errors else 0
+
+
+def add_scan_cmd(parser: argparse.ArgumentParser) -> CommandFunction:
+    """Add scan-command arguments to its parser."""
+
+    add_output_arg(
+        parser,
+        f"{PKG_NAME}-scan.jsonl",
+        "file to write results (JSON lines) to",
+    )
+    add_jobs_arg(parser, "number of processes to scan with")
+    parser.add_argument(
+        "paths",
+        type=Path,
+        nargs="+",
+        help="files (or directories to search) to scan",
+    )
+
+    return scan_cmd
@@ -16,36 +16,108 @@ class AudioFileTypes(StrEnum):
 DEFAULT_FORMAT = AudioFileTypes.WAVE
 
 
+class MixNormalization(StrEnum):
+    """An enumeration for ways to scale the sum of mixed voices."""
+
+    # Don't scale the sum.
+    NONE = "none"
+
+    # Divide by the number of voices sounding at each frame.
+    ACTIVE = "active"
+
+    # Divide by the total number of voices (note schedulers divide by the
+    # most that sound at once).
+    VOICES = "voices"
+
+
+class ClipPolicy(StrEnum):
+    """An enumeration for handling mixed values outside of sample bounds."""
+
+    # Saturate at sample bounds.
+    HARD = "hard"
+
+    # Smoothly compress towards sample bounds.
+    SOFT = "soft"
+
+    # Values are required to already be in bounds.
+    NONE = "none"
+
+
+class Waveform(StrEnum):
+    """An enumeration for the shapes of generated waves."""
+
+    SINE = "sine"
+    SQUARE = "square"
+    SAW = "saw"
+    TRIANGLE = "triangle"
+    PULSE = "pulse"
+    NOISE = "noise"
+
+
+class Ramp(StrEnum):
+    """An enumeration for ways to approach an automated parameter value."""
+
+    # Jump to the value at the event's time.
+    STEP = "step"
+
+    # Interpolate linearly from the previous value.
+    LINEAR = "linear"
+
+    # Interpolate geometrically from the previous value (values must be
+    # non-zero and share a sign).
+    EXPONENTIAL = "exponential"
+
+
 class ChunkType(StrEnum):
     """An enumeration for different kinds of RIFF chunks."""
 
     RIFF = "RIFF"
+    RF64 = "RF64"
     LIST = "LIST"
     WAVE = "WAVE"
+    INFO = "INFO"
 
     FMT = "fmt "
     DATA = "data"
     ID3 = "ID3 "
+    DS64 = "ds64"
+    JUNK = "JUNK"
+    FACT = "fact"
+    CUE = "cue "
+    BEXT = "bext"
+
+    # Chunks that aren't recognized (kept opaque).
+    UNKNOWN = "????"
 
     @property
     def is_container(self) -> bool:
         """Whether or not this is a container chunk type."""
 
-        return self is ChunkType.RIFF or self is ChunkType.LIST
+        return (
+            self is ChunkType.RIFF
+            or self is ChunkType.RF64
+            or self is ChunkType.LIST
+        )
 
     @staticmethod
-    def from_stream(stream: BinaryIO) -> Optional["ChunkType"]:
-        """Read the chunk type from a stream."""
+    def from_bytes(data: bytes) -> Optional["ChunkType"]:
+        """
+        Get the chunk type for a raw four-byte identifier (identifiers that
+        aren't recognized are 'UNKNOWN').
+        """
 
-        result = None
+        # Some files hackily have some 'ID3' metadata at the end?
+        if data[:3] == b"ID3":
+            return None
 
-        check = stream.read(3).decode("ascii")
-        if len(check) == 3:
-            # Some files hackily have some 'ID3' metadata at the end?
-            if check != "ID3":
-                result = ChunkType(check + stream.read(1).decode("ascii"))
+        return CHUNK_TYPES.get(data, ChunkType.UNKNOWN)
 
-        return result
+    @staticmethod
+    def from_stream(stream: BinaryIO) -> Optional["ChunkType"]:
+        """Read the chunk type from a stream."""
+
+        data = stream.read(4)
+        return ChunkType.from_bytes(data) if len(data) == 4 else None
 
     def to_stream(self, stream: BinaryIO) -> None:
         """Write the chunk header."""
@@ -53,3 +125,7 @@ class ChunkType(StrEnum):
         data = bytes(str(self).encode("ascii"))
         assert len(data) == 4
         stream.write(data)
+
+
+# Chunk types by their raw identifiers.
+CHUNK_TYPES = {str(x).encode("ascii"): x for x in ChunkType}
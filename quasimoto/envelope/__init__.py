@@ -0,0 +1,59 @@
+"""
+A module implementing amplitude envelopes.
+"""
+
+# built-in
+from typing import NamedTuple, Optional, Union
+
+# third-party
+import numpy as np
+
+# A short release (for notes that are cut off) that doesn't click.
+DECLICK_S = 0.005
+
+
+class Envelope(NamedTuple):
+    """
+    A linear attack, decay, sustain and release envelope (times are in
+    seconds, the sustain level is relative to the peak).
+    """
+
+    attack_s: float = DECLICK_S
+    decay_s: float = 0.0
+    sustain: float = 1.0
+    release_s: float = DECLICK_S
+
+    def levels(
+        self, times: np.ndarray, release_at: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Get envelope levels at times (since note-on), releasing from
+        whatever level is reached at 'release_at' (the note-off time).
+        """
+
+        attack = (
+            times / self.attack_s
+            if self.attack_s > 0.0
+            else np.ones_like(times)
+        )
+
+        decay: Union[np.ndarray, float] = self.sustain
+        if self.decay_s > 0.0:
+            decay = 1.0 - (1.0 - self.sustain) * np.minimum(
+                (times - self.attack_s) / self.decay_s, 1.0
+            )
+
+        result = np.where(times < self.attack_s, attack, decay)
+
+        if release_at is not None:
+            level = float(self.levels(np.array([release_at]))[0])
+
+            release: Union[np.ndarray, float] = 0.0
+            if self.release_s > 0.0:
+                release = level * np.clip(
+                    1.0 - (times - release_at) / self.release_s, 0.0, 1.0
+                )
+
+            result = np.where(times < release_at, result, release)
+
+        return result
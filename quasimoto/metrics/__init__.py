@@ -0,0 +1,201 @@
+"""
+A module implementing opt-in instrumentation (counters and histograms) for
+stages of processing.
+"""
+
+# built-in
+from contextlib import contextmanager
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.primitives import Double, Uint64
+from vcorelib.math import default_time_ns
+
+# Durations are bucketed by powers of two (in nanoseconds).
+HISTOGRAM_BUCKETS = 64
+
+# Instrumented stages (and what they count).
+STAGE_UNITS = {
+    "mixer.render": "frames",
+    "riff.read": "bytes",
+    "stereo.callback": "frames",
+    "stereo.render": "frames",
+    "wave.read": "frames",
+    "wave.write": "bytes",
+}
+
+
+class Stage:
+    """
+    Counters for a stage of processing: the number of times it ran, the
+    number of items (samples, bytes, etc.) it processed and how long that
+    took (with a histogram of durations).
+    """
+
+    def __init__(self, name: str, unit: str = "items") -> None:
+        """Initialize this instance."""
+
+        self.name = name
+        self.unit = unit
+
+        self.count = Uint64()
+        self.items = Uint64()
+        self.elapsed_s = Double()
+        self.last_s = Double()
+
+        # Counts of durations less than 2^N nanoseconds (and at least
+        # 2^(N - 1)).
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, elapsed_ns: int, items: int = 0) -> None:
+        """Record a run of this stage."""
+
+        self.count.increment()
+        if items:
+            self.items.increment(items)
+
+        elapsed_s = elapsed_ns / 1e9
+        self.elapsed_s.value += elapsed_s
+        self.last_s.value = elapsed_s
+
+        self.buckets[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    @property
+    def rate(self) -> float:
+        """Get the number of items processed per second (of this stage)."""
+
+        elapsed_s = self.elapsed_s.value
+        return self.items.raw.value / elapsed_s if elapsed_s > 0.0 else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Get an upper bound (in seconds) for the duration that a fraction of
+        runs completed within.
+        """
+
+        target = fraction * self.count.raw.value
+        total = 0
+        for idx, count in enumerate(self.buckets):
+            total += count
+            if count and total >= target:
+                return float(2**idx) / 1e9
+
+        return 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get this stage's metrics as a dictionary."""
+
+        return {
+            "count": self.count.raw.value,
+            "unit": self.unit,
+            "items": self.items.raw.value,
+            "elapsed_s": self.elapsed_s.value,
+            "rate": self.rate,
+            "p50_s": self.percentile(0.5),
+            "p99_s": self.percentile(0.99),
+            "histogram_ns": {
+                2**idx: count
+                for idx, count in enumerate(self.buckets)
+                if count
+            },
+        }
+
+    def register(self, env: ChannelEnvironment, prefix: str) -> None:
+        """Add channels for this stage's counters to an environment."""
+
+        name = f"{prefix}.{self.name}"
+        env.channel(f"{name}.count", self.count)
+        env.channel(f"{name}.{self.unit}", self.items)
+        env.channel(f"{name}.elapsed_s", self.elapsed_s)
+        env.channel(f"{name}.last_s", self.last_s)
+
+
+class Metrics:
+    """
+    A collection of stage metrics. Nothing is measured unless enabled, so
+    instrumented code only pays for a flag check:
+
+        start = METRICS.start()
+        ...
+        METRICS.record("stage", start, items)
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize this instance."""
+
+        self.enabled = enabled
+        self.stages: dict[str, Stage] = {}
+
+    def stage(self, name: str) -> Stage:
+        """Get (or create) a stage."""
+
+        result = self.stages.get(name)
+        if result is None:
+            result = Stage(name, unit=STAGE_UNITS.get(name, "items"))
+            self.stages[name] = result
+        return result
+
+    def start(self) -> int:
+        """Get a start time for a measurement (zero if disabled)."""
+        return default_time_ns() if self.enabled else 0
+
+    def record(self, name: str, start: int, items: int = 0) -> None:
+        """Record a measurement started with 'start'."""
+
+        if start:
+            self.stage(name).record(default_time_ns() - start, items)
+
+    def observe(self, name: str, elapsed_ns: int, items: int = 0) -> None:
+        """Record an already measured duration (if enabled)."""
+
+        if self.enabled:
+            self.stage(name).record(elapsed_ns, items)
+
+    def clear(self) -> None:
+        """Remove all stages."""
+        self.stages.clear()
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Get metrics for every stage as a dictionary."""
+        return {name: x.as_dict() for name, x in sorted(self.stages.items())}
+
+    def to_json(self, path: Path) -> None:
+        """Write metrics to a JSON file."""
+
+        with path.open("w", encoding="utf-8") as path_fd:
+            json.dump(self.as_dict(), path_fd, indent=2)
+            path_fd.write("\n")
+
+    def register(
+        self, env: ChannelEnvironment, *names: str, prefix: str = "metrics"
+    ) -> None:
+        """
+        Add channels for stages (every instrumented stage by default) to an
+        environment. Stages are created if they haven't been recorded yet.
+        """
+
+        for name in names or tuple(STAGE_UNITS):
+            self.stage(name).register(env, prefix)
+
+    @contextmanager
+    def collecting(self, path: Path = None) -> Iterator["Metrics"]:
+        """
+        Enable metrics (from a clean slate) for the duration of the context,
+        writing them to a JSON file (if a path is provided) at the end.
+        """
+
+        self.clear()
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = False
+            if path is not None:
+                self.to_json(path)
+
+
+# Metrics for the whole process.
+METRICS = Metrics()
@@ -0,0 +1,250 @@
+"""
+A module implementing Standard MIDI File (SMF) parsing and scheduling.
+"""
+
+# built-in
+from heapq import merge
+from pathlib import Path
+import struct
+from typing import BinaryIO, Iterator, NamedTuple
+
+# internal
+from quasimoto.envelope import Envelope
+from quasimoto.sampler import Sampler
+from quasimoto.scheduler import NoteScheduler
+
+HEADER = struct.Struct(">4sIHHH")
+CHUNK_HEADER = struct.Struct(">4sI")
+
+# Status bytes (channel messages are masked to their upper nibble).
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+CONTROL_CHANGE = 0xB0
+PROGRAM_CHANGE = 0xC0
+CHANNEL_PRESSURE = 0xD0
+SYSEX = 0xF0
+SYSEX_ESCAPE = 0xF7
+META = 0xFF
+
+# Meta-event and controller types.
+META_END_OF_TRACK = 0x2F
+META_TEMPO = 0x51
+CONTROLLER_PAN = 10
+
+# Microseconds per quarter note (120 beats per minute).
+DEFAULT_TEMPO = 500000
+
+# The key (note number) played at a sampler's base frequency (middle C, see
+# DEFAULT_FREQUENCY).
+BASE_KEY = 60
+
+
+class MidiEvent(NamedTuple):
+    """
+    An event from a MIDI track. Meta events have a status of 0xFF and their
+    data starts with the meta-event type.
+    """
+
+    tick: int
+    track: int
+    status: int
+    data: bytes
+
+    @property
+    def kind(self) -> int:
+        """Get this event's message type (with any channel masked)."""
+        return self.status if self.status >= SYSEX else self.status & 0xF0
+
+    @property
+    def channel(self) -> int:
+        """Get this event's channel."""
+        return self.status & 0x0F
+
+
+class MidiHeader(NamedTuple):
+    """A MIDI file's header chunk."""
+
+    format: int
+    num_tracks: int
+    division: int
+
+    def seconds_per_tick(self, tempo: int = DEFAULT_TEMPO) -> float:
+        """
+        Get the duration of a tick at a tempo (in microseconds per quarter
+        note). Time-code based divisions don't depend on tempo.
+        """
+
+        if self.division & 0x8000:
+            frames = 256 - (self.division >> 8)
+            return 1.0 / (frames * (self.division & 0xFF))
+
+        return tempo / (1e6 * self.division)
+
+
+def read_header(stream: BinaryIO) -> MidiHeader:
+    """Read a MIDI file's header chunk."""
+
+    ident, size, *fields = HEADER.unpack(stream.read(HEADER.size))
+    assert ident == b"MThd" and size >= 6, (ident, size)
+    stream.seek(size - 6, 1)
+
+    return MidiHeader(*fields)
+
+
+def _read_varlen(data: memoryview, pos: int) -> tuple[int, int]:
+    """Read a variable-length quantity (and return the next position)."""
+
+    result = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result = (result << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return result, pos
+
+
+def track_events(data: memoryview, track: int = 0) -> Iterator[MidiEvent]:
+    """Parse the events of a track chunk's data, one at a time."""
+
+    tick = 0
+    pos = 0
+    running = 0
+
+    while pos < len(data):
+        delta, pos = _read_varlen(data, pos)
+        tick += delta
+
+        status = data[pos]
+        if status & 0x80:
+            pos += 1
+        else:
+            # Running status (data bytes follow without a status byte).
+            assert running, "Running status with no previous status."
+            status = running
+
+        if status == META:
+            kind = data[pos]
+            length, begin = _read_varlen(data, pos + 1)
+            pos = begin + length
+            yield MidiEvent(
+                tick, track, status, bytes([kind]) + data[begin:pos]
+            )
+            if kind == META_END_OF_TRACK:
+                return
+
+        elif status in {SYSEX, SYSEX_ESCAPE}:
+            length, pos = _read_varlen(data, pos)
+            pos += length
+            running = 0
+
+        else:
+            count = 2
+            if status & 0xF0 in {PROGRAM_CHANGE, CHANNEL_PRESSURE}:
+                count = 1
+
+            yield MidiEvent(
+                tick, track, status, bytes(data[pos : pos + count])
+            )
+            pos += count
+            running = status
+
+
+def read_events(stream: BinaryIO) -> Iterator[tuple[float, MidiEvent]]:
+    """
+    Read a MIDI file's events (and their times, in seconds), merging tracks
+    in time order and following tempo changes.
+    """
+
+    header = read_header(stream)
+
+    # Track data is kept as bytes, events are parsed as they're merged.
+    tracks: list[Iterator[MidiEvent]] = []
+    while len(tracks) < header.num_tracks:
+        raw = stream.read(CHUNK_HEADER.size)
+        if len(raw) < CHUNK_HEADER.size:
+            break
+
+        ident, size = CHUNK_HEADER.unpack(raw)
+        if ident == b"MTrk":
+            tracks.append(
+                track_events(memoryview(stream.read(size)), len(tracks))
+            )
+        else:
+            stream.seek(size, 1)
+
+    seconds_per_tick = header.seconds_per_tick()
+    tick = 0
+    time_s = 0.0
+
+    # Events sort by tick (then track) as tuples.
+    for event in merge(*tracks):
+        time_s += (event.tick - tick) * seconds_per_tick
+        tick = event.tick
+
+        if event.status == META and event.data[0] == META_TEMPO:
+            seconds_per_tick = header.seconds_per_tick(
+                int.from_bytes(event.data[1:4], "big")
+            )
+
+        yield time_s, event
+
+
+def schedule_midi(scheduler: NoteScheduler, stream: BinaryIO) -> float:
+    """
+    Add a MIDI file's notes to a scheduler (and return the time of the last
+    event). Keys map to harmonics of the scheduler's sampler frequency
+    (which is used for middle C), velocity maps to gain.
+    """
+
+    pans: dict[tuple[int, int], float] = {}
+    time_s = 0.0
+
+    for time_s, event in read_events(stream):
+        kind = event.kind
+        channel = (event.track, event.channel)
+
+        if kind in {NOTE_ON, NOTE_OFF}:
+            key = (channel, event.data[0])
+
+            # Notes that are re-triggered are ended first.
+            if key in scheduler.held:
+                scheduler.note_off(time_s, key)
+
+            if kind == NOTE_ON and event.data[1] > 0:
+                scheduler.note_on(
+                    time_s,
+                    key,
+                    scheduler.sampler.harmonic(
+                        (event.data[0] - BASE_KEY) / 12
+                    ),
+                    velocity=event.data[1] / 127,
+                    pan=pans.get(channel, 0.0),
+                )
+
+        elif kind == CONTROL_CHANGE and event.data[0] == CONTROLLER_PAN:
+            pans[channel] = max((event.data[1] - 64) / 63, -1.0)
+
+    # Release any notes still held at the end.
+    for held in list(scheduler.held):
+        scheduler.note_off(time_s, held)
+
+    return time_s
+
+
+def midi_scheduler(
+    path: Path,
+    sampler: Sampler,
+    envelope: Envelope = Envelope(),
+    **kwargs,
+) -> NoteScheduler:
+    """
+    Create a note scheduler for a MIDI file (see NoteScheduler for other
+    initialization arguments).
+    """
+
+    result = NoteScheduler(sampler, envelope=envelope, **kwargs)
+
+    with path.open("rb") as path_fd:
+        schedule_midi(result, path_fd)
+
+    return result
@@ -0,0 +1,309 @@
+"""
+A module implementing interfaces for mixing multiple samplers.
+"""
+
+# built-in
+from typing import Iterator, Optional
+
+# third-party
+import numpy as np
+
+# internal
+from quasimoto.enums import ClipPolicy, MixNormalization
+from quasimoto.envelope import Envelope
+from quasimoto.metrics import METRICS
+from quasimoto.sampler import Sampler, int_dtype
+from quasimoto.wave.mixins import DEFAULT_BLOCK_FRAMES
+from quasimoto.wave.writer import (
+    DEFAULT_BITS,
+    DEFAULT_CHANNELS,
+    DEFAULT_SAMPLE_RATE,
+)
+
+
+def channel_gains(num_channels: int, pan: float) -> np.ndarray:
+    """
+    Get per-channel gains for a pan position (-1.0 is left, 1.0 is right).
+    Stereo output uses a balance law (both channels are at unity gain when
+    centered), other channel counts aren't panned.
+    """
+
+    assert -1.0 <= pan <= 1.0, pan
+
+    result = np.ones(num_channels)
+    if num_channels == 2:
+        result[0] = min(1.0, 1.0 - pan)
+        result[1] = min(1.0, 1.0 + pan)
+
+    return result
+
+
+class Voice:
+    """
+    A sampler mixed in over a span of time. Voices with an envelope are
+    released at their stop frame (and sound until the release finishes).
+    """
+
+    def __init__(
+        self,
+        sampler: Sampler,
+        gains: np.ndarray,
+        start_frame: int = 0,
+        stop_frame: int = None,
+        envelope: Envelope = None,
+    ) -> None:
+        """Initialize this instance."""
+
+        self.sampler = sampler
+        self.origin = sampler.time
+        self.gains = gains
+        self.start_frame = start_frame
+        self.stop_frame = stop_frame
+        self.done = False
+
+        # The sampler's entire output (if it's cached), only held while this
+        # voice sounds (see 'block').
+        self.rendering: Optional[np.ndarray] = None
+
+        self.envelope = envelope
+
+    @property
+    def end_frame(self) -> Optional[int]:
+        """Get the frame after the last one this voice contributes to."""
+
+        result = self.stop_frame
+        if result is not None and self.envelope is not None:
+            result += round(self.envelope.release_s * self.sampler.sample_rate)
+        return result
+
+    def levels(self, offset: int, count: int) -> np.ndarray:
+        """
+        Get envelope levels for 'count' frames, starting 'offset' frames
+        after this voice's start.
+        """
+
+        assert self.envelope is not None
+
+        rate = self.sampler.sample_rate
+        release_at = None
+        if self.stop_frame is not None:
+            release_at = (self.stop_frame - self.start_frame) / rate
+
+        return self.envelope.levels(
+            np.arange(offset, offset + count) / rate, release_at=release_at
+        )
+
+    def block(self, offset: int, count: int) -> np.ndarray:
+        """
+        Get up to 'count' raw values, starting 'offset' frames after this
+        voice's start. Cached output is looked up when the voice starts
+        (seeking into a voice renders the rest with its sampler).
+        """
+
+        if offset == 0 and self.rendering is None:
+            self.rendering = self.sampler.rendering()
+
+        if self.rendering is not None:
+            return self.rendering[offset : offset + count]
+
+        return self.sampler.block(count)
+
+
+class Mixer:
+    """A class for rendering a weighted sum of samplers."""
+
+    def __init__(
+        self,
+        num_channels: int = DEFAULT_CHANNELS,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        num_bits: int = DEFAULT_BITS,
+        normalization: MixNormalization = MixNormalization.NONE,
+        clip: ClipPolicy = ClipPolicy.HARD,
+    ) -> None:
+        """Initialize this instance."""
+
+        self.num_channels = num_channels
+        self.sample_rate = sample_rate
+        self.num_bits = num_bits
+
+        self.normalization = normalization
+        self.clip = clip
+
+        self.voices: list[Voice] = []
+
+        # The number of frames rendered, and the end of the last frame any
+        # voice contributed to.
+        self.position = 0
+        self.extent = 0
+
+    def add(
+        self,
+        sampler: Sampler,
+        gain: float = 1.0,
+        start_s: float = 0.0,
+        stop_s: float = None,
+        pan: float = 0.0,
+        envelope: Envelope = None,
+    ) -> Voice:
+        """
+        Add a voice to this mixer (with an envelope, the voice is released
+        at its stop time).
+        """
+
+        assert sampler.sample_rate == self.sample_rate
+
+        stop_frame: Optional[int] = None
+        if stop_s is not None:
+            stop_frame = round(stop_s * self.sample_rate)
+
+        voice = Voice(
+            sampler,
+            gain * channel_gains(self.num_channels, pan),
+            start_frame=round(start_s * self.sample_rate),
+            stop_frame=stop_frame,
+            envelope=envelope,
+        )
+        self.voices.append(voice)
+        return voice
+
+    @property
+    def scalar(self) -> int:
+        """Get the largest sample magnitude."""
+        return int((2 ** (self.num_bits - 1)) - 1)
+
+    @property
+    def done(self) -> bool:
+        """Determine if all voices have finished."""
+        return all(x.done for x in self.voices)
+
+    @property
+    def num_voices(self) -> int:
+        """Get the number of voices mixed (for normalization)."""
+        return len(self.voices)
+
+    def seek(self, frame: int) -> None:
+        """Set the next frame to render (and each voice's time)."""
+
+        self.position = frame
+        self.extent = frame
+
+        for voice in self.voices:
+            voice.sampler.seek(
+                voice.origin
+                + max(frame - voice.start_frame, 0) * voice.sampler.period
+            )
+            end_frame = voice.end_frame
+            voice.done = end_frame is not None and frame >= end_frame
+
+    def _mix_voice(
+        self, voice: Voice, mix: np.ndarray, active: np.ndarray
+    ) -> None:
+        """Add a voice's contribution to a block."""
+
+        start = self.position
+        end = start + len(mix)
+
+        begin = max(voice.start_frame, start)
+        finish = end
+        end_frame = voice.end_frame
+        if end_frame is not None:
+            finish = min(finish, end_frame)
+            if finish >= end_frame:
+                voice.done = True
+
+        if finish > begin:
+            offset = begin - voice.start_frame
+            values = voice.block(offset, finish - begin)
+            if len(values) < finish - begin:
+                voice.done = True
+
+            if voice.envelope is not None:
+                values = values * voice.levels(offset, len(values))
+
+            offset = begin - start
+            span = slice(offset, offset + len(values))
+
+            mix[span] += values[:, np.newaxis] * voice.gains
+            active[span] += 1
+
+            self.extent = max(self.extent, begin + len(values))
+
+        # Finished voices don't hold on to cached output.
+        if voice.done:
+            voice.rendering = None
+
+    def normalize(self, mix: np.ndarray, active: np.ndarray) -> np.ndarray:
+        """Scale (and bound) a block of summed voices."""
+
+        if self.normalization is MixNormalization.ACTIVE:
+            mix /= np.maximum(active, 1.0)[:, np.newaxis]
+        elif self.normalization is MixNormalization.VOICES and self.voices:
+            mix /= self.num_voices
+
+        if self.clip is ClipPolicy.HARD:
+            np.clip(mix, -self.scalar, self.scalar, out=mix)
+        elif self.clip is ClipPolicy.SOFT:
+            mix = self.scalar * np.tanh(mix / self.scalar)
+        else:
+            assert np.abs(mix).max(initial=0.0) <= self.scalar
+
+        return mix
+
+    def mix(self, count: int) -> np.ndarray:
+        """
+        Mix a (count, channels) block of (normalized and bounded) raw sample
+        values.
+        """
+
+        mix = np.zeros((count, self.num_channels))
+        active = np.zeros(count)
+
+        for voice in self.voices:
+            if not voice.done:
+                self._mix_voice(voice, mix, active)
+
+        self.position += count
+
+        return self.normalize(mix, active)
+
+    def render(self, count: int) -> np.ndarray:
+        """Render a (count, channels) block of mixed samples."""
+
+        start = METRICS.start()
+        result = self.mix(count).astype(int_dtype(self.num_bits))
+        METRICS.record("mixer.render", start, count)
+        return result
+
+    def render_float(self, count: int) -> np.ndarray:
+        """
+        Render a (count, channels) block of samples in [-1.0, 1.0] (single
+        precision, unless rendering 64-bit samples).
+        """
+
+        start = METRICS.start()
+        result = (self.mix(count) / self.scalar).astype(
+            np.float64 if self.num_bits == 64 else np.float32
+        )
+        METRICS.record("mixer.render", start, count)
+        return result
+
+    def blocks(
+        self, block_frames: int = DEFAULT_BLOCK_FRAMES, is_float: bool = False
+    ) -> Iterator[np.ndarray]:
+        """
+        Render blocks (of integer or floating-point samples) until all voices
+        have finished (the final block ends at the last frame any voice
+        contributed to).
+        """
+
+        render = self.render_float if is_float else self.render
+
+        while not self.done:
+            start = self.position
+            block = render(block_frames)
+
+            if self.done:
+                block = block[: max(self.extent - start, 0)]
+
+            if len(block):
+                yield block
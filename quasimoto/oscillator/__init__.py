@@ -0,0 +1,130 @@
+"""
+A module implementing phase-accumulating oscillator interfaces.
+"""
+
+# built-in
+from functools import cached_property
+import math
+from typing import Union, cast
+
+# third-party
+import numpy as np
+
+# internal
+from quasimoto.wave.writer import DEFAULT_SAMPLE_RATE
+
+# Phase is a fixed-point fraction of a cycle, so it wraps exactly (no drift).
+PHASE_BITS = 32
+PHASE_MODULUS = 1 << PHASE_BITS
+PHASE_MASK = PHASE_MODULUS - 1
+
+DEFAULT_TABLE_BITS = 11
+
+Frequency = Union[float, np.ndarray]
+
+
+def sine_table(table_bits: int = DEFAULT_TABLE_BITS) -> np.ndarray:
+    """
+    Create a single-cycle sine table (with a guard point at the end for
+    interpolation).
+    """
+
+    size = 1 << table_bits
+    return cast(np.ndarray, np.sin(np.arange(size + 1) * (math.tau / size)))
+
+
+class Oscillator:
+    """A phase-accumulating wavetable oscillator."""
+
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        table: np.ndarray = None,
+        phase: float = 0.0,
+    ) -> None:
+        """Initialize this instance."""
+
+        if table is None:
+            table = sine_table()
+
+        # Tables are shared by copies (and identify cached renders), so
+        # they're made read-only.
+        table.setflags(write=False)
+        self.table = table
+
+        table_size = len(self.table) - 1
+        table_bits = table_size.bit_length() - 1
+        assert table_size == 1 << table_bits, "Table size must be 2^N + 1."
+
+        # Upper phase bits index the table, lower bits interpolate.
+        self.shift = PHASE_BITS - table_bits
+        self.fraction_mask = (1 << self.shift) - 1
+        self.fraction_scale = 1.0 / (1 << self.shift)
+
+        self.sample_rate = sample_rate
+        self.phase = 0
+        self.phase_cycles = phase
+
+    @cached_property
+    def table_bytes(self) -> bytes:
+        """Get this oscillator's table contents (for cache keys)."""
+        return self.table.tobytes()
+
+    @property
+    def phase_cycles(self) -> float:
+        """Get the current phase as a fraction of a cycle."""
+        return self.phase / PHASE_MODULUS
+
+    @phase_cycles.setter
+    def phase_cycles(self, value: float) -> None:
+        """Set the current phase as a fraction of a cycle."""
+        self.phase = int(value * PHASE_MODULUS) & PHASE_MASK
+
+    def increments(self, count: int, frequency: Frequency) -> np.ndarray:
+        """Get per-sample phase increments for a (per-sample) frequency."""
+
+        return np.broadcast_to(
+            np.rint(
+                np.asarray(frequency, dtype=np.float64)
+                * (PHASE_MODULUS / self.sample_rate)
+            )
+            .astype(np.int64)
+            .astype(np.uint64),
+            (count,),
+        )
+
+    def phases(self, count: int, frequency: Frequency) -> np.ndarray:
+        """Get the next 'count' (fixed-point) phases and advance."""
+
+        increments = self.increments(count, frequency)
+
+        steps = np.empty(count, dtype=np.uint64)
+        if count:
+            steps[0] = self.phase
+            steps[1:] = increments[:-1]
+
+        # Unsigned overflow wraps modulo 2^64, a multiple of the modulus.
+        result = np.cumsum(steps, dtype=np.uint64) & np.uint64(PHASE_MASK)
+
+        if count:
+            self.phase = int(result[-1] + increments[-1]) & PHASE_MASK
+
+        return result
+
+    def lookup(self, phases: np.ndarray) -> np.ndarray:
+        """Look up (and linearly interpolate) table values for phases."""
+
+        index = (phases >> np.uint64(self.shift)).astype(np.intp)
+        fraction = (phases & np.uint64(self.fraction_mask)).astype(
+            np.float64
+        ) * self.fraction_scale
+
+        low = self.table[index]
+        return cast(np.ndarray, low + fraction * (self.table[index + 1] - low))
+
+    def render(self, count: int, frequency: Frequency) -> np.ndarray:
+        """
+        Render 'count' samples (in the table's range) at a frequency, which
+        may be an array of per-sample frequencies.
+        """
+        return self.lookup(self.phases(count, frequency))
@@ -0,0 +1,178 @@
+"""
+A module implementing offline rendering interfaces.
+"""
+
+# built-in
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+# third-party
+import numpy as np
+from vcorelib.logging import LoggerType
+
+# internal
+from quasimoto.cache import RenderCache
+from quasimoto.enums import MixNormalization, Waveform
+from quasimoto.midi import midi_scheduler
+from quasimoto.mixer import Mixer
+from quasimoto.sampler import DEFAULT_FREQUENCY, Sampler
+from quasimoto.sampler.waveform import WaveformSampler
+from quasimoto.wave.writer import (
+    DEFAULT_BITS,
+    DEFAULT_CHANNELS,
+    DEFAULT_SAMPLE_RATE,
+    WaveWriter,
+)
+
+DEFAULT_SEGMENT_S = 10.0
+
+
+class RenderSpec(NamedTuple):
+    """Parameters for an offline render."""
+
+    duration_s: float = 1.0
+    frequency: float = DEFAULT_FREQUENCY
+    amplitude: float = 1.0
+    harmonics: tuple[int, ...] = (0,)
+    normalization: MixNormalization = MixNormalization.VOICES
+    waveform: Waveform = Waveform.SINE
+
+    num_channels: int = DEFAULT_CHANNELS
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+    num_bits: int = DEFAULT_BITS
+    is_float: bool = False
+
+    @property
+    def num_frames(self) -> int:
+        """Get the total number of frames to render."""
+        return round(self.duration_s * self.sample_rate)
+
+    def mixer(self) -> Mixer:
+        """Create a mixer for this render."""
+
+        result = Mixer(
+            num_channels=self.num_channels,
+            sample_rate=self.sample_rate,
+            num_bits=self.num_bits,
+            normalization=self.normalization,
+        )
+
+        base = Sampler(
+            num_bits=self.num_bits,
+            sample_rate=self.sample_rate,
+            frequency=self.frequency,
+        )
+        for harmonic in self.harmonics:
+            result.add(
+                WaveformSampler(
+                    waveform=self.waveform,
+                    num_bits=self.num_bits,
+                    sample_rate=self.sample_rate,
+                    frequency=base.harmonic(harmonic),
+                    amplitude=self.amplitude,
+                )
+            )
+
+        return result
+
+
+def render_segment(spec: RenderSpec, start: int, count: int) -> np.ndarray:
+    """Render a segment of frames (independently of any other segment)."""
+
+    mixer = spec.mixer()
+    mixer.seek(start)
+    return mixer.render_float(count) if spec.is_float else mixer.render(count)
+
+
+def segments(
+    num_frames: int, segment_frames: int
+) -> Iterator[tuple[int, int]]:
+    """Get (start, count) frame spans covering a render."""
+
+    for start in range(0, num_frames, segment_frames):
+        yield start, min(segment_frames, num_frames - start)
+
+
+def render(
+    spec: RenderSpec,
+    writer: WaveWriter,
+    jobs: int = 1,
+    segment_s: float = DEFAULT_SEGMENT_S,
+    logger: LoggerType = None,
+) -> int:
+    """
+    Render to a WAVE writer, one time segment at a time. Segments are
+    rendered in a process pool (and written in order) when multiple jobs are
+    requested.
+    """
+
+    segment_frames = max(round(segment_s * spec.sample_rate), 1)
+    spans = segments(spec.num_frames, segment_frames)
+
+    # Don't start more processes than there are segments.
+    jobs = min(jobs, -(-spec.num_frames // segment_frames))
+
+    count = 0
+
+    if jobs <= 1:
+        for start, frames in spans:
+            writer.append(render_segment(spec, start, frames))
+            count += 1
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Bound the number of outstanding segments.
+            pending: deque[Future[np.ndarray]] = deque()
+            for start, frames in spans:
+                pending.append(
+                    executor.submit(render_segment, spec, start, frames)
+                )
+                if len(pending) >= 2 * jobs:
+                    writer.append(pending.popleft().result())
+                    count += 1
+
+            while pending:
+                writer.append(pending.popleft().result())
+                count += 1
+
+    if logger is not None:
+        logger.info("Rendered %d segment(s) with %d job(s).", count, jobs)
+
+    return count
+
+
+def render_midi(
+    spec: RenderSpec,
+    path: Path,
+    writer: WaveWriter,
+    logger: LoggerType = None,
+) -> int:
+    """
+    Render a MIDI file to a WAVE writer (notes are played with the spec's
+    waveform and amplitude, its frequency is used for middle C). Returns the
+    number of notes rendered.
+    """
+
+    scheduler = midi_scheduler(
+        path,
+        WaveformSampler(
+            waveform=spec.waveform,
+            num_bits=spec.num_bits,
+            sample_rate=spec.sample_rate,
+            frequency=spec.frequency,
+            amplitude=spec.amplitude,
+            cache=RenderCache(),
+        ),
+        num_channels=spec.num_channels,
+        normalization=spec.normalization,
+    )
+
+    writer.write_blocks(scheduler.blocks(is_float=spec.is_float))
+
+    if logger is not None:
+        logger.info(
+            "Rendered %d note(s) from '%s'.", len(scheduler.voices), path
+        )
+
+    return len(scheduler.voices)
@@ -0,0 +1,167 @@
+"""
+A module implementing streaming sample-rate conversion.
+"""
+
+# built-in
+from math import gcd
+from typing import Iterable, Iterator
+
+# third-party
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import firwin
+
+# internal
+from quasimoto.analysis import float_blocks
+from quasimoto.wave.mixins import DEFAULT_BLOCK_FRAMES
+from quasimoto.wave.reader import WaveReader
+from quasimoto.wave.writer import DEFAULT_CHANNELS, WaveWriter
+
+# Filter length (on each side of its center) in multiples of the larger
+# of the up and down-sampling factors.
+DEFAULT_HALF_TAPS = 10
+DEFAULT_WINDOW = ("kaiser", 5.0)
+
+
+class Resampler:
+    """
+    A rational-ratio polyphase resampler for streams of (frames, channels)
+    blocks. Only the input history the filter needs is kept between blocks
+    (output is identical to 'scipy.signal.resample_poly' on the whole
+    stream).
+    """
+
+    def __init__(
+        self,
+        in_rate: int,
+        out_rate: int,
+        num_channels: int = DEFAULT_CHANNELS,
+        half_taps: int = DEFAULT_HALF_TAPS,
+    ) -> None:
+        """Initialize this instance."""
+
+        divisor = gcd(in_rate, out_rate)
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+
+        # Design the (anti-aliasing / anti-imaging) filter in the upsampled
+        # domain.
+        half_len = half_taps * max(self.up, self.down)
+        taps = firwin(
+            2 * half_len + 1,
+            1.0 / max(self.up, self.down),
+            window=DEFAULT_WINDOW,
+        )
+        taps *= self.up
+        self.delay = half_len
+
+        # Split the filter into phases, each applied to 'width' input
+        # samples (reversed, to apply to ascending windows of input).
+        width = -(-len(taps) // self.up)
+        padded = np.zeros(self.up * width)
+        padded[: len(taps)] = taps
+        self.phases = padded.reshape(width, self.up).T[:, ::-1].copy()
+
+        # Input that later output still depends on, starting at input index
+        # 'offset' (zeros precede the stream).
+        self.history = np.zeros((self.width - 1, num_channels))
+        self.offset = -(self.width - 1)
+
+        # Input consumed and output produced.
+        self.consumed = 0
+        self.produced = 0
+
+    @property
+    def width(self) -> int:
+        """Get the number of input samples each output depends on."""
+        return int(self.phases.shape[1])
+
+    def _output(self, available: int) -> np.ndarray:
+        """Produce all output that depends only on available input."""
+
+        # Output 'n' depends on input up to (n * down + delay) // up.
+        end = (available * self.up - self.delay - 1) // self.down + 1
+        count = end - self.produced
+        if count <= 0:
+            return np.zeros((0, self.history.shape[1]))
+
+        positions = (
+            np.arange(self.produced, self.produced + count) * self.down
+            + self.delay
+        )
+        bases, phases = np.divmod(positions, self.up)
+
+        windows = sliding_window_view(self.history, self.width, axis=0)
+        result: np.ndarray = np.matmul(
+            windows[bases - (self.width - 1) - self.offset],
+            self.phases[phases][..., np.newaxis],
+        )[..., 0]
+
+        self.produced += count
+
+        # Drop input no longer needed.
+        start = (self.produced * self.down + self.delay) // self.up
+        start -= self.width - 1
+        if start > self.offset:
+            self.history = self.history[start - self.offset :].copy()
+            self.offset = start
+
+        return result
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Resample a (frames, channels) block (of floating-point values)."""
+
+        self.history = np.concatenate((self.history, block))
+        self.consumed += len(block)
+        return self._output(self.offset + len(self.history))
+
+    def flush(self) -> np.ndarray:
+        """Produce the remaining output (for the end of the stream)."""
+
+        total = -(-self.consumed * self.up // self.down)
+        remaining = max(total - self.produced, 0)
+
+        # Enough (zero) input for the last output to be complete.
+        last = ((total - 1) * self.down + self.delay) // self.up
+        missing = last + 1 - (self.offset + len(self.history))
+        if missing > 0:
+            self.history = np.concatenate(
+                (self.history, np.zeros((missing, self.history.shape[1])))
+            )
+
+        return self._output(self.offset + len(self.history))[:remaining]
+
+    def resample(self, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Resample a stream of blocks."""
+
+        for block in blocks:
+            result = self.process(block)
+            if len(result):
+                yield result
+
+        result = self.flush()
+        if len(result):
+            yield result
+
+
+def resample_wave(
+    reader: WaveReader,
+    writer: WaveWriter,
+    frames_per_block: int = DEFAULT_BLOCK_FRAMES,
+) -> None:
+    """
+    Convert a WAVE file's sample data to another writer's sample rate (and
+    format), streaming it in blocks.
+    """
+
+    assert reader.channels == writer.channels
+
+    resampler = Resampler(
+        reader.sample_rate, writer.sample_rate, num_channels=reader.channels
+    )
+
+    codec = writer.codec
+    writer.write_blocks(
+        codec.from_float(block)
+        for block in resampler.resample(float_blocks(reader, frames_per_block))
+    )
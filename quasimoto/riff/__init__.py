@@ -4,8 +4,10 @@ A module implementing interfaces for RIFF files.
 
 # built-in
 from contextlib import contextmanager
+import mmap as _mmap
 import os
 from pathlib import Path
+import struct
 from typing import BinaryIO, Iterator, Optional, Type, TypeVar, cast
 
 # third-party
@@ -15,21 +17,48 @@ from vcorelib.logging import LoggerMixin
 
 # internal
 from quasimoto.enums import ChunkType
-from quasimoto.riff.chunk import NULL_BYTE, Chunk
+from quasimoto.metrics import METRICS
+from quasimoto.riff.chunk import NULL_BYTE, Chunk, ChunkData, ChunkEntry
+from quasimoto.riff.ds64 import DS64_SIZE, RF64_SIZE, Ds64
 
 T = TypeVar("T", bound="RiffInterface")
 
+# The size of the 'RIFF' (or 'RF64') header, including its form type.
+HEADER_SIZE = 12
+
+# Chunk headers are a four-byte identifier and a little-endian size.
+CHUNK_HEADER = struct.Struct("<4sI")
+
 
 class RiffInterface(LoggerMixin):
-    """A class for reading and writing RIFF files."""
+    """A class for reading and writing RIFF (and RF64) files."""
 
-    def __init__(self, stream: BinaryIO, is_writer: bool = True) -> None:
-        """Initialize this instance."""
+    # Sizes this large (the RF64 size sentinel and up) require RF64.
+    max_size = RF64_SIZE
+
+    def __init__(
+        self, stream: BinaryIO, is_writer: bool = True, rf64: bool = None
+    ) -> None:
+        """
+        Initialize this instance. Writers reserve space for a 'ds64' chunk
+        (so the file can be upgraded to RF64 when finalized) unless 'rf64'
+        is False, and always write RF64 if it's True.
+        """
 
         super().__init__()
 
         self.stream = stream
 
+        # 64-bit sizes (and the position of the reserved chunk for them).
+        self.rf64 = rf64
+        self.ds64 = Ds64.instance()
+        self.ds64_offset: Optional[int] = None
+
+        # Memory-mapped streams serve chunk data as views (no copies).
+        self.view: Optional[memoryview] = None
+        if isinstance(stream, _mmap.mmap):
+            self.view = memoryview(stream)
+
         # Write the header.
         self.is_writer = is_writer
         if self.is_writer:
@@ -41,39 +70,159 @@ class RiffInterface(LoggerMixin):
             assert header is not None
             self.header: Chunk = header
             self.logger.info("Header: %s.", self.header)
-            assert self.header.kind is ChunkType.RIFF
-
-    def read_size(self) -> int:
-        """Read a size from the stream."""
-
-        return cast(
-            int,
-            Uint32.kind.read(self.stream, byte_order=ByteOrder.LITTLE_ENDIAN),
-        )
+            assert self.header.kind in {ChunkType.RIFF, ChunkType.RF64}
+
+            # Top-level chunks are indexed on demand.
+            self._index: Optional[list[ChunkEntry]] = None
+
+            # RF64 sizes are in the (first) 'ds64' chunk.
+            if self.header.kind is ChunkType.RF64:
+                entry = self.read_entry()
+                assert entry is not None and entry.kind is ChunkType.DS64
+                self.ds64_offset = entry.offset - 8
+                data = self.load(entry).data
+                assert data is not None
+                self.ds64.array.update(bytes(data[:DS64_SIZE]))
+                self.header = self.header._replace(
+                    size=cast(int, self.ds64["riff_size"])
+                )
+                self.stream.seek(HEADER_SIZE)
+
+    def read_header(self) -> Optional[tuple[ChunkType, Optional[bytes], int]]:
+        """
+        Read the next chunk header (its type, raw identifier if the type is
+        unknown, and size).
+        """
+
+        data = self.stream.read(CHUNK_HEADER.size)
+        kind = None
+        if len(data) == CHUNK_HEADER.size:
+            ident, size = CHUNK_HEADER.unpack(data)
+            kind = ChunkType.from_bytes(ident)
+
+        # Leave anything that isn't a chunk in the stream.
+        if kind is None:
+            self.stream.seek(-len(data), os.SEEK_CUR)
+            return None
+
+        # RF64 'data' chunk sizes are in the 'ds64' chunk.
+        if (
+            size == RF64_SIZE
+            and kind is ChunkType.DATA
+            and self.ds64_offset is not None
+        ):
+            size = cast(int, self.ds64["data_size"])
+
+        return kind, ident if kind is ChunkType.UNKNOWN else None, size
 
     def read(self) -> Optional[Chunk]:
         """Read the next chunk."""
 
         result = None
 
-        print(self.stream.tell())
-        kind = ChunkType.from_stream(self.stream)
-        if kind is not None:
-            size = self.read_size()
+        header = self.read_header()
+        if header is not None:
+            kind, ident, size = header
             data = None
             form = None
 
             if not kind.is_container:
-                data = self.stream.read(size)
-                if size % 2 == 1:
-                    self.stream.read(1)  # pragma: nocover
+                data = self.read_data(size)
             else:
                 form = ChunkType.from_stream(self.stream)
 
-            result = Chunk(kind, size, data=data, form=form)
+            result = Chunk(kind, size, data=data, form=form, ident=ident)
 
         return result
 
+    def read_data(self, size: int) -> ChunkData:
+        """Read chunk data (and any padding byte) from the stream."""
+
+        began = METRICS.start()
+        data: ChunkData
+
+        if self.view is not None:
+            start = self.stream.tell()
+            data = self.view[start : start + size]
+            self.stream.seek(size + size % 2, os.SEEK_CUR)
+        else:
+            data = self.stream.read(size)
+            if size % 2 == 1:
+                self.stream.read(1)  # pragma: nocover
+
+        METRICS.record("riff.read", began, len(data))
+        return data
+
+    def read_entry(self) -> Optional[ChunkEntry]:
+        """Read the next chunk header and seek past its data."""
+
+        result = None
+
+        header = self.read_header()
+        if header is not None:
+            kind, ident, size = header
+            form = None
+
+            if kind.is_container:
+                form = ChunkType.from_stream(self.stream)
+                size -= 4
+
+            result = ChunkEntry(
+                kind, self.stream.tell(), size, form=form, ident=ident
+            )
+            self.stream.seek(size + size % 2, os.SEEK_CUR)
+
+        return result
+
+    def index(self) -> list[ChunkEntry]:
+        """
+        Get an index of this file's top-level chunks (without reading chunk
+        data).
+        """
+
+        assert not self.is_writer
+
+        if self._index is None:
+            self._index = []
+
+            position = self.stream.tell()
+            self.stream.seek(HEADER_SIZE)
+
+            end = HEADER_SIZE - 4 + self.header.size
+            entry = self.read_entry()
+            while entry is not None:
+                self._index.append(entry)
+                if self.stream.tell() >= end:
+                    break
+                entry = self.read_entry()
+
+            self.stream.seek(position)
+
+        return self._index
+
+    def find(self, kind: ChunkType) -> Optional[ChunkEntry]:
+        """Find the first indexed chunk of a given kind."""
+
+        return next((x for x in self.index() if x.kind is kind), None)
+
+    def load(self, entry: ChunkEntry) -> Chunk:
+        """Load the data for an indexed chunk."""
+
+        data = None
+        if not entry.kind.is_container:
+            position = self.stream.tell()
+            self.stream.seek(entry.offset)
+            data = self.read_data(entry.size)
+            self.stream.seek(position)
+
+        return Chunk(
+            entry.kind,
+            entry.size,
+            data=data,
+            form=entry.form,
+            ident=entry.ident,
+        )
+
     def chunks(self) -> Iterator[Chunk]:
         """Read file chunks."""
 
@@ -99,7 +248,7 @@ class RiffInterface(LoggerMixin):
             size, self.stream, byte_order=ByteOrder.LITTLE_ENDIAN
         )
 
-    def _write_data(self, data: bytes) -> None:
+    def _write_data(self, data: ChunkData) -> None:
         """Write chunk data."""
 
         size = len(data)
@@ -110,16 +259,29 @@ class RiffInterface(LoggerMixin):
         if size % 2 == 1:
             self.stream.write(NULL_BYTE)  # pragma: nocover
 
+    def reserve_ds64(self) -> None:
+        """Reserve space for a 'ds64' chunk (as a 'JUNK' chunk)."""
+
+        self.ds64_offset = self.stream.tell()
+        self.write(Chunk(ChunkType.JUNK, DS64_SIZE, data=bytes(DS64_SIZE)))
+
     def write(self, chunk: Chunk) -> None:
         """Write a chunk to the file."""
 
         assert self.is_writer
 
+        # The 'ds64' chunk must be the first chunk.
+        if self.rf64 is not False and self.ds64_offset is None:
+            self.reserve_ds64()
+
         # Can't write container chunks this way.
         assert not chunk.kind.is_container
 
-        # Write header.
-        chunk.kind.to_stream(self.stream)
+        # Write header (opaque chunks keep their identifier).
+        if chunk.ident is not None:
+            self.stream.write(chunk.ident)
+        else:
+            chunk.kind.to_stream(self.stream)
 
         # Write data.
         if chunk.data is not None:
@@ -131,22 +293,77 @@ class RiffInterface(LoggerMixin):
         if self.is_writer:
             self.stream.seek(0, os.SEEK_END)
             size = self.stream.tell() - 8
-            self.write_size(size, seek=4)
+
+            if self.ds64_offset is not None and (
+                self.rf64 or size >= self.max_size or self.ds64["data_size"]
+            ):
+                self.upgrade(size)
+            else:
+                self.write_size(size, seek=4)
         else:
+            # Indexed chunks have been accounted for without reading them.
+            if self._index:
+                last = self._index[-1]
+                self.stream.seek(last.offset + last.size + last.size % 2)
+
             remaining = self.stream.read()
             if remaining:
                 self.logger.warning(
                     "%d bytes remaining in file!", len(remaining)
                 )
 
+    def upgrade(self, size: int) -> None:
+        """Write an RF64 header and 'ds64' chunk (in place)."""
+
+        assert self.ds64_offset is not None
+        self.ds64["riff_size"] = size
+
+        self.stream.seek(0)
+        ChunkType.RF64.to_stream(self.stream)
+        self.write_size(RF64_SIZE)
+
+        self.stream.seek(self.ds64_offset)
+        ChunkType.DS64.to_stream(self.stream)
+        self.write_size(DS64_SIZE)
+        self.stream.write(bytes(self.ds64.array))
+
+    def release(self) -> None:
+        """Release this instance's memory map (if there is one)."""
+
+        if self.view is not None:
+            mapped = cast(_mmap.mmap, self.view.obj)
+            self.view.release()
+            self.view = None
+
+            try:
+                mapped.close()
+            except BufferError:
+                # Outstanding chunk-data views keep the mapping alive, it's
+                # unmapped once they're garbage collected.
+                self.logger.debug("Memory map still has exported views.")
+
     @classmethod
     @contextmanager
     def from_path(
-        cls: Type[T], path: Path, is_writer: bool = True
+        cls: Type[T],
+        path: Path,
+        is_writer: bool = True,
+        mmap: bool = False,
+        rf64: bool = None,
     ) -> Iterator[T]:
         """Create a RIFF interface from a path."""
 
         with path.open("wb" if is_writer else "rb") as out_fd:
-            result = cls(out_fd, is_writer=is_writer)
-            yield result
-            result.finalize()
+            stream: BinaryIO = out_fd
+            if mmap and not is_writer:
+                stream = cast(
+                    BinaryIO,
+                    _mmap.mmap(out_fd.fileno(), 0, access=_mmap.ACCESS_READ),
+                )
+
+            result = cls(stream, is_writer=is_writer, rf64=rf64)
+            try:
+                yield result
+                result.finalize()
+            finally:
+                result.release()
@@ -3,23 +3,59 @@ A module implementing a RIFF-chunk interface.
 """
 
 # built-in
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, Union
 
 # internal
 from quasimoto.enums import ChunkType
 
+# Chunk payloads are views into memory-mapped files when reading that way.
+ChunkData = Union[bytes, memoryview]
+
+
+def chunk_name(kind: ChunkType, ident: Optional[bytes]) -> str:
+    """Get the name of a (possibly unknown) chunk."""
+    return ident.decode("latin-1") if ident is not None else str(kind)
+
 
 class Chunk(NamedTuple):
     """A container for chunk data."""
 
     kind: ChunkType
     size: int
-    data: Optional[bytes] = None
+    data: Optional[ChunkData] = None
     form: Optional[ChunkType] = None
 
+    # The raw identifier of an 'UNKNOWN' chunk.
+    ident: Optional[bytes] = None
+
     def __str__(self) -> str:
         """Get this chunk as a string."""
-        result = f"'{self.kind}' size={self.size}"
+        result = f"'{chunk_name(self.kind, self.ident)}' size={self.size}"
+
+        if self.form is not None:
+            result += f" (form='{self.form}')"
+
+        return result
+
+
+class ChunkEntry(NamedTuple):
+    """An index entry for a chunk whose data hasn't been read."""
+
+    kind: ChunkType
+    offset: int
+    size: int
+    form: Optional[ChunkType] = None
+
+    # The raw identifier of an 'UNKNOWN' chunk.
+    ident: Optional[bytes] = None
+
+    def __str__(self) -> str:
+        """Get this chunk entry as a string."""
+
+        result = (
+            f"'{chunk_name(self.kind, self.ident)}' "
+            f"offset={self.offset} size={self.size}"
+        )
 
         if self.form is not None:
             result += f" (form='{self.form}')"
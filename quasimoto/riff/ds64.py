@@ -0,0 +1,31 @@
+"""
+A module implementing a protocol factory for RF64 'ds64' chunk data.
+"""
+
+# third-party
+from runtimepy.codec.protocol import Protocol, ProtocolFactory
+from runtimepy.enum.registry import EnumRegistry
+from runtimepy.primitives.byte_order import ByteOrder
+
+# Chunk data size (without any table entries).
+DS64_SIZE = 28
+
+# The 32-bit size field value for sizes that are in the 'ds64' chunk.
+RF64_SIZE = 0xFFFFFFFF
+
+
+class Ds64(ProtocolFactory):
+    """Parse RF64 64-bit size data from bytes."""
+
+    protocol: Protocol = Protocol(
+        EnumRegistry(), byte_order=ByteOrder.LITTLE_ENDIAN
+    )
+
+    @classmethod
+    def initialize(cls, protocol: Protocol) -> None:
+        """Initialize this protocol."""
+
+        protocol.add_field("riff_size", "uint64")
+        protocol.add_field("data_size", "uint64")
+        protocol.add_field("sample_count", "uint64")
+        protocol.add_field("table_length", "uint32")
@@ -6,18 +6,27 @@ A module implementing sampler interfaces.
 from collections.abc import Iterable, Iterator
 from copy import copy
 import math
-from typing import TypeVar
+from typing import Any, Hashable, Optional, TypeVar, Union, cast
 
 # third-party
+import numpy as np
 from runtimepy.primitives import Double
 
 # internal
+from quasimoto.automation import Automation
+from quasimoto.cache import RenderCache
 from quasimoto.wave.writer import DEFAULT_BITS, DEFAULT_SAMPLE_RATE
 
 DEFAULT_FREQUENCY = 261.63
 T = TypeVar("T", bound="Sampler")
 
 
+def int_dtype(num_bits: int) -> np.dtype:
+    """Get an integer data type that can hold samples of a given size."""
+    return np.dtype(np.int16 if num_bits <= 16 else np.int32)
+
+
+# pylint: disable-next=too-many-instance-attributes,too-many-public-methods
 class Sampler(Iterable[int]):
     """A base class for iterable sampler interfaces."""
 
@@ -29,8 +38,12 @@ class Sampler(Iterable[int]):
         frequency: float = DEFAULT_FREQUENCY,
         time: float = 0.0,
         amplitude: float = 1.0,
+        cache: RenderCache = None,
     ) -> None:
-        """Initialize this instance."""
+        """
+        Initialize this instance. Samplers with a cache (shared by copies)
+        can provide their entire output from it (see 'rendering').
+        """
 
         # Can be changed after initialization.
         self.frequency = Double(value=frequency)
@@ -39,27 +52,138 @@ class Sampler(Iterable[int]):
 
         # Runtime state.
         self.time = time
+        self.automation: dict[str, Automation] = {}
+
+        # Phase (in cycles) at 'time', once it's accumulated rather than
+        # derived from time (see 'phases').
+        self.phase: Optional[float] = None
 
         # Constants / final.
         self.sample_rate = sample_rate
-        self.period = 1.0 / self.sample_rate
-        # Note: this assumed signed + zero-centered.
         self.num_bits = num_bits
-        self.scalar = (2 ** (self.num_bits - 1)) - 1
+        self.cache = cache
+
+    def copy_kwargs(self) -> dict[str, Any]:
+        """Get initialization arguments for copies of this instance."""
+
+        return {
+            "num_bits": self.num_bits,
+            "sample_rate": self.sample_rate,
+            "duration_s": self.duration_s,
+            "frequency": self.frequency.value,
+            "time": self.time,
+            "cache": self.cache,
+        }
 
     def __copy__(self: T) -> T:
         """Create a copy of this instance."""
+        return type(self)(**self.copy_kwargs())
+
+    @property
+    def scalar(self) -> int:
+        """Get the largest sample magnitude."""
+        # Note: this assumed signed + zero-centered.
+        return int((2 ** (self.num_bits - 1)) - 1)
+
+    @property
+    def period(self) -> float:
+        """Get the time between samples."""
+        return 1.0 / self.sample_rate
+
+    def automate(self, name: str) -> Automation:
+        """
+        Get the automation for a parameter ('frequency' or 'amplitude'),
+        applied per sample as values are rendered.
+        """
+
+        result = self.automation.get(name)
+        if result is None:
+            parameter = getattr(self, name)
+            assert isinstance(parameter, Double), name
+            result = Automation(parameter)
+            self.automation[name] = result
+
+        return result
+
+    def parameter(
+        self, name: str, times: np.ndarray
+    ) -> Union[float, np.ndarray]:
+        """Get a parameter's value (or per-sample values, if automated)."""
+
+        automation = self.automation.get(name)
+        if automation:
+            return automation.values(times)
+
+        return cast(float, getattr(self, name).value)
+
+    @property
+    def automated(self) -> bool:
+        """Whether or not any parameter has pending automation events."""
+        return any(self.automation.values())
+
+    def state_copy(self: T) -> T:
+        """Get a copy of this instance that will produce the same output."""
+
+        result = copy(self)
+        result.amplitude.value = self.amplitude.value
+        result.phase = self.phase
+        return result
+
+    def cache_key(self) -> Optional[Hashable]:
+        """
+        Get a key identifying this sampler's remaining output (if it's
+        finite and fully determined by its parameters).
+        """
+
+        if self.duration_s is None or self.automated:
+            return None
+
+        return (
+            type(self).__name__,
+            self.frequency.value,
+            self.amplitude.value,
+            self.sample_rate,
+            self.num_bits,
+            self.duration_s,
+            self.time,
+            self.phase,
+            *self._cache_params(),
+        )
+
+    def _cache_params(self) -> tuple[Hashable, ...]:
+        """Get any other parameters that determine this sampler's output."""
+        return ()
+
+    def rendering(self) -> Optional[np.ndarray]:
+        """
+        Get this sampler's remaining raw output (what 'block' would return
+        until its duration elapses) from its cache, without advancing time.
+        """
+
+        key = self.cache_key()
+        if self.cache is None or key is None:
+            return None
 
-        return type(self)(
-            num_bits=self.num_bits,
-            sample_rate=self.sample_rate,
-            duration_s=self.duration_s,
-            frequency=self.frequency.value,
-            time=self.time,
+        return self.cache.get(key, self._render_remaining)
+
+    def _render_remaining(self) -> np.ndarray:
+        """Render this sampler's remaining output (with a copy)."""
+
+        assert self.duration_s is not None
+        return self.state_copy().block(
+            max(math.ceil((self.duration_s - self.time) / self.period) + 1, 0)
         )
 
-    def harmonic(self, index: int) -> float:
-        """Get a harmonic frequency based on this instance's frequency."""
+    @property
+    def dtype(self) -> np.dtype:
+        """Get the integer data type for rendered samples."""
+        return int_dtype(self.num_bits)
+
+    def harmonic(self, index: float) -> float:
+        """
+        Get a harmonic frequency based on this instance's frequency
+        (fractional indices are intervals within an octave).
+        """
         return float(2**index) * self.frequency.value
 
     def copy(self: T, harmonic: int = None, duration_s: float = None) -> T:
@@ -86,9 +210,105 @@ class Sampler(Iterable[int]):
 
         return result
 
+    def seek(self, time: float) -> None:
+        """Set this sampler's time (and derive any other state from it)."""
+
+        self.time = time
+        self.phase = None
+
+    def times(self, count: int) -> np.ndarray:
+        """
+        Get the next 'count' sample times (and the time after them) without
+        advancing time. Times are accumulated one period at a time, exactly
+        as 'advance' does.
+        """
+
+        steps = np.full(count + 1, self.period)
+        steps[0] = self.time
+        return np.cumsum(steps)
+
+    def block(self, count: int) -> np.ndarray:
+        """
+        Get up to 'count' raw (un-truncated) sample values and advance time.
+        Fewer values are returned if this sampler's duration elapses.
+        """
+
+        times = self.times(count)
+
+        emitted = count
+        if self.duration_s is not None:
+            emitted = int(
+                np.searchsorted(times[1:], self.duration_s, side="left")
+            )
+
+        # Like the iterator, exhausting this sampler still advances time.
+        self.time = float(times[min(emitted + 1, count)])
+
+        return self.values(times[:emitted])
+
+    def render(self, count: int) -> np.ndarray:
+        """
+        Render up to 'count' samples in a single pass. The result is
+        identical to calling 'next' up to 'count' times.
+        """
+        return self.block(count).astype(self.dtype)
+
+    def phases(
+        self, times: np.ndarray
+    ) -> tuple[np.ndarray, Union[float, np.ndarray]]:
+        """
+        Get phases (in cycles) for consecutive sample times, starting at this
+        sampler's time, and the frequency (or per-sample frequencies) they
+        were derived from. Phase is 'time * frequency' until frequency is
+        automated, after which it's accumulated from per-sample frequencies
+        (and carried between blocks) so frequency changes are continuous.
+        """
+
+        initial = self.frequency.value
+        frequency = self.parameter("frequency", times)
+
+        if self.phase is None:
+            if not isinstance(frequency, np.ndarray):
+                return times * frequency, frequency
+            self.phase = (
+                (float(times[0]) * initial) % 1.0 if times.size else 0.0
+            )
+
+        increments = np.broadcast_to(
+            np.asarray(frequency) * self.period, times.shape
+        )
+
+        steps = np.empty(len(times))
+        if len(times):
+            steps[0] = self.phase
+            steps[1:] = increments[:-1]
+
+        result = np.cumsum(steps)
+
+        if len(times):
+            self.phase = float(result[-1] + increments[-1]) % 1.0
+
+        return result, frequency
+
+    def sins(self, times: np.ndarray) -> np.ndarray:
+        """Get raw sin values for an array of sample times."""
+
+        amplitude = self.parameter("amplitude", times)
+        phase, _ = self.phases(times)
+        return cast(
+            np.ndarray, self.scalar * amplitude * np.sin(math.tau * phase)
+        )
+
+    def values(self, times: np.ndarray) -> np.ndarray:
+        """Get raw values for an array of sample times."""
+        return self.sins(times)
+
     def sin(self, now: float) -> int:
         """Get a raw sin value sample."""
 
+        if self.automated or self.phase is not None:
+            return int(self.sins(np.array([now]))[0])
+
         return int(
             self.scalar
             * self.amplitude.value
@@ -0,0 +1,77 @@
+"""
+A module implementing a sampler backed by a phase-accumulating oscillator.
+"""
+
+# built-in
+from typing import Any, Hashable, cast
+
+# third-party
+import numpy as np
+
+# internal
+from quasimoto.oscillator import Oscillator, sine_table
+from quasimoto.sampler import Sampler
+
+
+class OscillatorSampler(Sampler):
+    """
+    A sampler that accumulates phase (rather than evaluating absolute time),
+    so frequency changes don't cause discontinuities.
+    """
+
+    def __init__(self, table: np.ndarray = None, **kwargs) -> None:
+        """
+        Initialize this instance (see Sampler for other initialization
+        arguments).
+        """
+
+        super().__init__(**kwargs)
+
+        if table is None:
+            table = sine_table()
+
+        self.oscillator = Oscillator(
+            sample_rate=self.sample_rate,
+            table=table,
+            phase=(self.time * self.frequency.value) % 1.0,
+        )
+
+    def copy_kwargs(self) -> dict[str, Any]:
+        """Get initialization arguments for copies of this instance."""
+
+        result = super().copy_kwargs()
+        result["table"] = self.oscillator.table
+        return result
+
+    def _cache_params(self) -> tuple[Hashable, ...]:
+        """Get any other parameters that determine this sampler's output."""
+        return (self.oscillator.phase, self.oscillator.table_bytes)
+
+    def seek(self, time: float) -> None:
+        """Set this sampler's time (and derive any other state from it)."""
+
+        super().seek(time)
+        self.oscillator.phase_cycles = (time * self.frequency.value) % 1.0
+
+    def state_copy(self) -> "OscillatorSampler":
+        """Get a copy of this instance that will produce the same output."""
+
+        result = super().state_copy()
+        result.oscillator.phase = self.oscillator.phase
+        return result
+
+    def values(self, times: np.ndarray) -> np.ndarray:
+        """Get raw values for an array of sample times."""
+
+        return cast(
+            np.ndarray,
+            self.scalar
+            * self.parameter("amplitude", times)
+            * self.oscillator.render(
+                len(times), self.parameter("frequency", times)
+            ),
+        )
+
+    def value(self, now: float) -> int:
+        """Get the next value."""
+        return int(self.values(np.array([now]))[0])
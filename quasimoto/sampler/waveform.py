@@ -0,0 +1,102 @@
+"""
+A module implementing a sampler for different (band-limited) waveforms.
+"""
+
+# built-in
+from typing import Any, Hashable, cast
+
+# third-party
+import numpy as np
+from runtimepy.primitives import Double
+
+# internal
+from quasimoto.enums import Waveform
+from quasimoto.sampler import Sampler
+from quasimoto.waveform import (
+    DEFAULT_PULSE_WIDTH,
+    noise,
+    pulse,
+    saw,
+    square,
+    triangle,
+)
+
+# Waveforms that only depend on phase and its per-sample increment.
+PHASE_WAVES = {
+    Waveform.SQUARE: square,
+    Waveform.SAW: saw,
+    Waveform.TRIANGLE: triangle,
+}
+
+
+class WaveformSampler(Sampler):
+    """
+    A sampler for sine, square, saw, triangle, pulse and noise waves.
+    Waves with discontinuities (or corners) are band limited so they don't
+    alias.
+    """
+
+    def __init__(
+        self,
+        waveform: Waveform = Waveform.SINE,
+        pulse_width: float = DEFAULT_PULSE_WIDTH,
+        seed: int = 0,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize this instance (see Sampler for other initialization
+        arguments). The pulse width can be changed (or automated) after
+        initialization, the seed selects a noise sequence.
+        """
+
+        super().__init__(**kwargs)
+        self.waveform = Waveform(waveform)
+        self.pulse_width = Double(value=pulse_width)
+        self.seed = seed
+
+    def copy_kwargs(self) -> dict[str, Any]:
+        """Get initialization arguments for copies of this instance."""
+
+        result = super().copy_kwargs()
+        result["waveform"] = self.waveform
+        result["pulse_width"] = self.pulse_width.value
+        result["seed"] = self.seed
+        return result
+
+    def _cache_params(self) -> tuple[Hashable, ...]:
+        """Get any other parameters that determine this sampler's output."""
+        return (self.waveform, self.pulse_width.value, self.seed)
+
+    def waves(self, times: np.ndarray) -> np.ndarray:
+        """Get wave values (in [-1.0, 1.0]) for an array of sample times."""
+
+        if self.waveform is Waveform.NOISE:
+            return noise(np.rint(times * self.sample_rate), seed=self.seed)
+
+        phase, frequency = self.phases(times)
+        phase = np.mod(phase, 1.0)
+        increment = np.asarray(frequency) * self.period
+
+        if self.waveform is Waveform.PULSE:
+            return pulse(
+                phase, increment, width=self.parameter("pulse_width", times)
+            )
+
+        return PHASE_WAVES[self.waveform](phase, increment)
+
+    def values(self, times: np.ndarray) -> np.ndarray:
+        """Get raw values for an array of sample times."""
+
+        if self.waveform is Waveform.SINE:
+            return super().values(times)
+
+        return cast(
+            np.ndarray,
+            self.scalar
+            * self.parameter("amplitude", times)
+            * self.waves(times),
+        )
+
+    def value(self, now: float) -> int:
+        """Get the next value."""
+        return int(self.values(np.array([now]))[0])
@@ -0,0 +1,82 @@
+"""
+A module implementing batch inspection of WAVE files.
+"""
+
+# built-in
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+# internal
+from quasimoto.analysis import LevelMeter, float_blocks
+from quasimoto.enums import DEFAULT_FORMAT
+from quasimoto.wave import WaveReader
+
+# The number of files sent to a worker at a time.
+SCAN_CHUNKSIZE = 8
+
+ScanResult = dict[str, Any]
+
+
+def find_files(
+    paths: Iterable[Path], suffix: str = f".{DEFAULT_FORMAT}"
+) -> Iterator[Path]:
+    """
+    Find files (with a given suffix, in any case) at paths (searching
+    directories recursively).
+    """
+
+    for path in paths:
+        if path.is_dir():
+            for item in sorted(path.rglob("*")):
+                if item.is_file() and item.suffix.lower() == suffix:
+                    yield item
+        else:
+            yield path
+
+
+def scan_file(path: Path) -> ScanResult:
+    """Inspect a WAVE file's format and levels."""
+
+    result: ScanResult = {"path": str(path)}
+
+    try:
+        result["bytes"] = path.stat().st_size
+
+        with WaveReader.from_path(path, mmap=True) as wave:
+            result["format"] = wave.format_type.name.lower()
+            result["channels"] = wave.channels
+            result["sample_rate"] = wave.sample_rate
+            result["bits"] = wave.sample_bits
+            result["frames"] = wave.num_samples
+            result["duration_s"] = wave.duration_s
+
+            meter = LevelMeter()
+            for block in float_blocks(wave):
+                meter.update(block)
+
+            if meter.count:
+                assert meter.peak is not None
+                result["peak"] = meter.peak.tolist()
+                result["rms"] = meter.rms.tolist()
+
+    # Problems with individual files are reported (not raised).
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        result["error"] = f"{type(exc).__name__}: {exc}"
+
+    return result
+
+
+def scan(paths: Iterable[Path], jobs: int = 1) -> Iterator[ScanResult]:
+    """
+    Inspect files (in order), each opened independently in a process pool
+    when multiple jobs are requested.
+    """
+
+    files = find_files(paths)
+
+    if jobs <= 1:
+        yield from map(scan_file, files)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(scan_file, files, chunksize=SCAN_CHUNKSIZE)
@@ -0,0 +1,242 @@
+"""
+A module implementing note scheduling with a pool of enveloped voices.
+"""
+
+# built-in
+from bisect import bisect_left
+from typing import Hashable, NamedTuple
+
+# third-party
+import numpy as np
+
+# internal
+from quasimoto.envelope import DECLICK_S, Envelope
+from quasimoto.mixer import Mixer, Voice
+from quasimoto.sampler import Sampler
+
+DEFAULT_VOICES = 32
+
+
+class Note(NamedTuple):
+    """A note to play (from note-on to note-off)."""
+
+    start_s: float
+    stop_s: float
+    frequency: float
+    velocity: float = 1.0
+    pan: float = 0.0
+
+
+# pylint: disable-next=too-many-instance-attributes
+class NoteScheduler(Mixer):
+    """
+    A mixer for a timeline of notes. Notes are allocated to a fixed number of
+    voices, and when there are more overlapping notes than voices the oldest
+    sounding note is stolen (quickly released).
+    """
+
+    def __init__(
+        self,
+        sampler: Sampler,
+        envelope: Envelope = Envelope(),
+        max_voices: int = DEFAULT_VOICES,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize this instance. Each note is played by a copy of 'sampler'
+        (see Mixer for other initialization arguments).
+        """
+
+        kwargs.setdefault("sample_rate", sampler.sample_rate)
+        kwargs.setdefault("num_bits", sampler.num_bits)
+        super().__init__(**kwargs)
+
+        assert max_voices > 0
+        self.sampler = sampler
+        self.envelope = envelope
+        self.max_voices = max_voices
+
+        # Notes not yet allocated to voices, and notes that are held.
+        self.notes: list[Note] = []
+        self.held: dict[Hashable, tuple[float, float, float, float]] = {}
+
+        # The next voice to start (voices are sorted by start frame) and
+        # voices that have started but not finished.
+        self.next = 0
+        self.active: list[Voice] = []
+
+        # The most voices that sound at once.
+        self.polyphony = 0
+
+    def note(self, note: Note) -> None:
+        """Add a note to the timeline."""
+
+        assert not self.voices, "Notes can't be added after rendering."
+        assert note.stop_s >= note.start_s, note
+        self.notes.append(note)
+
+    def note_on(
+        self,
+        time_s: float,
+        key: Hashable,
+        frequency: float,
+        velocity: float = 1.0,
+        pan: float = 0.0,
+    ) -> None:
+        """Start holding a note."""
+
+        assert key not in self.held, key
+        self.held[key] = (time_s, frequency, velocity, pan)
+
+    def note_off(self, time_s: float, key: Hashable) -> None:
+        """Stop holding a note."""
+
+        start_s, frequency, velocity, pan = self.held.pop(key)
+        self.note(Note(start_s, time_s, frequency, velocity, pan))
+
+    def allocate(self) -> list[tuple[Note, Envelope]]:
+        """
+        Allocate notes to voices (in start order), stealing the oldest note
+        when every voice is in use. Stolen notes stop early with a short
+        release.
+        """
+
+        notes = sorted(self.notes, key=lambda x: x.start_s)
+        result = [(x, self.envelope) for x in notes]
+
+        # Indices (into the result) of notes holding a voice.
+        sounding: list[int] = []
+
+        for idx, note in enumerate(notes):
+            sounding = [
+                x
+                for x in sounding
+                if result[x][0].stop_s + result[x][1].release_s > note.start_s
+            ]
+
+            if len(sounding) >= self.max_voices:
+                stolen = sounding.pop(0)
+                old, envelope = result[stolen]
+                result[stolen] = (
+                    old._replace(stop_s=min(old.stop_s, note.start_s)),
+                    envelope._replace(
+                        release_s=min(envelope.release_s, DECLICK_S)
+                    ),
+                )
+
+            sounding.append(idx)
+
+        return result
+
+    def schedule(self) -> None:
+        """Create voices for any notes that haven't been allocated."""
+
+        if self.notes:
+            kwargs = self.sampler.copy_kwargs()
+
+            for note, envelope in self.allocate():
+                kwargs["frequency"] = note.frequency
+                # Render (at least) one extra frame, so rounding never cuts
+                # the release short (voices stop at their end frame).
+                kwargs["duration_s"] = (
+                    note.stop_s
+                    - note.start_s
+                    + envelope.release_s
+                    + self.sampler.period
+                )
+                kwargs["time"] = 0.0
+
+                sampler = type(self.sampler)(**kwargs)
+                sampler.amplitude.value = self.sampler.amplitude.value
+
+                self.add(
+                    sampler,
+                    gain=note.velocity,
+                    start_s=note.start_s,
+                    stop_s=note.stop_s,
+                    pan=note.pan,
+                    envelope=envelope,
+                )
+
+            self.notes = []
+            self.polyphony = self.peak_voices()
+
+    @property
+    def done(self) -> bool:
+        """
+        Determine if all voices have finished (and there are no notes left to
+        schedule).
+        """
+
+        return (
+            not self.notes
+            and self.next >= len(self.voices)
+            and not self.active
+        )
+
+    def peak_voices(self) -> int:
+        """Get the most voices that sound at once (including releases)."""
+
+        # Voices stop before others start on the same frame.
+        events = sorted(
+            [(x.start_frame, 1) for x in self.voices]
+            + [
+                (x.end_frame, -1)
+                for x in self.voices
+                if x.end_frame is not None
+            ]
+        )
+
+        result = 0
+        count = 0
+        for _, change in events:
+            count += change
+            result = max(result, count)
+
+        return result
+
+    @property
+    def num_voices(self) -> int:
+        """
+        Get the number of voices mixed (for normalization), the most that
+        sound at once rather than the number of notes.
+        """
+        return min(self.polyphony, self.max_voices)
+
+    def seek(self, frame: int) -> None:
+        """Set the next frame to render (and each voice's time)."""
+
+        self.schedule()
+        super().seek(frame)
+
+        self.next = bisect_left(
+            [x.start_frame for x in self.voices], frame + 1
+        )
+        self.active = [x for x in self.voices[: self.next] if not x.done]
+
+    def mix(self, count: int) -> np.ndarray:
+        """
+        Mix a (count, channels) block of (normalized and bounded) raw sample
+        values (only visiting voices that sound during the block).
+        """
+
+        self.schedule()
+
+        end = self.position + count
+        while (
+            self.next < len(self.voices)
+            and self.voices[self.next].start_frame < end
+        ):
+            self.active.append(self.voices[self.next])
+            self.next += 1
+
+        mix = np.zeros((count, self.num_channels))
+        active = np.zeros(count)
+
+        for voice in self.active:
+            self._mix_voice(voice, mix, active)
+        self.active = [x for x in self.active if not x.done]
+
+        self.position += count
+
+        return self.normalize(mix, active)
@@ -0,0 +1,123 @@
+"""
+A module implementing some stereo-audio interfaces.
+"""
+
+# third-party
+import numpy as np
+from runtimepy.primitives import Double, Uint32
+from vcorelib.math import default_time_ns
+
+# internal
+from quasimoto.buffer import RingBuffer
+from quasimoto.metrics import METRICS
+from quasimoto.sampler import Sampler
+from quasimoto.wave.mixins import DEFAULT_BLOCK_FRAMES
+
+DEFAULT_BUFFER_S = 2.0
+
+
+class StereoTelemetry:
+    """Primitives describing the health of a stereo output buffer."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        # Seconds of audio buffered.
+        self.fill_s = Double()
+
+        # Time taken to serve the most recent request for frames.
+        self.callback_s = Double()
+
+        # Number of requests for frames that the buffer couldn't satisfy
+        # (missing frames are silent).
+        self.underruns = Uint32()
+
+        # Time taken to render the most recent block.
+        self.render_s = Double()
+
+
+class StereoInterface:
+    """
+    An interface for managing stereo sound output. Buffering (the producer)
+    and serving frames (the consumer) may happen in different threads: only
+    the producer renders (uses the samplers), and the two only share the
+    ring buffer, so serving frames never waits on rendering.
+    """
+
+    num_channels = 2
+
+    def __init__(
+        self,
+        buffer_s: float = DEFAULT_BUFFER_S,
+        block_frames: int = DEFAULT_BLOCK_FRAMES,
+    ) -> None:
+        """Initialize this instance."""
+
+        self.left = Sampler()
+        self.right = self.left.copy(harmonic=-1)
+
+        self.block_frames = block_frames
+        self.ring = RingBuffer(
+            int(buffer_s * self.left.sample_rate),
+            num_channels=self.num_channels,
+            dtype=self.left.dtype,
+        )
+
+        self.telemetry = StereoTelemetry()
+
+    def render(self, frame_count: int) -> np.ndarray:
+        """Render a block of sample frames."""
+
+        return np.column_stack(
+            (self.left.render(frame_count), self.right.render(frame_count))
+        )
+
+    def update_fill(self) -> None:
+        """Update the buffer fill-level telemetry."""
+        self.telemetry.fill_s.value = len(self.ring) / self.left.sample_rate
+
+    def buffer_to_duration(self, duration_s: float) -> int:
+        """
+        Fill the sample buffer (in whole blocks) to at least the specified
+        duration, if there's space.
+        """
+
+        target = int(duration_s * self.left.sample_rate)
+
+        count = 0
+        while len(self.ring) < target and self.ring.free >= self.block_frames:
+            start = default_time_ns()
+            block = self.render(self.block_frames)
+            elapsed_ns = default_time_ns() - start
+            self.telemetry.render_s.value = elapsed_ns / 1e9
+            METRICS.observe("stereo.render", elapsed_ns, len(block))
+
+            count += self.ring.write(block)
+
+            self.update_fill()
+
+        return count
+
+    def frames(self, frame_count: int) -> bytes:
+        """
+        Get sample frames in a single chunk of bytes (padded with silence if
+        not enough frames are buffered).
+        """
+
+        start = default_time_ns()
+
+        # Get pre-computed samples from the buffer.
+        result = self.ring.read_bytes(frame_count)
+
+        # Don't wait on rendering if the buffer has run dry.
+        missing = frame_count - len(result) // self.ring.frame_bytes
+        if missing:
+            self.telemetry.underruns.increment()
+            result += bytes(missing * self.ring.frame_bytes)
+
+        self.update_fill()
+        elapsed_ns = default_time_ns() - start
+        self.telemetry.callback_s.value = elapsed_ns / 1e9
+        METRICS.observe("stereo.callback", elapsed_ns, frame_count)
+
+        return result
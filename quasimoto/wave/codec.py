@@ -0,0 +1,154 @@
+"""
+A module implementing vectorized sample codecs for WAVE data.
+"""
+
+# built-in
+from typing import cast
+
+# third-party
+import numpy as np
+
+# internal
+from quasimoto.riff.chunk import ChunkData
+from quasimoto.wave.protocol import WaveType
+
+
+class SampleCodec:
+    """
+    A codec for whole blocks of (little-endian) samples. Decoded integer
+    samples are signed and zero-centered.
+    """
+
+    def __init__(self, bits: int, dtype: str) -> None:
+        """Initialize this instance."""
+
+        self.bits = bits
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def sample_bytes(self) -> int:
+        """Get the size of each encoded sample."""
+        return self.bits // 8
+
+    @property
+    def is_float(self) -> bool:
+        """Determine if this codec's samples are floating point."""
+        return self.dtype.kind == "f"
+
+    @property
+    def is_view(self) -> bool:
+        """Determine if decoded samples are views of encoded data."""
+        return self.dtype.itemsize == self.sample_bytes
+
+    @property
+    def full_scale(self) -> float:
+        """Get the sample magnitude that corresponds to 1.0."""
+        return 1.0 if self.is_float else float(2 ** (self.bits - 1))
+
+    def validate(self, array: np.ndarray) -> None:
+        """Validate that integer samples are in bounds for this codec."""
+
+        if not self.is_float and array.dtype != self.dtype and array.size:
+            bound = 2 ** (self.bits - 1)
+            assert -bound <= array.min() and array.max() < bound
+
+    def decode(self, data: ChunkData) -> np.ndarray:
+        """Decode a block of samples (a view of the data when possible)."""
+        return np.frombuffer(data, dtype=self.dtype)
+
+    def encode(self, array: np.ndarray) -> bytes:
+        """Encode a block of samples."""
+
+        self.validate(array)
+        return array.astype(self.dtype, copy=False).tobytes()
+
+    def to_float(self, array: np.ndarray) -> np.ndarray:
+        """Convert decoded samples to floating point (in [-1.0, 1.0))."""
+
+        if self.is_float:
+            return array
+        return cast(np.ndarray, array / self.full_scale)
+
+    def from_float(self, array: np.ndarray) -> np.ndarray:
+        """Convert floating-point samples to this codec's sample values."""
+
+        if self.is_float:
+            return array.astype(self.dtype, copy=False)
+
+        scale = self.full_scale
+        return np.clip(np.rint(array * scale), -scale, scale - 1).astype(
+            self.dtype
+        )
+
+
+class Pcm8Codec(SampleCodec):
+    """A codec for unsigned (offset) 8-bit samples."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+        super().__init__(8, "<i2")
+
+    def decode(self, data: ChunkData) -> np.ndarray:
+        """Decode a block of samples."""
+
+        return np.frombuffer(data, dtype=np.uint8).astype(self.dtype) - 128
+
+    def encode(self, array: np.ndarray) -> bytes:
+        """Encode a block of samples."""
+
+        self.validate(array)
+
+        # Offset in a wider type (so 8-bit input can't overflow).
+        return (
+            (array.astype(self.dtype, copy=False) + 128)
+            .astype(np.uint8)
+            .tobytes()
+        )
+
+
+class Pcm24Codec(SampleCodec):
+    """A codec for packed 24-bit samples."""
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+        super().__init__(24, "<i4")
+
+    def decode(self, data: ChunkData) -> np.ndarray:
+        """Decode a block of samples."""
+
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+
+        # Place each sample in the upper bytes of a 32-bit value, then
+        # arithmetic shift to sign extend.
+        result = np.zeros((len(raw), 4), dtype=np.uint8)
+        result[:, 1:] = raw
+        return result.view(self.dtype).reshape(-1) >> 8
+
+    def encode(self, array: np.ndarray) -> bytes:
+        """Encode a block of samples."""
+
+        self.validate(array)
+        return (
+            np.ascontiguousarray(array, dtype=self.dtype)
+            .reshape(-1, 1)
+            .view(np.uint8)[:, :3]
+            .tobytes()
+        )
+
+
+CODECS: dict[tuple[WaveType, int], SampleCodec] = {
+    (WaveType.PCM, 8): Pcm8Codec(),
+    (WaveType.PCM, 16): SampleCodec(16, "<i2"),
+    (WaveType.PCM, 24): Pcm24Codec(),
+    (WaveType.PCM, 32): SampleCodec(32, "<i4"),
+    (WaveType.IEEE_FLOAT, 32): SampleCodec(32, "<f4"),
+    (WaveType.IEEE_FLOAT, 64): SampleCodec(64, "<f8"),
+}
+
+
+def get_codec(kind: WaveType, bits: int) -> SampleCodec:
+    """Get the codec for a sample format."""
+
+    result = CODECS.get((kind, bits))
+    assert result is not None, f"Unsupported format: {kind} ({bits}-bit)."
+    return result
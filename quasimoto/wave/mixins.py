@@ -6,11 +6,16 @@ A module hosting mixin classes related to WAVE files.
 from typing import cast
 
 # third-party
+import numpy as np
 from runtimepy.codec.protocol import Protocol
 from vcorelib.logging import LoggerMixin
 
 # internal
-from quasimoto.wave.protocol import WaveFormat
+from quasimoto.wave.codec import SampleCodec, get_codec
+from quasimoto.wave.protocol import WaveFormat, WaveFormatExtension, WaveType
+
+# The default number of frames in blocks of sample data.
+DEFAULT_BLOCK_FRAMES = 4096
 
 
 class FormatMixin(LoggerMixin):
@@ -23,6 +28,7 @@ class FormatMixin(LoggerMixin):
 
         super().__init__()
         self.format = WaveFormat.instance()
+        self.extension = WaveFormatExtension.instance()
 
     @property
     def channels(self) -> int:
@@ -42,6 +48,32 @@ class FormatMixin(LoggerMixin):
         assert bits % 8 == 0
         return self.sample_bits // 8
 
+    @property
+    def frame_bytes(self) -> int:
+        """Get the number of bytes in each frame (one sample per channel)."""
+        return self.channels * self.sample_bytes
+
+    @property
+    def format_type(self) -> WaveType:
+        """Get the sample format (resolving extensible formats)."""
+
+        result = WaveType.normalize(cast(str, self.format["type"]))
+        if result is WaveType.EXTENSIBLE:
+            result = WaveType.normalize(
+                cast(str, self.extension["sub_format"])
+            )
+        return result
+
+    @property
+    def codec(self) -> SampleCodec:
+        """Get the codec for this stream's samples."""
+        return get_codec(self.format_type, self.sample_bits)
+
+    @property
+    def sample_dtype(self) -> np.dtype:
+        """Get the array data type for (decoded) individual samples."""
+        return self.codec.dtype
+
     @property
     def sample_rate(self) -> int:
         """Get the sample rate."""
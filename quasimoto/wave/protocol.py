@@ -14,22 +14,16 @@ class WaveType(RuntimeIntEnum):
     """Enumeration for WAVE data formats."""
 
     PCM = 1
+    IEEE_FLOAT = 3
+    EXTENSIBLE = 0xFFFE
 
 
 WaveType.register_enum(ENUMS)
-
-
-class WaveClass(RuntimeIntEnum):
-    """An enumeration for valid kinds of WAVE configurations."""
-
-    MONO_8 = 1
-    STEREO_8 = 2
-    STEREO_16 = 4
-
-
-WaveClass.register_enum(ENUMS)
 BYTE_ORDER = ByteOrder.LITTLE_ENDIAN
 
+# The remainder of a 'KSDATAFORMAT_SUBTYPE_*' GUID after its format tag.
+SUBFORMAT_GUID_TAIL = bytes.fromhex("000000001000800000aa00389b71")
+
 
 class WaveFormat(ProtocolFactory):
     """Parse the WAVE format data from bytes."""
@@ -45,5 +39,24 @@ class WaveFormat(ProtocolFactory):
         protocol.add_field("sample_rate", "uint32")
         protocol.add_field("bytes_per_second", "uint32")
 
-        protocol.add_field("class", "uint16", enum="WaveClass")
+        # Block alignment (bytes per frame).
+        protocol.add_field("class", "uint16")
         protocol.add_field("bits_per_sample", "uint16")
+
+
+class WaveFormatExtension(ProtocolFactory):
+    """
+    Parse 'fmt ' chunk extension data (the size field, and fields for
+    WAVE_FORMAT_EXTENSIBLE) from bytes.
+    """
+
+    protocol: Protocol = Protocol(ENUMS, byte_order=BYTE_ORDER)
+
+    @classmethod
+    def initialize(cls, protocol: Protocol) -> None:
+        """Initialize this protocol."""
+
+        protocol.add_field("size", "uint16")
+        protocol.add_field("valid_bits", "uint16")
+        protocol.add_field("channel_mask", "uint32")
+        protocol.add_field("sub_format", "uint16", enum="WaveType")
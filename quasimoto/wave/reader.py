@@ -4,19 +4,20 @@ A module implementing interfaces for reading WAVE files.
 
 # built-in
 from contextlib import contextmanager
-from io import BytesIO
 from pathlib import Path
-from typing import Iterator, cast
+from typing import Iterator, Optional
 
 # third-party
-from runtimepy.primitives import Int16
+import numpy as np
 from vcorelib.math.time import nano_str
 
 # internal
 from quasimoto.enums import ChunkType
+from quasimoto.metrics import METRICS
 from quasimoto.riff import RiffInterface
-from quasimoto.riff.chunk import Chunk
-from quasimoto.wave.mixins import FormatMixin
+from quasimoto.riff.chunk import Chunk, ChunkData, ChunkEntry
+from quasimoto.wave.mixins import DEFAULT_BLOCK_FRAMES, FormatMixin
+from quasimoto.wave.protocol import SUBFORMAT_GUID_TAIL
 
 
 class WaveReader(FormatMixin):
@@ -28,36 +29,50 @@ class WaveReader(FormatMixin):
         super().__init__()
 
         assert not riff.is_writer
-
-        # Only expecting 'fmt ' and 'data' chunks.
-        chunks = list(riff.chunks())
-        assert len(chunks) == 2
+        self.riff = riff
 
         # Parse format.
-        format_chunk: Chunk = chunks[0]
-        assert format_chunk.kind is ChunkType.FMT
-        assert format_chunk.size == 16
+        format_entry = self.riff.find(ChunkType.FMT)
+        assert format_entry is not None
+        assert format_entry.size in {16, 18, 40}, format_entry.size
+        format_chunk = self.riff.load(format_entry)
         assert format_chunk.data is not None
-        self.format.array.update(format_chunk.data)
+        data = bytes(format_chunk.data)
+        self.format.array.update(data[:16])
+
+        # Parse WAVE_FORMAT_EXTENSIBLE fields.
+        if format_entry.size == 40:
+            self.extension.array.update(data[16:26])
+            assert data[26:] == SUBFORMAT_GUID_TAIL
 
         # Validate format.
         self.validate_header(self.format)
         self.logger.info("Format header: %s.", self.format)
 
-        # Validate data chunk.
-        self.data: Chunk = chunks[1]
-        assert self.data.kind is ChunkType.DATA
+        # Locate the data chunk (its data is loaded on demand).
+        data_entry = self.riff.find(ChunkType.DATA)
+        assert data_entry is not None
+        self.data_entry: ChunkEntry = data_entry
+        self._data: Optional[Chunk] = None
 
         # Dump some information.
         self.logger.info("%s of sample data.", self.duration_str)
 
+    @property
+    def data(self) -> Chunk:
+        """Get the 'data' chunk (read on first access)."""
+
+        if self._data is None:
+            self._data = self.riff.load(self.data_entry)
+        return self._data
+
     @property
     def num_samples(self) -> int:
         """Get the number of samples contained."""
 
-        all_channels = self.channels * self.sample_bytes
-        assert self.data.size % all_channels == 0
-        return self.data.size // all_channels
+        frame_bytes = self.frame_bytes
+        assert self.data_entry.size % frame_bytes == 0
+        return self.data_entry.size // frame_bytes
 
     @property
     def duration_s(self) -> float:
@@ -69,36 +84,69 @@ class WaveReader(FormatMixin):
         """Get this data's duration as a human-readable string."""
         return nano_str(int(self.duration_s * 1e9), is_time=True) + "s"
 
-    @property
-    def samples(self) -> Iterator[tuple[int, ...]]:
-        """Get raw samples as a generator."""
+    def as_array(self) -> np.ndarray:
+        """
+        Get sample data as a (num_samples, channels) array. This is a view of
+        the underlying chunk data (no copy) for formats that don't need
+        conversion (i.e. not 8 or 24-bit integer samples).
+        """
 
         assert self.data.data is not None
 
-        # Only support reading 16-bit samples.
-        assert self.sample_bytes == 2
-
-        num_channels = self.channels
+        return (
+            self.codec.decode(
+                self.data.data[: self.num_samples * self.frame_bytes]
+            )
+        ).reshape(self.num_samples, self.channels)
+
+    def blocks(
+        self, frames_per_block: int = DEFAULT_BLOCK_FRAMES
+    ) -> Iterator[np.ndarray]:
+        """
+        Get sample data as (frames, channels) arrays of (at most)
+        'frames_per_block' frames, read directly from the underlying stream
+        or memory map.
+        """
+
+        codec = self.codec
+        channels = self.channels
+        block_size = frames_per_block * self.frame_bytes
+
+        stream = self.riff.stream
+        offset = self.data_entry.offset
+        remaining = self.data_entry.size
+
+        while remaining > 0:
+            start = METRICS.start()
+            size = min(block_size, remaining)
+
+            data: ChunkData
+            if self.riff.view is not None:
+                data = self.riff.view[offset : offset + size]
+            else:
+                stream.seek(offset)
+                data = stream.read(size)
+                assert len(data) == size
+
+            block = codec.decode(data).reshape(-1, channels)
+            METRICS.record("wave.read", start, len(block))
+            yield block
+
+            offset += size
+            remaining -= size
 
-        with BytesIO(self.data.data) as stream:
-            with self.log_time("Processing samples", reminder=True):
-                for _ in range(self.num_samples):
-                    yield tuple(
-                        cast(
-                            int,
-                            Int16.kind.read(
-                                stream, byte_order=self.byte_order
-                            ),
-                        )
-                        for _ in range(num_channels)
-                    )
+    @property
+    def samples(self) -> Iterator[tuple[int, ...]]:
+        """Get raw samples as a generator."""
 
-                # Confirm we're at the end of the data.
-                assert stream.tell() == self.data.size
+        with self.log_time("Processing samples", reminder=True):
+            for block in self.blocks():
+                for frame in block.tolist():
+                    yield tuple(frame)
 
     @staticmethod
     @contextmanager
-    def from_path(path: Path) -> Iterator["WaveReader"]:
+    def from_path(path: Path, mmap: bool = False) -> Iterator["WaveReader"]:
         """Get a WAVE reader from a path."""
-        with RiffInterface.from_path(path, is_writer=False) as riff:
+        with RiffInterface.from_path(path, is_writer=False, mmap=mmap) as riff:
             yield WaveReader(riff)
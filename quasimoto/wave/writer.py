@@ -4,23 +4,33 @@ A module implementing interfaces for writing WAVE files.
 
 # built-in
 from contextlib import contextmanager
+from itertools import islice
 import os
 from pathlib import Path
-from typing import BinaryIO, Iterable, Iterator
+from typing import BinaryIO, Iterable, Iterator, Union
 
 # third-party
+import numpy as np
 from runtimepy.primitives import Int16
+from vcorelib.math import byte_count_str, default_time_ns
 
 # internal
 from quasimoto.enums import ChunkType
+from quasimoto.metrics import METRICS
 from quasimoto.riff import RiffInterface
-from quasimoto.riff.chunk import Chunk
-from quasimoto.wave.mixins import FormatMixin
+from quasimoto.riff.chunk import NULL_BYTE, Chunk
+from quasimoto.riff.ds64 import RF64_SIZE
+from quasimoto.wave.codec import get_codec
+from quasimoto.wave.mixins import DEFAULT_BLOCK_FRAMES, FormatMixin
+from quasimoto.wave.protocol import SUBFORMAT_GUID_TAIL, WaveType
 
 DEFAULT_SAMPLE_RATE = 44100
 DEFAULT_CHANNELS = 2
 DEFAULT_BITS = 16
 
+FrameBlock = Union[np.ndarray, list[tuple[int, ...]]]
+Samples = Union[np.ndarray, Iterable[tuple[int, ...]]]
+
 
 class WaveWriter(FormatMixin):
     """A class for reading and writing WAVE files."""
@@ -31,8 +41,14 @@ class WaveWriter(FormatMixin):
         num_channels: int = DEFAULT_CHANNELS,
         sample_rate: int = DEFAULT_SAMPLE_RATE,
         bits_per_sample: int = DEFAULT_BITS,
+        is_float: bool = False,
+        patch_interval_s: float = None,
     ) -> None:
-        """Initialize this instance."""
+        """
+        Initialize this instance. If a patch interval is specified, header
+        sizes are updated each time that much audio has been appended (so
+        an interrupted writer still leaves a readable file).
+        """
 
         super().__init__()
         self.riff = riff
@@ -44,8 +60,17 @@ class WaveWriter(FormatMixin):
         assert (num_channels * bits_per_sample) % 8 == 0
         class_num = num_channels * bits_per_sample // 8
 
+        kind = WaveType.IEEE_FLOAT if is_float else WaveType.PCM
+        codec = get_codec(kind, bits_per_sample)
+
+        # Multi-channel and high-resolution integer formats need
+        # WAVE_FORMAT_EXTENSIBLE.
+        extensible = num_channels > 2 or (
+            not codec.is_float and bits_per_sample > 16
+        )
+
         # Write 'fmt ' chunk.
-        self.format["type"] = "pcm"
+        self.format["type"] = "extensible" if extensible else kind.name.lower()
         self.format["channels"] = num_channels
         self.format["sample_rate"] = sample_rate
         self.format["bytes_per_second"] = int(class_num * sample_rate)
@@ -53,10 +78,33 @@ class WaveWriter(FormatMixin):
         self.format["bits_per_sample"] = bits_per_sample
 
         data = bytes(self.format.array)
+        if extensible:
+            self.extension["size"] = 22
+            self.extension["valid_bits"] = bits_per_sample
+            self.extension["channel_mask"] = (1 << num_channels) - 1
+            self.extension["sub_format"] = kind.name.lower()
+            data += bytes(self.extension.array) + SUBFORMAT_GUID_TAIL
+
+        # Non-PCM formats have an (empty) extension.
+        elif codec.is_float:
+            data += bytes(2)
+
         self.riff.write(Chunk(ChunkType.FMT, len(data), data=data))
 
-        # Write 'data' chunk header.
+        # Write 'data' chunk header (the size is patched as data is
+        # appended).
         ChunkType.DATA.to_stream(self.riff.stream)
+        self.data_size_pos = self.riff.stream.tell()
+        self.riff.write_size(0)
+        self.data_size = 0
+        self.finalized = False
+
+        self.patch_interval = 0
+        if patch_interval_s is not None:
+            self.patch_interval = int(
+                patch_interval_s * class_num * sample_rate
+            )
+        self.last_patch = 0
 
     @classmethod
     def to_bytes(cls, value: int) -> bytes:
@@ -73,27 +121,118 @@ class WaveWriter(FormatMixin):
         stream.write(data)
         return len(data)
 
-    def write(self, samples: Iterable[tuple[int, ...]]) -> None:
-        """Write samples to the output."""
+    def encode(self, block: FrameBlock) -> bytes:
+        """Encode a block of sample frames to bytes."""
+
+        array = np.asarray(block)
+        assert array.size % self.channels == 0
+        return self.codec.encode(array)
+
+    def frame_blocks(
+        self, samples: Samples, block_frames: int = DEFAULT_BLOCK_FRAMES
+    ) -> Iterator[FrameBlock]:
+        """Batch samples into blocks of frames."""
+
+        if isinstance(samples, np.ndarray):
+            yield samples
+        else:
+            frames = iter(samples)
+            block = list(islice(frames, block_frames))
+            while block:
+                yield block
+                block = list(islice(frames, block_frames))
+
+    def patch(self) -> None:
+        """Update header sizes to reflect all data written so far."""
+
+        stream = self.riff.stream
+
+        # RF64 'data' chunk sizes are in the 'ds64' chunk.
+        size = self.data_size
+        if self.riff.rf64 or size >= self.riff.max_size:
+            assert self.riff.ds64_offset is not None, "RF64 is disabled."
+            self.riff.ds64["data_size"] = size
+            self.riff.ds64["sample_count"] = size // self.frame_bytes
+            size = RF64_SIZE
+
+        self.riff.write_size(size, seek=self.data_size_pos)
+        self.riff.finalize()
+
+        stream.seek(0, os.SEEK_END)
+        stream.flush()
+
+        self.last_patch = self.data_size
+
+    def append(self, block: FrameBlock) -> int:
+        """Append a block of sample frames to the 'data' chunk."""
 
-        # Only support writing 16-bit samples.
-        assert self.sample_bytes == 2
+        assert not self.finalized
+
+        start = METRICS.start()
+
+        data = self.encode(block)
+        self.riff.stream.write(data)
+        self.data_size += len(data)
+
+        METRICS.record("wave.write", start, len(data))
+
+        if (
+            self.patch_interval
+            and self.data_size - self.last_patch >= self.patch_interval
+        ):
+            self.patch()
+
+        return len(data)
+
+    def finalize(self) -> None:
+        """Finish the 'data' chunk and update header sizes."""
+
+        if not self.finalized:
+            if self.data_size % 2 == 1:
+                self.riff.stream.write(NULL_BYTE)  # pragma: nocover
+
+            self.patch()
+            self.finalized = True
+
+    def write_blocks(self, blocks: Iterable[FrameBlock]) -> None:
+        """Append blocks of sample frames to the output."""
 
         with self.log_time("Writing samples", reminder=True):
-            self.riff.stream.seek(0, os.SEEK_END)
-            size_pos = self.riff.stream.tell()
-            self.riff.write_size(0)
+            start = default_time_ns()
 
             size = 0
-            for sample in samples:
-                for point in sample:
-                    size += self.to_stream(self.riff.stream, point)
+            for block in blocks:
+                size += self.append(block)
+
+            elapsed_s = (default_time_ns() - start) / 1e9
 
-            self.riff.write_size(size, seek=size_pos)
+            self.patch()
+
+        self.logger.info(
+            "Wrote %s (%.2f MB/s).",
+            byte_count_str(size),
+            (size / 1e6) / elapsed_s if elapsed_s > 0.0 else 0.0,
+        )
+
+    def write(
+        self, samples: Samples, block_frames: int = DEFAULT_BLOCK_FRAMES
+    ) -> None:
+        """
+        Write samples (an array of frames, or an iterable of frame tuples) to
+        the output.
+        """
+        self.write_blocks(self.frame_blocks(samples, block_frames))
 
     @staticmethod
     @contextmanager
-    def from_path(path: Path, **kwargs) -> Iterator["WaveWriter"]:
-        """Get a WAVE reader from a path."""
-        with RiffInterface.from_path(path) as riff:
-            yield WaveWriter(riff, **kwargs)
+    def from_path(
+        path: Path, rf64: bool = None, **kwargs
+    ) -> Iterator["WaveWriter"]:
+        """
+        Get a WAVE writer from a path (see RiffInterface for 'rf64'
+        semantics).
+        """
+        with RiffInterface.from_path(path, rf64=rf64) as riff:
+            writer = WaveWriter(riff, **kwargs)
+            yield writer
+            writer.finalize()
@@ -0,0 +1,140 @@
+"""
+A module implementing vectorized (band-limited) waveform generators.
+"""
+
+# built-in
+from typing import Union, cast
+
+# third-party
+import numpy as np
+
+# Per-sample phase increments (cycles per sample).
+Increment = Union[float, np.ndarray]
+
+DEFAULT_PULSE_WIDTH = 0.5
+
+
+def _residual(phase: np.ndarray, increment: Increment) -> tuple[
+    np.ndarray,
+    np.ndarray,
+    np.ndarray,
+    np.ndarray,
+]:
+    """
+    Get masks (and distances, in samples) for phases within a sample after
+    and before a discontinuity at phase zero.
+    """
+
+    increment = np.broadcast_to(increment, phase.shape)
+
+    after = phase < increment
+    before = phase > 1.0 - increment
+
+    return (
+        after,
+        phase[after] / increment[after],
+        before,
+        (phase[before] - 1.0) / increment[before],
+    )
+
+
+def poly_blep(phase: np.ndarray, increment: Increment) -> np.ndarray:
+    """
+    Get polynomial band-limited step residuals for a unit (rising by two)
+    discontinuity at phase zero.
+    """
+
+    result = np.zeros_like(phase)
+
+    after, x_after, before, x_before = _residual(phase, increment)
+    result[after] = 2.0 * x_after - x_after * x_after - 1.0
+    result[before] = x_before * x_before + 2.0 * x_before + 1.0
+
+    return result
+
+
+def poly_blamp(phase: np.ndarray, increment: Increment) -> np.ndarray:
+    """
+    Get polynomial band-limited ramp residuals for a change in slope at
+    phase zero.
+    """
+
+    result = np.zeros_like(phase)
+
+    after, x_after, before, x_before = _residual(phase, increment)
+    result[after] = -((x_after - 1.0) ** 3) / 3.0
+    result[before] = ((x_before + 1.0) ** 3) / 3.0
+
+    return result
+
+
+def saw(phase: np.ndarray, increment: Increment) -> np.ndarray:
+    """Get (rising) band-limited sawtooth values for phases."""
+    return cast(np.ndarray, 2.0 * phase - 1.0 - poly_blep(phase, increment))
+
+
+def pulse(
+    phase: np.ndarray,
+    increment: Increment,
+    width: Union[float, np.ndarray] = DEFAULT_PULSE_WIDTH,
+) -> np.ndarray:
+    """
+    Get band-limited pulse values for phases (high for the first 'width' of
+    each cycle).
+    """
+
+    falling = np.mod(phase - width + 1.0, 1.0)
+
+    # Residuals can overlap (and overshoot) for very narrow pulses.
+    return cast(
+        np.ndarray,
+        np.clip(
+            np.where(phase < width, 1.0, -1.0)
+            + poly_blep(phase, increment)
+            - poly_blep(falling, increment),
+            -1.0,
+            1.0,
+        ),
+    )
+
+
+def square(phase: np.ndarray, increment: Increment) -> np.ndarray:
+    """Get band-limited square-wave values for phases."""
+    return pulse(phase, increment)
+
+
+def triangle(phase: np.ndarray, increment: Increment) -> np.ndarray:
+    """
+    Get band-limited triangle-wave values for phases (in phase with a
+    sine).
+    """
+
+    peak = np.mod(phase + 0.25, 1.0)
+    trough = np.mod(phase + 0.75, 1.0)
+
+    return cast(
+        np.ndarray,
+        1.0
+        - 4.0 * np.abs(peak - 0.5)
+        + 4.0
+        * np.asarray(increment)
+        * (poly_blamp(peak, increment) - poly_blamp(trough, increment)),
+    )
+
+
+def noise(indices: np.ndarray, seed: int = 0) -> np.ndarray:
+    """
+    Get white-noise values (uniform in [-1.0, 1.0)) for sample indices.
+    Values only depend on the index (and seed) so any span of samples can be
+    rendered independently.
+    """
+
+    # A 'splitmix64' hash of each index (unsigned arithmetic wraps).
+    state = np.asarray(indices).astype(np.uint64)
+    state += np.uint64((seed * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF)
+    state += np.uint64(0x9E3779B97F4A7C15)
+    state = (state ^ (state >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    state = (state ^ (state >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    state ^= state >> np.uint64(31)
+
+    return cast(np.ndarray, (state >> np.uint64(11)) * (2.0 / (1 << 53)) - 1.0)
@@ -4,6 +4,7 @@ A module implementing developmental runtimepy interfaces.
 
 # built-in
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import math
 from typing import Iterator
@@ -15,6 +16,7 @@ from runtimepy.net.arbiter.task import ArbiterTask, TaskFactory
 from runtimepy.primitives import Double
 
 # internal
+from quasimoto.metrics import METRICS
 from tasks.stereo import StereoInterface
 
 
@@ -29,6 +31,21 @@ def get_pyaudio() -> Iterator[pyaudio.PyAudio]:
         audio.terminate()
 
 
+@contextmanager
+def metrics_enabled() -> Iterator[None]:
+    """
+    Enable metrics (without clearing stages registered as channels) and
+    restore the previous setting at the end.
+    """
+
+    enabled = METRICS.enabled
+    METRICS.enabled = True
+    try:
+        yield
+    finally:
+        METRICS.enabled = enabled
+
+
 class StereoTask(ArbiterTask):
     """A task for logging metrics."""
 
@@ -36,6 +53,7 @@ class StereoTask(ArbiterTask):
 
     audio: pyaudio.PyAudio
     stream: pyaudio.Stream
+    executor: ThreadPoolExecutor
 
     def _init_state(self) -> None:
         """Add channels to this instance's channel environment."""
@@ -60,6 +78,16 @@ class StereoTask(ArbiterTask):
             "buffer_depth_scalar", self.buffer_depth_scalar, commandable=True
         )
 
+        # Buffer health.
+        telemetry = self.stereo.telemetry
+        self.env.channel("buffer.fill_s", telemetry.fill_s)
+        self.env.channel("buffer.underruns", telemetry.underruns)
+        self.env.channel("buffer.callback_s", telemetry.callback_s)
+        self.env.channel("buffer.render_s", telemetry.render_s)
+
+        # Per-stage metrics (collected while the application runs).
+        METRICS.register(self.env)
+
     @staticmethod
     @contextmanager
     def get_stream(
@@ -84,6 +112,13 @@ class StereoTask(ArbiterTask):
 
         await super().init(app)
 
+        app.stack.enter_context(metrics_enabled())
+
+        # Samples are rendered off of the event loop.
+        self.executor = app.stack.enter_context(
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="stereo")
+        )
+
         self.audio = app.stack.enter_context(get_pyaudio())
 
         self.stream = app.stack.enter_context(
@@ -95,9 +130,11 @@ class StereoTask(ArbiterTask):
 
         result: bool = self.stream.is_active()
         if result:
-            # Populate 10x our period
-            self.stereo.buffer_to_duration(
-                self.period_s.value * self.buffer_depth_scalar.value
+            # Populate some multiple of our period (in a worker thread).
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                self.stereo.buffer_to_duration,
+                self.period_s.value * self.buffer_depth_scalar.value,
             )
 
         return result
@@ -115,18 +152,23 @@ async def main(app: AppInfo) -> int:
     stereo = list(app.search_tasks(kind=StereoTask))[0].stereo
 
     freq = 0.5
-    loop = asyncio.get_running_loop()
+    step_s = 0.1
+
+    left = stereo.left.automate("amplitude")
+    right = stereo.right.automate("amplitude")
 
-    # Alter the frequencies.
+    # Alter the amplitudes (ramping between control updates).
     while not app.stop.is_set():
+        # Schedule relative to what's been rendered so far.
+        when = stereo.left.time + step_s
+
         # Conform to 0-1 domain.
-        raw = (math.sin(math.tau * loop.time() * freq) + 1.0) / 2.0
+        raw = (math.sin(math.tau * when * freq) + 1.0) / 2.0
 
-        # Re-assign
-        stereo.left.amplitude.value = raw
-        stereo.right.amplitude.value = 1 - raw
+        left.ramp(when, raw)
+        right.ramp(when, 1 - raw)
 
         # Run periodically.
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(step_s)
 
     return 0
@@ -0,0 +1,89 @@
+"""
+Test the 'analysis' module.
+"""
+
+# third-party
+import numpy as np
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto.analysis import (
+    analyze,
+    analyze_reader,
+    dbfs,
+    frame_batches,
+    stft,
+)
+from quasimoto.sampler import Sampler
+from quasimoto.wave import WaveReader, WaveWriter
+
+
+def test_frame_batches():
+    """Test that frames don't depend on how sample data is blocked."""
+
+    data = np.arange(2 * 1000, dtype=np.float64).reshape(-1, 2)
+
+    expected = np.concatenate(list(frame_batches([data], 256, 100)))
+    assert expected.shape == (9, 2, 256)
+    assert (expected[1, 0] == data[100:356, 0]).all()
+
+    # The end is zero padded.
+    assert (expected[-1, 1, :200] == data[800:, 1]).all()
+    assert not expected[-1, :, 200:].any()
+
+    for size in [1, 99, 256, 300]:
+        blocks = [data[x : x + size] for x in range(0, len(data), size)]
+        result = np.concatenate(list(frame_batches(blocks, 256, 100)))
+        assert (result == expected).all()
+
+    # Short inputs are a single (padded) frame.
+    assert len(np.concatenate(list(frame_batches([data[:10]], 256, 128)))) == 1
+
+    # Frames that end exactly at the end of the data aren't padded.
+    assert (
+        len(np.concatenate(list(frame_batches([data[:356]], 256, 100)))) == 2
+    )
+
+
+def test_analyze_basic():
+    """Test analyzing a rendered tone."""
+
+    sampler = Sampler(frequency=1000.0, amplitude=0.5)
+    samples = sampler.block(sampler.sample_rate) / sampler.scalar
+    block = np.column_stack((samples, samples / 2.0))
+
+    result = analyze([block], sampler.sample_rate)
+    assert np.allclose(result.peak_hz, 1000.0, atol=1.0)
+    assert np.allclose(result.peak, [0.5, 0.25], atol=1e-3)
+    assert np.allclose(result.rms, [0.5, 0.25] / np.sqrt(2.0), atol=1e-3)
+    assert np.allclose(dbfs(result.peak), [-6.02, -12.04], atol=0.01)
+
+    # Magnitudes are scaled to sample levels.
+    assert np.allclose(result.spectrum.max(axis=-1), [0.5, 0.25], atol=0.02)
+    assert len(result.frequencies) == result.spectrum.shape[-1]
+
+    spectra = list(stft([block], frame_size=1024, hop=1024))
+    assert sum(len(x) for x in spectra) == 44
+
+
+def test_analyze_reader():
+    """Test analyzing a WAVE file."""
+
+    with tempfile(suffix=".wav") as path:
+        left = Sampler(frequency=440.0, duration_s=2.0)
+        right = left.copy(harmonic=1)
+        with WaveWriter.from_path(
+            path, is_float=True, bits_per_sample=32
+        ) as writer:
+            writer.write(
+                np.column_stack(
+                    (left.block(100000), right.block(100000))
+                ).astype(np.float32)
+                / left.scalar
+            )
+
+        for mmap in [False, True]:
+            with WaveReader.from_path(path, mmap=mmap) as wave:
+                result = analyze_reader(wave, frame_size=8192)
+                assert np.allclose(result.peak_hz, [440.0, 880.0], atol=0.5)
+                assert np.allclose(result.peak, 1.0, atol=1e-3)
@@ -0,0 +1,111 @@
+"""
+Test the 'automation' module.
+"""
+
+# third-party
+import numpy as np
+from runtimepy.primitives import Double
+
+# module under test
+from quasimoto.automation import Automation
+from quasimoto.enums import Ramp
+from quasimoto.sampler import Sampler
+from quasimoto.sampler.oscillator import OscillatorSampler
+
+
+def test_automation_basic():
+    """Test stepping and ramping a parameter."""
+
+    parameter = Double(value=1.0)
+    automation = Automation(parameter)
+    times = np.arange(10, dtype=np.float64)
+
+    # Nothing scheduled.
+    assert not automation
+    assert (automation.values(times) == 1.0).all()
+
+    automation.schedule(2.0, 3.0)
+    automation.ramp(6.0, 5.0)
+    automation.ramp(14.0, 1.0)
+    assert automation
+
+    assert automation.values(times[:5]).tolist() == [1, 1, 3, 3.5, 4]
+    assert automation.values(times[5:]).tolist() == [4.5, 5, 4.5, 4, 3.5]
+    assert parameter.value == 3.5
+
+    # Ramps continue across blocks.
+    assert automation.values(times + 10.0).tolist()[:5] == [3, 2.5, 2, 1.5, 1]
+    assert not automation
+    assert parameter.value == 1.0
+
+    automation.ramp(4.0, 4.0, ramp=Ramp.EXPONENTIAL)
+    assert automation.values(times[:5]).tolist() == [1, 2**0.5, 2, 2**1.5, 4]
+
+    # Events are kept in order (and can be cancelled).
+    automation.schedule(20.0, 2.0)
+    automation.schedule(15.0, 1.0)
+    assert [x.time for x in automation.events] == [15.0, 20.0]
+    automation.cancel()
+    assert not automation
+    assert (automation.values(times) == 4.0).all()
+
+
+def test_sampler_automation():
+    """Test sample-accurate automation of sampler parameters."""
+
+    for kind in [Sampler, OscillatorSampler]:
+        sampler = kind(frequency=1000.0)
+        reference = kind(frequency=1000.0)
+
+        # A step is applied at an exact sample (even mid-block).
+        sampler.automate("amplitude").schedule(100 * sampler.period, 0.5)
+        rendered = sampler.render(256)
+        expected = reference.block(256)
+        expected[100:] *= 0.5
+        assert (rendered == expected.astype(np.int16)).all()
+
+        # Iterating applies automation too.
+        sampler.automate("amplitude").ramp(sampler.time + 0.01, 0.0)
+        values = [next(sampler) for _ in range(1000)]
+        assert abs(values[-1]) < abs(values[0]) or values[0] == 0
+        assert sampler.amplitude.value < 0.5
+
+        # Frequency can be automated.
+        sampler.automate("frequency").ramp(sampler.time + 0.1, 2000.0)
+        sampler.render(10000)
+        assert sampler.frequency.value == 2000.0
+
+
+def crossings(values: np.ndarray) -> int:
+    """Count rising zero crossings."""
+    return int(((values[:-1] < 0) & (values[1:] >= 0)).sum())
+
+
+def test_sampler_frequency_phase():
+    """Test that automated frequency accumulates phase."""
+
+    for kind in [Sampler, OscillatorSampler]:
+        # A ramp from 440 Hz to 880 Hz (over one second) starting late.
+        sampler = kind(frequency=440.0, time=100.0)
+        sampler.automate("frequency").ramp(101.0, 880.0)
+
+        # Average frequency over the first 100 ms is about 462 Hz.
+        count = crossings(sampler.block(sampler.sample_rate // 10))
+        assert 45 <= count <= 47, (kind, count)
+
+        # Steps don't make the phase jump (consecutive values stay close).
+        automation = sampler.automate("frequency")
+        automation.cancel()
+        automation.schedule(sampler.time + 0.01, 220.0)
+        values = np.concatenate(
+            [sampler.block(1000), np.array([next(sampler) for _ in range(10)])]
+        )
+        assert np.abs(np.diff(values)).max() < 0.13 * sampler.scalar
+
+        # Phase keeps accumulating (iterating matches rendering) after
+        # automation finishes.
+        assert sampler.frequency.value == 220.0
+        reference = sampler.state_copy()
+        assert [next(sampler) for _ in range(100)] == reference.render(
+            100
+        ).tolist()
@@ -0,0 +1,34 @@
+"""
+Test the 'buffer' module.
+"""
+
+# third-party
+import numpy as np
+
+# module under test
+from quasimoto.buffer import RingBuffer
+
+
+def test_ring_buffer_basic():
+    """Test basic ring buffer reads and writes."""
+
+    ring = RingBuffer(10)
+    assert ring.frame_bytes == 4
+    assert not ring
+    assert ring.free == 10
+
+    frames = np.arange(30, dtype=np.int16).reshape(-1, 2)
+
+    assert ring.write(frames[:7]) == 7
+    assert (ring.read(4) == frames[:4]).all()
+
+    # Writes and reads wrap around.
+    assert ring.write(frames[7:]) == 7
+    assert len(ring) == 10 and not ring.free
+    assert ring.write(frames) == 0
+
+    assert ring.read_bytes(5) == frames[4:9].tobytes()
+    assert (ring.read(100) == frames[9:14]).all()
+
+    assert not ring.read(1).size
+    assert ring.read_bytes(1) == bytes()
@@ -0,0 +1,93 @@
+"""
+Test the 'cache' module.
+"""
+
+# third-party
+import numpy as np
+import pytest
+
+# module under test
+from quasimoto.cache import RenderCache
+from quasimoto.mixer import Mixer
+from quasimoto.sampler import Sampler
+from quasimoto.sampler.oscillator import OscillatorSampler
+
+
+def test_render_cache_basic():
+    """Test least-recently-used eviction."""
+
+    cache = RenderCache(max_bytes=3 * 800)
+
+    for key in "abc":
+        assert len(cache.get(key, lambda: np.zeros(100))) == 100
+    assert len(cache) == 3
+    assert cache.size == 3 * 800
+
+    # Using an entry makes it the most recently used.
+    assert cache.get("a", lambda: np.ones(100))[0] == 0.0
+    assert cache.hits == 1 and cache.misses == 3
+
+    cache.get("d", lambda: np.zeros(100))
+    assert "b" not in cache
+    assert "a" in cache
+
+    # Cached arrays can't be modified.
+    with pytest.raises(ValueError):
+        cache.get("a", lambda: np.zeros(100))[0] = 1.0
+
+    # Arrays that are too large aren't cached.
+    assert len(cache.put("e", np.zeros(1000))) == 1000
+    assert "e" not in cache
+    assert len(cache) == 3
+
+    cache.clear()
+    assert not cache.entries and cache.size == 0
+
+
+def test_sampler_rendering():
+    """Test getting a sampler's (cached) output."""
+
+    cache = RenderCache()
+
+    for kind in [Sampler, OscillatorSampler]:
+        sampler = kind(duration_s=0.1, amplitude=0.5, cache=cache)
+        reference = kind(duration_s=0.1, amplitude=0.5)
+
+        rendering = sampler.rendering()
+        assert rendering is not None
+        assert sampler.time == 0.0
+        assert (rendering == reference.block(10000)).all()
+
+        # Copies share a cache.
+        assert sampler.copy().amplitude.value == 1.0
+        copied = sampler.copy()
+        copied.amplitude.value = 0.5
+        assert copied.rendering() is rendering
+
+        # Output that isn't finite isn't cached.
+        assert kind(cache=cache).rendering() is None
+        assert reference.rendering() is None
+
+
+def test_mixer_cache():
+    """Test that mixing repeated notes from a cache is identical."""
+
+    def mix(cache: RenderCache = None) -> np.ndarray:
+        """Mix some repeated notes."""
+
+        base = Sampler(duration_s=0.1, cache=cache)
+
+        mixer = Mixer()
+        for index in range(8):
+            mixer.add(
+                base.copy(harmonic=index % 2, duration_s=0.1),
+                start_s=index * 0.05,
+                pan=0.5,
+            )
+
+        return np.concatenate(list(mixer.blocks(block_frames=1000)))
+
+    cache = RenderCache()
+    assert (mix(cache) == mix()).all()
+    assert cache.misses == 2
+    assert cache.hits == 6
@@ -0,0 +1,37 @@
+"""
+Test the 'commands.bench' module.
+"""
+
+# built-in
+import json
+
+# third-party
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto import PKG_NAME
+from quasimoto.bench import BENCHMARKS
+from quasimoto.entry import main as package_main
+
+
+def test_bench_command_basic():
+    """Test basic usages of the 'bench' command."""
+
+    with tempfile(suffix=".json") as tmp:
+        assert (
+            package_main([PKG_NAME, "bench", "-d", "0.1", "-o", str(tmp)]) == 0
+        )
+
+        with tmp.open(encoding="utf-8") as path_fd:
+            data = json.load(path_fd)
+
+        assert set(data["results"]) == set(BENCHMARKS)
+        assert data["results"]["wave_write"]["mb_per_s"] > 0.0
+        assert data["results"]["stereo_frames"]["callback_mean_us"] > 0.0
+
+        assert (
+            package_main(
+                [PKG_NAME, "bench", "-b", "riff_index", "-o", str(tmp)]
+            )
+            == 0
+        )
@@ -3,11 +3,13 @@ Test the 'commands.gen' module.
 """
 
 # third-party
+import numpy as np
 from vcorelib.paths.context import tempfile
 
 # module under test
 from quasimoto import PKG_NAME
 from quasimoto.entry import main as package_main
+from quasimoto.wave import WaveReader
 
 
 def test_gen_command_basic():
@@ -15,3 +17,82 @@ def test_gen_command_basic():
 
     with tempfile() as tmp:
         assert package_main([PKG_NAME, "gen", "-o", str(tmp)]) == 0
+
+        with WaveReader.from_path(tmp) as wave:
+            assert wave.num_samples == 44100
+            assert wave.channels == 2
+            assert wave.as_array().any()
+
+
+def test_gen_command_parallel():
+    """Test rendering segments in parallel."""
+
+    args = [
+        "gen",
+        "-d",
+        "2.5",
+        "-r",
+        "8000",
+        "-c",
+        "1",
+        "--harmonic",
+        "-1",
+        "--harmonic",
+        "0",
+        "--harmonic",
+        "1",
+        "-s",
+        "0.5",
+    ]
+
+    with tempfile(suffix=".wav") as serial:
+        assert (
+            package_main([PKG_NAME, *args, "-j", "1", "-o", str(serial)]) == 0
+        )
+
+        with tempfile(suffix=".wav") as parallel:
+            assert (
+                package_main([PKG_NAME, *args, "-j", "2", "-o", str(parallel)])
+                == 0
+            )
+            assert serial.read_bytes() == parallel.read_bytes()
+
+        with WaveReader.from_path(serial) as wave:
+            assert wave.num_samples == 20000
+            assert wave.channels == 1
+
+
+def test_gen_command_formats():
+    """Test rendering different sample formats."""
+
+    with tempfile(suffix=".wav") as tmp:
+        for args in [["-b", "24"], ["-b", "32", "--float"], ["-b", "8"]]:
+            assert (
+                package_main(
+                    [PKG_NAME, "gen", "-d", "0.1", "-o", str(tmp), *args]
+                )
+                == 0
+            )
+
+            with WaveReader.from_path(tmp) as wave:
+                assert wave.sample_bits == int(args[1])
+                data = wave.codec.to_float(wave.as_array())
+                assert 0.9 < np.abs(data).max() <= 1.0
+
+        # Floating-point output defaults to 32-bit samples.
+        args = [PKG_NAME, "gen", "-d", "0.1", "-o", str(tmp)]
+        assert package_main(args + ["--float"]) == 0
+        with WaveReader.from_path(tmp) as wave:
+            assert wave.sample_bits == 32
+            assert wave.as_array().dtype == np.float32
+
+        # 64-bit floating-point output keeps double precision.
+        assert package_main(args + ["--float", "-b", "64"]) == 0
+        with WaveReader.from_path(tmp) as wave:
+            data = wave.as_array()
+            assert data.dtype == np.float64
+            assert (data != data.astype(np.float32)).any()
+
+        # Unsupported formats are usage errors.
+        for bits in [["-b", "64"], ["-b", "16", "--float"]]:
+            assert package_main(args + bits) != 0
@@ -0,0 +1,74 @@
+"""
+Test the 'commands.scan' module.
+"""
+
+# built-in
+import json
+from pathlib import Path
+
+# third-party
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto import PKG_NAME
+from quasimoto.entry import main as package_main
+from quasimoto.scan import scan
+
+
+def test_scan_command_basic():
+    """Test basic usages of the 'scan' command."""
+
+    with tempfile(suffix=".jsonl") as tmp:
+        directory = tmp.parent.joinpath(tmp.stem)
+        directory.mkdir()
+
+        paths = [directory.joinpath(f"{idx}.wav") for idx in range(3)]
+        for idx, path in enumerate(paths):
+            assert (
+                package_main(
+                    [
+                        PKG_NAME,
+                        "gen",
+                        "-d",
+                        "0.1",
+                        "-a",
+                        "0.5",
+                        "-c",
+                        str(idx + 1),
+                        "-o",
+                        str(path),
+                    ]
+                )
+                == 0
+            )
+
+        # Files that aren't WAVE data are reported.
+        invalid = directory.joinpath("invalid.WAV")
+        invalid.write_bytes(b"not a wave")
+
+        for jobs in ["1", "2"]:
+            assert (
+                package_main(
+                    [PKG_NAME, "scan", "-j", jobs, "-o", str(tmp)]
+                    + [str(directory)]
+                )
+                == 1
+            )
+
+            with tmp.open(encoding="utf-8") as path_fd:
+                results = [json.loads(line) for line in path_fd]
+
+            assert [Path(x["path"]) for x in results] == [*paths, invalid]
+            for idx, result in enumerate(results[:3]):
+                assert result["channels"] == idx + 1
+                assert result["format"] == "pcm"
+                assert result["frames"] == 4410
+                assert all(0.49 < x <= 0.5 for x in result["peak"])
+                assert all(0.34 < x < 0.36 for x in result["rms"])
+            assert "error" in results[3]
+
+        assert [x["channels"] for x in scan(paths)] == [1, 2, 3]
+
+        for path in [*paths, invalid]:
+            path.unlink()
+        directory.rmdir()
@@ -0,0 +1,105 @@
+"""
+Test the 'metrics' module.
+"""
+
+# built-in
+import json
+
+# third-party
+import numpy as np
+from runtimepy.channel.environment import ChannelEnvironment
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto import PKG_NAME
+from quasimoto.entry import main as package_main
+from quasimoto.metrics import METRICS, STAGE_UNITS, Metrics
+from quasimoto.mixer import Mixer
+from quasimoto.sampler import Sampler
+from quasimoto.wave import WaveReader, WaveWriter
+from quasimoto.wave.mixins import DEFAULT_BLOCK_FRAMES
+
+
+def write_and_read(path) -> None:
+    """Render, write and read back some audio."""
+
+    mixer = Mixer()
+    mixer.add(Sampler(duration_s=0.5))
+
+    with WaveWriter.from_path(path) as writer:
+        writer.write_blocks(mixer.blocks())
+
+    with WaveReader.from_path(path) as reader:
+        assert np.concatenate(list(reader.blocks())).any()
+
+
+def test_metrics_basic():
+    """Test collecting metrics from instrumented stages."""
+
+    with tempfile(suffix=".wav") as tmp:
+        # Nothing is measured by default.
+        assert not METRICS.enabled
+        write_and_read(tmp)
+        assert not METRICS.stages
+
+        with tempfile(suffix=".json") as output:
+            with METRICS.collecting(output) as metrics:
+                write_and_read(tmp)
+            assert not METRICS.enabled
+
+            data = json.loads(output.read_text(encoding="utf-8"))
+
+        for name in ["mixer.render", "riff.read", "wave.read", "wave.write"]:
+            assert data[name]["count"] > 0
+            assert data[name]["unit"] == STAGE_UNITS[name]
+            assert sum(data[name]["histogram_ns"].values()) == (
+                data[name]["count"]
+            )
+
+        # Only chunk data is counted (the 'fmt ' chunk, samples are read as
+        # frames), not the size of the 'RIFF' container.
+        assert data["riff.read"]["items"] == 16
+
+        # The final (partial) block is rendered in full.
+        frames = data["wave.read"]["items"]
+        assert abs(frames - 0.5 * 44100) <= 2
+        assert (
+            frames
+            <= data["mixer.render"]["items"]
+            < frames + DEFAULT_BLOCK_FRAMES
+        )
+        assert data["wave.write"]["items"] == 2 * 2 * frames
+        assert metrics.stage("wave.write").rate > 0.0
+
+    # Percentiles are bucket bounds.
+    metrics = Metrics(enabled=True)
+    stage = metrics.stage("test")
+    assert stage.percentile(0.5) == 0.0
+    for elapsed_ns in [100, 100, 100, 5000]:
+        metrics.observe("test", elapsed_ns, 10)
+    assert stage.percentile(0.5) == 128e-9
+    assert stage.percentile(0.99) == 8192e-9
+    assert np.isclose(stage.rate, 40 / 5300e-9)
+
+    # Stages can be exported as channels.
+    env = ChannelEnvironment()
+    metrics.register(env)
+    metrics.register(env, "test")
+    assert set(STAGE_UNITS) < set(metrics.stages)
+    assert env.get("metrics.test.count") is not None
+    assert env.get("metrics.wave.write.bytes") is not None
+
+
+def test_gen_metrics():
+    """Test writing metrics from the 'gen' command."""
+
+    with tempfile(suffix=".wav") as tmp, tempfile(suffix=".json") as output:
+        assert (
+            package_main(
+                [PKG_NAME, "gen", "-j", "1", "-o", str(tmp)]
+                + ["-M", str(output)]
+            )
+            == 0
+        )
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["wave.write"]["items"] > 0
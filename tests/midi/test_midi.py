@@ -0,0 +1,163 @@
+"""
+Test the 'midi' module.
+"""
+
+# built-in
+from io import BytesIO
+import struct
+
+# third-party
+import numpy as np
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto import PKG_NAME
+from quasimoto.entry import main as package_main
+from quasimoto.midi import MidiHeader, read_events, schedule_midi
+from quasimoto.sampler import DEFAULT_FREQUENCY, Sampler
+from quasimoto.scheduler import NoteScheduler
+from quasimoto.wave import WaveReader
+
+
+def varlen(value: int) -> bytes:
+    """Encode a variable-length quantity."""
+
+    result = [value & 0x7F]
+    value >>= 7
+    while value:
+        result.append(0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(reversed(result))
+
+
+def track(*events: tuple[int, bytes]) -> bytes:
+    """Encode a track chunk from (delta, message) pairs."""
+
+    data = b"".join(varlen(delta) + message for delta, message in events)
+    data += b"\x00\xff\x2f\x00"
+    return b"MTrk" + struct.pack(">I", len(data)) + data
+
+
+def sample_midi() -> bytes:
+    """Create a two-track MIDI file."""
+
+    # 480 ticks per quarter note, the tempo halves after two beats.
+    tempo = track(
+        (0, b"\xff\x51\x03" + (500000).to_bytes(3, "big")),
+        (960, b"\xff\x51\x03" + (1000000).to_bytes(3, "big")),
+    )
+    notes = track(
+        (0, b"\xc0\x05"),
+        (0, b"\xf0\x03\x01\x02\xf7"),
+        (0, b"\xb0\x0a\x00"),
+        (0, b"\x90\x3c\x7f"),
+        # Running status (and a zero-velocity note-on as a note-off).
+        (480, b"\x48\x40"),
+        (0, b"\x3c\x00"),
+        # A re-triggered key.
+        (480, b"\x48\x7f"),
+        (480, b"\x80\x48\x00"),
+        # A note that is never released.
+        (0, b"\x90\x30\x40"),
+        (480, b"\xb0\x07\x64"),
+    )
+
+    return (
+        b"MThd"
+        + struct.pack(">IHHH", 6, 1, 2, 480)
+        + b"XXXX\x00\x00\x00\x00"
+        + tempo
+        + notes
+    )
+
+
+def melody(count: int) -> bytes:
+    """Create a single-track MIDI file of consecutive (eighth) notes."""
+
+    events = []
+    for idx in range(count):
+        key = 0x3C + idx % 12
+        events += [(0, bytes([0x90, key, 0x7F])), (240, bytes([0x80, key, 0]))]
+
+    return b"MThd" + struct.pack(">IHHH", 6, 0, 1, 480) + track(*events)
+
+
+def test_midi_events():
+    """Test reading MIDI events."""
+
+    events = list(read_events(BytesIO(sample_midi())))
+    assert [x.kind for _, x in events][:4] == [0xFF, 0xC0, 0xB0, 0x90]
+    assert [x.track for _, x in events][:3] == [0, 1, 1]
+    assert [time_s for time_s, x in events if x.kind == 0x90] == [
+        0.0,
+        0.5,
+        0.5,
+        1.0,
+        2.0,
+    ]
+
+    # Time-code divisions (25 frames per second, 40 ticks per frame).
+    assert MidiHeader(0, 1, ((256 - 25) << 8) | 40).seconds_per_tick() == (
+        0.001
+    )
+
+
+def test_midi_schedule():
+    """Test scheduling MIDI notes."""
+
+    sample_rate = 8000
+    scheduler = NoteScheduler(Sampler(sample_rate=sample_rate))
+    assert schedule_midi(scheduler, BytesIO(sample_midi())) == 3.0
+    assert not scheduler.held
+
+    notes = sorted(scheduler.notes)
+    assert [(x.start_s, x.stop_s) for x in notes] == [
+        (0.0, 0.5),
+        (0.5, 1.0),
+        (1.0, 2.0),
+        (2.0, 3.0),
+    ]
+    assert np.isclose(notes[0].frequency, DEFAULT_FREQUENCY)
+    assert np.isclose(notes[1].frequency, DEFAULT_FREQUENCY * 2)
+    assert np.isclose(notes[3].frequency, DEFAULT_FREQUENCY / 2)
+    assert np.isclose(notes[3].velocity, 64 / 127)
+    assert notes[0].velocity == 1.0 and notes[0].pan == -1.0
+
+    blocks = list(scheduler.blocks())
+    assert sum(len(x) for x in blocks) == round(3.005 * sample_rate)
+
+
+def test_gen_midi():
+    """Test rendering a MIDI file with the 'gen' command."""
+
+    with tempfile(suffix=".mid") as midi:
+        midi.write_bytes(sample_midi())
+
+        with tempfile(suffix=".wav") as tmp:
+            for float_args in ([], ["--float", "-b", "32"]):
+                assert (
+                    package_main(
+                        [PKG_NAME, "gen", "-m", str(midi), "-w", "saw"]
+                        + ["-o", str(tmp), "-r", "8000"]
+                        + float_args
+                    )
+                    == 0
+                )
+                with WaveReader.from_path(tmp) as wave:
+                    values = wave.as_array()
+                    assert len(values) == round(3.005 * 8000)
+                    assert values.any()
+
+        # Long scores aren't normalized by their number of notes (only
+        # releases overlap in a melody).
+        midi.write_bytes(melody(100))
+        with tempfile(suffix=".wav") as tmp:
+            assert (
+                package_main(
+                    [PKG_NAME, "gen", "-m", str(midi), "-o", str(tmp)]
+                    + ["-r", "8000", "--float"]
+                )
+                == 0
+            )
+            with WaveReader.from_path(tmp) as wave:
+                assert np.abs(wave.as_array()).max() > 0.45
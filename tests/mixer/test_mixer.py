@@ -0,0 +1,108 @@
+"""
+Test the 'mixer' module.
+"""
+
+# third-party
+import numpy as np
+import pytest
+
+# module under test
+from quasimoto.enums import ClipPolicy, MixNormalization
+from quasimoto.mixer import Mixer
+from quasimoto.sampler import Sampler
+from quasimoto.sampler.oscillator import OscillatorSampler
+
+
+def test_mixer_basic():
+    """Test mixing voices over spans of time."""
+
+    sample_rate = 1000
+    mixer = Mixer(sample_rate=sample_rate)
+    assert mixer.done
+
+    left = mixer.add(
+        Sampler(sample_rate=sample_rate, duration_s=1.0, frequency=10.0),
+        pan=-1.0,
+        gain=0.5,
+    )
+    right = mixer.add(
+        Sampler(sample_rate=sample_rate, frequency=20.0),
+        pan=1.0,
+        start_s=0.25,
+        stop_s=0.75,
+    )
+
+    blocks = list(mixer.blocks(block_frames=300))
+    assert [len(x) for x in blocks] == [300, 300, 300, 99]
+    assert left.done and right.done
+
+    mix = np.concatenate(blocks)
+
+    expected = Sampler(
+        sample_rate=sample_rate, duration_s=1.0, frequency=10.0
+    ).block(1000)
+    assert (mix[:, 0] == (expected * 0.5).astype(np.int16)).all()
+
+    # The right channel is only present for its span.
+    assert not mix[:250, 1].any()
+    assert not mix[750:, 1].any()
+    expected = Sampler(sample_rate=sample_rate, frequency=20.0).render(500)
+    assert (mix[250:750, 1] == expected).all()
+
+
+def test_mixer_policies():
+    """Test normalization and clipping policies."""
+
+    def create(**kwargs) -> Mixer:
+        """Create a mixer with two unity-gain voices."""
+
+        result = Mixer(num_channels=1, **kwargs)
+        for _ in range(2):
+            result.add(Sampler(frequency=100.0))
+        return result
+
+    # Sums are clipped by default.
+    mix = create().render(1000)
+    assert mix.max() == 32767
+    assert mix.min() == -32767
+
+    reference = Sampler(frequency=100.0).render(1000)
+    for normalization in [MixNormalization.ACTIVE, MixNormalization.VOICES]:
+        mix = create(normalization=normalization).render(1000)
+        assert (mix[:, 0] == reference).all()
+
+    mix = create(clip=ClipPolicy.SOFT).render(1000)
+    assert np.abs(mix).max() < 32767
+
+    with pytest.raises(AssertionError):
+        create(clip=ClipPolicy.NONE).render(1000)
+
+
+def test_mixer_seek():
+    """Test rendering from an arbitrary frame."""
+
+    def create(kind: type[Sampler]) -> Mixer:
+        """Create a mixer with a delayed voice."""
+
+        result = Mixer(num_channels=1)
+        result.add(kind(frequency=100.0), start_s=0.01, stop_s=0.05)
+        return result
+
+    kinds: list[type[Sampler]] = [Sampler, OscillatorSampler]
+    for kind in kinds:
+        mixer = create(kind)
+        expected = mixer.render(4410)
+
+        mixer = create(kind)
+        mixer.seek(1000)
+        mix = mixer.render(3410)
+        assert np.abs(mix.astype(int) - expected[1000:]).max() <= 1, kind
+
+        # Seeking back (after voices have advanced).
+        mixer.seek(500)
+        mix = mixer.render(3910)
+        assert np.abs(mix.astype(int) - expected[500:]).max() <= 1, kind
+
+        mixer.seek(2205)
+        assert mixer.done
+        assert not mixer.render(100).any()
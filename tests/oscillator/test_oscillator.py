@@ -0,0 +1,86 @@
+"""
+Test the 'oscillator' module.
+"""
+
+# built-in
+import math
+
+# third-party
+import numpy as np
+
+# module under test
+from quasimoto.cache import RenderCache
+from quasimoto.oscillator import PHASE_MASK, Oscillator, sine_table
+from quasimoto.sampler import Sampler
+from quasimoto.sampler.oscillator import OscillatorSampler
+
+
+def test_oscillator_basic():
+    """Test basic oscillator rendering."""
+
+    osc = Oscillator(sample_rate=48000)
+    frequency = 440.0
+
+    values = osc.render(48000, frequency)
+    expected = np.sin(math.tau * frequency * np.arange(48000) / 48000)
+
+    # Error is dominated by phase-increment (frequency) quantization.
+    assert np.abs(values - expected).max() < 1e-4
+
+    # Phase wraps exactly, even across many blocks.
+    osc = Oscillator(sample_rate=48000)
+    increment = int(osc.increments(1, frequency)[0])
+    for _ in range(1000):
+        osc.render(4800, frequency)
+    assert osc.phase == (increment * 4800 * 1000) & PHASE_MASK
+
+    # Nothing to render.
+    assert not osc.render(0, frequency).size
+
+
+def test_oscillator_frequency_change():
+    """Test that frequency changes don't cause discontinuities."""
+
+    osc = Oscillator(sample_rate=48000)
+
+    values = np.concatenate(
+        [
+            osc.render(1000, 440.0),
+            osc.render(1000, 880.0),
+            osc.render(1000, np.linspace(880.0, 220.0, 1000)),
+        ]
+    )
+
+    # Largest possible step for a unit sine at 880 Hz.
+    assert np.abs(np.diff(values)).max() <= math.tau * 880.0 / 48000
+
+
+def test_oscillator_sampler():
+    """Test the oscillator-backed sampler."""
+
+    sampler = OscillatorSampler(duration_s=0.25)
+    reference = Sampler(duration_s=0.25)
+
+    values = sampler.render(100000)
+    expected = reference.render(100000)
+    assert len(values) == len(expected)
+    assert np.abs(values.astype(int) - expected).max() <= 1
+
+    # Iteration and copies.
+    other = sampler.copy(harmonic=1, duration_s=0.5)
+    assert other.oscillator.table is sampler.oscillator.table
+    assert other.frequency.value == 2.0 * sampler.frequency.value
+    assert next(iter(OscillatorSampler())) == 0
+
+    # Cached renders are keyed on table contents (tables are read-only).
+    cache = RenderCache()
+    tables = [sine_table(), sine_table(), -sine_table()]
+    renders = [
+        OscillatorSampler(table=x, duration_s=0.01, cache=cache).rendering()
+        for x in tables
+    ]
+    assert not tables[0].flags.writeable
+    assert renders[0] is renders[1]
+    assert renders[0] is not None and renders[2] is not None
+    assert (renders[2] == -renders[0]).all()
+    assert len(cache) == 2
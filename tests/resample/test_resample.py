@@ -0,0 +1,63 @@
+"""
+Test the 'resample' module.
+"""
+
+# third-party
+import numpy as np
+from scipy.signal import resample_poly
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto.analysis import analyze_reader
+from quasimoto.resample import Resampler, resample_wave
+from quasimoto.sampler import Sampler
+from quasimoto.wave import WaveReader, WaveWriter
+
+
+def test_resampler_basic():
+    """Test that streaming resampling matches resampling all at once."""
+
+    data = np.random.default_rng(0).standard_normal((5000, 2))
+
+    for in_rate, out_rate in [(48000, 44100), (44100, 48000), (3, 1)]:
+        resampler = Resampler(in_rate, out_rate)
+        expected = resample_poly(data, resampler.up, resampler.down, axis=0)
+
+        for size in [1, 333, 4096]:
+            resampler = Resampler(in_rate, out_rate)
+            result = np.concatenate(
+                list(
+                    resampler.resample(
+                        data[x : x + size] for x in range(0, len(data), size)
+                    )
+                )
+            )
+            assert result.shape == expected.shape
+            assert np.allclose(result, expected)
+
+            # Only the filter's history is retained.
+            assert len(resampler.history) < 2 * resampler.width
+
+
+def test_resample_wave():
+    """Test converting a WAVE file's sample rate."""
+
+    with tempfile(suffix=".wav") as src, tempfile(suffix=".wav") as dst:
+        left = Sampler(sample_rate=48000, frequency=1000.0, duration_s=1.0)
+        right = left.copy(harmonic=1)
+        with WaveWriter.from_path(src, sample_rate=48000) as writer:
+            writer.write(
+                np.column_stack((left.render(48000), right.render(48000)))
+            )
+
+        with WaveReader.from_path(src) as reader:
+            with WaveWriter.from_path(dst, sample_rate=44100) as writer:
+                resample_wave(reader, writer)
+
+        with WaveReader.from_path(dst) as wave:
+            assert wave.sample_rate == 44100
+            assert wave.num_samples == 44100
+
+            result = analyze_reader(wave)
+            assert np.allclose(result.peak_hz, [1000.0, 2000.0], atol=1.0)
+            assert np.allclose(result.peak, 1.0, atol=0.01)
@@ -3,16 +3,24 @@ Test the 'riff' module.
 """
 
 # built-in
+from io import BytesIO
 from pathlib import Path
+import struct
+from typing import Optional
 
 # third-party
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 from scipy.fft import fftfreq, rfft
 from vcorelib.paths.context import tempfile
 
 # module under test
+from quasimoto.analysis import analyze_reader
+from quasimoto.enums import ChunkType, MixNormalization
+from quasimoto.mixer import Mixer
 from quasimoto.riff import RiffInterface
+from quasimoto.riff.chunk import Chunk
 from quasimoto.sampler import Sampler
 from quasimoto.wave import WaveReader, WaveWriter
 
@@ -28,27 +36,15 @@ def test_riff_reader_basic():
     with RiffInterface.from_path(path, is_writer=False) as reader:
         assert list(reader.chunks())
 
-    left_chan = []
-    right_chan = []
     with WaveReader.from_path(path) as wave:
-        num_bits = wave.sample_bits
-        for left, right in wave.samples:
-            left_chan.append(left / num_bits)
-            right_chan.append(right / num_bits)
+        result = analyze_reader(wave)
 
-        # try doing fft shit
-        left_fft = np.abs(rfft(left_chan))
-
-        num_samples = wave.num_samples
-        plt.plot(
-            fftfreq(num_samples, wave.sample_period)[: (num_samples + 1) // 2],
-            left_fft,
-        )
+        plt.plot(result.frequencies, result.spectrum[0])
 
         # Un-comment while debugging.
         # plt.show()
 
-        assert len(rfft(right_chan)) > 0
+        assert len(result.spectrum[1]) > 0
 
 
 def test_writing_test_wav():
@@ -59,42 +55,24 @@ def test_writing_test_wav():
         base = Sampler(duration_s=duration_s)
         assert iter(base)
 
-        samplers = set(
-            [
-                base.copy(3, duration_s=duration_s / 8.0),
-                base.copy(2, duration_s=duration_s / 4.0),
-                base.copy(1, duration_s=duration_s / 2.0),
-                base,
-                base.copy(-1, duration_s=duration_s / 2.0),
-                base.copy(-2, duration_s=duration_s / 4.0),
-                base.copy(-3, duration_s=duration_s / 8.0),
-            ]
-        )
-
-        samples = []
-        single_chan = []
-
-        while samplers:
-            parts = []
-            to_remove = []
-            for sampler in samplers:
-                val = next(sampler, None)
-                if val is not None:
-                    parts.append(val)
-                else:
-                    to_remove.append(sampler)
-
-            for sampler in to_remove:
-                samplers.remove(sampler)
-
-            if parts:
-                val = int(sum(parts) / len(parts))
-                samples.append((val, val))
-                single_chan.append(val)
+        mixer = Mixer(normalization=MixNormalization.ACTIVE)
+        for sampler in [
+            base.copy(3, duration_s=duration_s / 8.0),
+            base.copy(2, duration_s=duration_s / 4.0),
+            base.copy(1, duration_s=duration_s / 2.0),
+            base,
+            base.copy(-1, duration_s=duration_s / 2.0),
+            base.copy(-2, duration_s=duration_s / 4.0),
+            base.copy(-3, duration_s=duration_s / 8.0),
+        ]:
+            mixer.add(sampler)
 
+        samples = np.concatenate(list(mixer.blocks()))
+        assert (samples[:, 0] == samples[:, 1]).all()
         writer.write(samples)
 
         # try doing fft shit
+        single_chan = samples[:, 0]
         chan_fft = np.abs(rfft(single_chan))
 
         num_samples = len(single_chan)
@@ -127,3 +105,294 @@ def test_riff_writer_basic():
 
             assert left_chan == [0 for _ in range(num_samples)]
             assert right_chan == [0 for _ in range(num_samples)]
+
+
+def test_wave_reader_as_array():
+    """Test getting sample data as an array."""
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(path) as writer:
+            writer.write((idx, -idx) for idx in range(1024))
+
+        with WaveReader.from_path(path) as wave:
+            array = wave.as_array()
+            assert array.shape == (1024, 2)
+            assert not array.flags.owndata
+
+            assert array[:, 0].tolist() == list(range(1024))
+            assert array[:, 1].tolist() == [-x for x in range(1024)]
+            assert list(wave.samples) == [tuple(x) for x in array.tolist()]
+
+
+def test_riff_reader_mmap():
+    """Test reading RIFF files through a memory map."""
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(path) as writer:
+            writer.write((idx, idx // 2) for idx in range(2048))
+
+        with RiffInterface.from_path(path, is_writer=False) as reader:
+            chunks = list(reader.chunks())
+
+        with RiffInterface.from_path(path, is_writer=False, mmap=True) as rif:
+            mapped = list(rif.chunks())
+            assert len(mapped) == len(chunks)
+            for chunk, expected in zip(mapped, chunks):
+                assert chunk.data is not None
+                assert isinstance(chunk.data, memoryview)
+                assert bytes(chunk.data) == expected.data
+
+        with WaveReader.from_path(path) as wave:
+            expected = wave.as_array().tolist()
+
+        with WaveReader.from_path(path, mmap=True) as wave:
+            assert isinstance(wave.data.data, memoryview)
+            assert wave.as_array().tolist() == expected
+            assert list(wave.samples) == [tuple(x) for x in expected]
+
+
+def test_riff_index_lazy():
+    """Test indexing chunks without reading their data."""
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(path) as writer:
+            writer.write((idx, idx) for idx in range(100))
+
+        # Insert a 'LIST' chunk between the 'fmt ' and 'data' chunks.
+        raw = path.read_bytes()
+        info = b"INFO" + b"ISFT" + struct.pack("<I", 5) + b"test\0\0"
+        extra = b"LIST" + struct.pack("<I", len(info)) + info
+        pos = raw.index(b"data")
+        raw = raw[:pos] + extra + raw[pos:]
+        raw = raw[:4] + struct.pack("<I", len(raw) - 8) + raw[8:]
+        path.write_bytes(raw)
+
+        with RiffInterface.from_path(path, is_writer=False) as reader:
+            index = reader.index()
+            assert [x.kind for x in index] == [
+                ChunkType.JUNK,
+                ChunkType.FMT,
+                ChunkType.LIST,
+                ChunkType.DATA,
+            ]
+            assert index[2].form is ChunkType.INFO
+            assert index[3].size == 400
+            assert index[3].offset == pos + len(extra) + 8
+            assert reader.find(ChunkType.ID3) is None
+
+            data = reader.load(index[3]).data
+            assert data is not None
+            assert data == raw[index[3].offset :]
+
+        with WaveReader.from_path(path) as wave:
+            # Sample data isn't read until it's needed.
+            assert wave.num_samples == 100
+            assert wave._data is None  # pylint: disable=protected-access
+            assert wave.as_array()[:, 0].tolist() == list(range(100))
+
+
+class CountingStream(BytesIO):
+    """A stream that counts the bytes read from it."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize this instance."""
+
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: Optional[int] = -1, /) -> bytes:
+        """Read bytes from the stream."""
+
+        result = super().read(size)
+        self.bytes_read += len(result)
+        return result
+
+
+def test_riff_finalize_indexed():
+    """Test that finalizing an indexed reader doesn't read chunk data."""
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(path) as writer:
+            writer.write((idx, idx) for idx in range(10000))
+        raw = path.read_bytes()
+
+    stream = CountingStream(raw)
+    reader = RiffInterface(stream, is_writer=False)
+    assert reader.index()[-1].kind is ChunkType.DATA
+
+    reader.finalize()
+    assert stream.tell() == len(raw)
+    assert stream.bytes_read < 1000
+
+
+def test_riff_unknown_chunks():
+    """Test that unrecognized chunks are kept as opaque chunks."""
+
+    with tempfile(suffix=".wav") as path:
+        with RiffInterface.from_path(path, rf64=False) as riff:
+            ChunkType.WAVE.to_stream(riff.stream)
+            riff.write(Chunk(ChunkType.FACT, 4, data=bytes(4)))
+            riff.write(Chunk(ChunkType.UNKNOWN, 3, data=b"abc", ident=b"abcd"))
+
+        # Add a trailing 'ID3' tag.
+        with path.open("ab") as path_fd:
+            path_fd.write(b"ID3\x03tag")
+
+        with RiffInterface.from_path(path, is_writer=False) as reader:
+            index = reader.index()
+            assert [x.kind for x in index] == [
+                ChunkType.FACT,
+                ChunkType.UNKNOWN,
+            ]
+            assert index[1].ident == b"abcd"
+            assert str(index[1]).startswith("'abcd'")
+
+            chunk = reader.load(index[1])
+            assert chunk.data == b"abc" and chunk.ident == b"abcd"
+            assert str(chunk) == "'abcd' size=3"
+
+        with RiffInterface.from_path(path, is_writer=False) as reader:
+            chunks = list(reader.chunks())
+            assert [x.ident for x in chunks] == [None, b"abcd"]
+
+            # The tag is left in the stream.
+            assert reader.stream.read() == b"ID3\x03tag"
+
+
+def test_wave_writer_blocks():
+    """Test writing arrays and blocks of frames."""
+
+    frames = np.arange(-5000, 5000, dtype=np.int16).reshape(-1, 2)
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(path) as writer:
+            writer.write(frames)
+        expected = path.read_bytes()
+
+        with WaveWriter.from_path(path) as writer:
+            writer.write((tuple(x) for x in frames.tolist()), block_frames=7)
+        assert path.read_bytes() == expected
+
+        with WaveWriter.from_path(path) as writer:
+            writer.write_blocks([frames[:100], frames[100:].tolist()])
+        assert path.read_bytes() == expected
+
+        with WaveReader.from_path(path) as wave:
+            assert (wave.as_array() == frames).all()
+
+        with WaveWriter.from_path(path) as writer:
+            with pytest.raises(AssertionError):
+                writer.write([(2**15, 0)])
+
+
+def test_wave_reader_blocks():
+    """Test reading sample data in blocks."""
+
+    frames = np.arange(-5000, 5000, dtype=np.int16).reshape(-1, 2)
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(path) as writer:
+            writer.write(frames)
+
+        for mmap in [False, True]:
+            with WaveReader.from_path(path, mmap=mmap) as wave:
+                blocks = list(wave.blocks(frames_per_block=1024))
+
+                assert [len(x) for x in blocks] == [1024] * 4 + [904]
+                assert (np.concatenate(blocks) == frames).all()
+
+                # Sample data isn't loaded.
+                assert wave._data is None  # pylint: disable=protected-access
+
+
+def test_wave_writer_streaming():
+    """Test appending to a WAVE file in pieces."""
+
+    frames = np.arange(-5000, 5000, dtype=np.int16).reshape(-1, 2)
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(
+            path, sample_rate=1000, patch_interval_s=1.0
+        ) as writer:
+            for idx, block in enumerate(np.split(frames, 10)):
+                writer.append(block)
+
+                # Sizes are patched after each second of audio.
+                if idx % 2 == 1:
+                    assert writer.last_patch == writer.data_size
+                    with WaveReader.from_path(path) as wave:
+                        assert wave.num_samples == (idx + 1) * 500
+                else:
+                    assert writer.last_patch < writer.data_size
+
+            assert writer.last_patch == writer.data_size
+
+            # Multiple writes append.
+            writer.write(frames)
+            writer.write([(1, 2), (3, 4)])
+
+        with WaveReader.from_path(path) as wave:
+            assert wave.num_samples == 10002
+            data = wave.as_array()
+            assert (data[:5000] == frames).all()
+            assert (data[5000:10000] == frames).all()
+            assert data[10000:].tolist() == [[1, 2], [3, 4]]
+
+
+def test_rf64_basic():
+    """Test writing and reading RF64 files."""
+
+    frames = np.arange(-5000, 5000, dtype=np.int16).reshape(-1, 2)
+
+    with tempfile(suffix=".wav") as path:
+        # Files don't reserve space for 64-bit sizes when RF64 is disabled.
+        with WaveWriter.from_path(path, rf64=False) as writer:
+            writer.write(frames)
+        with RiffInterface.from_path(path, is_writer=False) as reader:
+            assert reader.find(ChunkType.JUNK) is None
+        size = path.stat().st_size
+
+        # Small files are upgraded in place if sizes exceed limits.
+        for rf64, limit in [(None, frames.nbytes + 100), (True, None)]:
+            with WaveWriter.from_path(path, rf64=rf64) as writer:
+                if limit is not None:
+                    writer.riff.max_size = limit
+
+                writer.write(frames)
+                assert path.read_bytes()[:4] == (b"RF64" if rf64 else b"RIFF")
+                writer.write(frames)
+
+            raw = path.read_bytes()
+            assert raw[:4] == b"RF64"
+            assert len(raw) == size + 36 + frames.nbytes
+
+            for mmap in [False, True]:
+                with WaveReader.from_path(path, mmap=mmap) as wave:
+                    assert wave.riff.header.kind is ChunkType.RF64
+                    assert wave.riff.header.size == len(raw) - 8
+                    assert wave.riff.ds64["sample_count"] == 2 * len(frames)
+                    assert wave.riff.index()[0].kind is ChunkType.DS64
+                    assert wave.num_samples == 2 * len(frames)
+                    assert (wave.as_array()[len(frames) :] == frames).all()
+
+            with RiffInterface.from_path(path, is_writer=False) as reader:
+                assert [x.kind for x in reader.chunks()] == [
+                    ChunkType.DS64,
+                    ChunkType.FMT,
+                    ChunkType.DATA,
+                ]
+
+        # A 'data' chunk the size of the limit (the size sentinel) has its
+        # size in the 'ds64' chunk.
+        with WaveWriter.from_path(path) as writer:
+            writer.riff.max_size = frames.nbytes
+            writer.write(frames)
+        with WaveReader.from_path(path) as wave:
+            assert wave.riff.header.kind is ChunkType.RF64
+            assert wave.riff.ds64["data_size"] == frames.nbytes
+            assert (wave.as_array() == frames).all()
+
+        with pytest.raises(AssertionError):
+            with WaveWriter.from_path(path, rf64=False) as writer:
+                writer.riff.max_size = frames.nbytes
+                writer.write(np.concatenate((frames, frames)))
@@ -0,0 +1,37 @@
+"""
+Test the 'sampler' module.
+"""
+
+# module under test
+from quasimoto.sampler import Sampler
+
+
+def test_sampler_render_matches_iterator():
+    """Test that block rendering is identical to iterating samples."""
+
+    base = Sampler(duration_s=0.5, amplitude=0.75)
+    block = base.copy()
+    block.amplitude.value = base.amplitude.value
+
+    # Render in uneven blocks (including past the sampler's duration).
+    rendered = []
+    for count in [1, 100, 4096, 0, 30000]:
+        rendered.extend(block.render(count).tolist())
+
+    assert rendered == list(base)
+    assert block.time == base.time
+
+    # Both should remain exhausted.
+    assert next(base, None) is None
+    assert not block.render(10).size
+    assert block.time == base.time
+
+
+def test_sampler_render_unbounded():
+    """Test rendering from a sampler with no duration."""
+
+    sampler = Sampler(frequency=440.0)
+    other = sampler.copy()
+
+    assert sampler.render(1000).tolist() == [next(other) for _ in range(1000)]
+    assert sampler.time == other.time
@@ -0,0 +1,157 @@
+"""
+Test the 'scheduler' module.
+"""
+
+# third-party
+import numpy as np
+
+# module under test
+from quasimoto.cache import RenderCache
+from quasimoto.envelope import DECLICK_S, Envelope
+from quasimoto.mixer import Mixer
+from quasimoto.sampler import Sampler
+from quasimoto.scheduler import Note, NoteScheduler
+
+
+def test_envelope_levels():
+    """Test envelope segments."""
+
+    envelope = Envelope(attack_s=0.1, decay_s=0.1, sustain=0.5, release_s=0.2)
+    times = np.array([0.0, 0.05, 0.1, 0.15, 0.2, 1.0])
+    assert np.allclose(envelope.levels(times), [0.0, 0.5, 1.0, 0.75, 0.5, 0.5])
+
+    # Releasing during the attack starts from the level reached.
+    times = np.array([0.05, 0.1, 0.15, 0.3])
+    assert np.allclose(
+        envelope.levels(times, release_at=0.05), [0.5, 0.375, 0.25, 0.0]
+    )
+
+    # Zero-length segments.
+    envelope = Envelope(attack_s=0.0, decay_s=0.0, sustain=0.5, release_s=0.0)
+    times = np.array([0.0, 0.5, 1.0, 1.5])
+    assert np.allclose(
+        envelope.levels(times, release_at=1.0), [0.5, 0.5, 0.0, 0.0]
+    )
+
+
+def test_mixer_envelope():
+    """Test that enveloped voices are released rather than cut off."""
+
+    sample_rate = 1000
+    mixer = Mixer(sample_rate=sample_rate)
+    voice = mixer.add(
+        Sampler(sample_rate=sample_rate, frequency=10.0),
+        stop_s=0.5,
+        envelope=Envelope(attack_s=0.0, release_s=0.1),
+    )
+    assert voice.end_frame == 600
+
+    mix = np.concatenate(list(mixer.blocks(block_frames=128)))[:, 0]
+    assert len(mix) == 600
+
+    # Values fade out (from the note-off) instead of stopping abruptly.
+    assert np.abs(np.diff(mix)).max() < 0.1 * mixer.scalar
+    assert np.abs(mix[-10:]).max() < 0.1 * np.abs(mix[450:500]).max()
+
+
+def test_note_scheduler():
+    """Test scheduling notes onto a pool of voices."""
+
+    sample_rate = 8000
+    envelope = Envelope(
+        attack_s=0.01, decay_s=0.05, sustain=0.7, release_s=0.1
+    )
+
+    def scheduler(**kwargs) -> NoteScheduler:
+        """Create a scheduler with a score of overlapping notes."""
+
+        result = NoteScheduler(
+            Sampler(sample_rate=sample_rate, **kwargs),
+            envelope=envelope,
+            max_voices=4,
+        )
+        for idx in range(40):
+            result.note(
+                Note(idx * 0.05, idx * 0.05 + 0.5, 110.0 * (1 + idx % 3))
+            )
+        result.note_on(2.5, "key", 440.0, velocity=0.5)
+        result.note_off(2.75, "key")
+        return result
+
+    mixer = scheduler()
+    assert not mixer.done and not mixer.voices
+
+    # At most 'max_voices' notes sound at once (ignoring the short release
+    # of stolen notes).
+    mixer.schedule()
+    assert not mixer.done
+    spans = []
+    for voice in mixer.voices:
+        assert voice.end_frame is not None
+        spans.append((voice.start_frame, voice.end_frame))
+    assert len(spans) == 41
+    for frame in range(0, 3 * sample_rate, 100):
+        assert sum(start <= frame < end for start, end in spans) <= 5
+        assert (
+            sum(
+                start <= frame < end - round(DECLICK_S * sample_rate)
+                for start, end in spans
+            )
+            <= 4
+        )
+
+    blocks = list(mixer.blocks(block_frames=1000))
+    assert mixer.done
+    mix = np.concatenate(blocks)
+    assert len(mix) == round((2.75 + 0.1) * sample_rate)
+
+    # Rendering in segments (after seeking) matches rendering at once.
+    other = scheduler()
+    other.seek(12345)
+    assert (other.render(1000) == mix[12345:13345]).all()
+    other.seek(0)
+    assert (np.concatenate(list(other.blocks(block_frames=777))) == mix).all()
+
+    # Repeated notes are rendered once (with a cache).
+    cache = RenderCache()
+    cached = scheduler(cache=cache)
+    assert (
+        np.concatenate(list(cached.blocks(block_frames=1000))) == mix
+    ).all()
+    assert cache.hits
+
+
+def test_note_scheduler_cache_memory():
+    """Test that voices only hold cached output while they sound."""
+
+    sample_rate = 8000
+    cache = RenderCache(max_bytes=64 * 1024)
+    scheduler = NoteScheduler(
+        Sampler(sample_rate=sample_rate, cache=cache),
+        envelope=Envelope(release_s=0.01),
+        max_voices=4,
+    )
+
+    # Distinct notes (about 8 KiB of output each), two sounding at once.
+    for idx in range(200):
+        scheduler.note(Note(idx * 0.05, idx * 0.05 + 0.1, 100.0 + idx))
+    scheduler.schedule()
+
+    def held() -> int:
+        """Get the number of bytes held by the cache and voices."""
+
+        return cache.size + sum(
+            x.rendering.nbytes
+            for x in scheduler.voices
+            if x.rendering is not None
+        )
+
+    assert held() == 0
+
+    peak = 0
+    for _ in scheduler.blocks(block_frames=100):
+        peak = max(peak, held())
+
+    assert cache.misses == 200
+    assert cache.max_bytes < peak <= cache.max_bytes + 4 * 8 * 1024
+    assert held() == cache.size <= cache.max_bytes
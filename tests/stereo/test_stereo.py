@@ -0,0 +1,63 @@
+"""
+Test the 'stereo' module.
+"""
+
+# third-party
+import numpy as np
+
+# module under test
+from quasimoto.stereo import StereoInterface
+
+
+def test_stereo_interface_basic():
+    """Test buffering and getting stereo frames."""
+
+    stereo = StereoInterface(buffer_s=0.1, block_frames=1000)
+    reference = StereoInterface()
+
+    # Buffers are filled in whole blocks.
+    assert stereo.buffer_to_duration(0.05) == 3000
+    assert stereo.buffer_to_duration(1.0) == 1000
+    assert len(stereo.ring) == 4000
+
+    # Frames come from the buffer (missing frames are silent).
+    data = stereo.frames(1000) + stereo.frames(4000)
+    assert not stereo.ring
+
+    expected = np.column_stack(
+        [
+            [next(reference.left) for _ in range(4000)],
+            [next(reference.right) for _ in range(4000)],
+        ]
+    ).astype(np.int16)
+    assert data == expected.tobytes() + bytes(1000 * 4)
+
+    # Rendering continues where the buffer left off.
+    assert stereo.buffer_to_duration(0.01) == 1000
+    expected = np.column_stack(
+        [
+            [next(reference.left) for _ in range(1000)],
+            [next(reference.right) for _ in range(1000)],
+        ]
+    ).astype(np.int16)
+    assert stereo.frames(1000) == expected.tobytes()
+
+
+def test_stereo_interface_telemetry():
+    """Test stereo buffer telemetry."""
+
+    stereo = StereoInterface(buffer_s=0.1, block_frames=1000)
+    telemetry = stereo.telemetry
+
+    # Nothing buffered yet.
+    stereo.frames(100)
+    assert telemetry.underruns.raw.value == 1
+    assert telemetry.callback_s.value > 0.0
+
+    stereo.buffer_to_duration(0.05)
+    assert telemetry.fill_s.value == 3000 / stereo.left.sample_rate
+    assert telemetry.render_s.value > 0.0
+
+    stereo.frames(1000)
+    assert telemetry.underruns.raw.value == 1
+    assert telemetry.fill_s.value == 2000 / stereo.left.sample_rate
@@ -0,0 +1,97 @@
+"""
+Test the 'wave.codec' module.
+"""
+
+# third-party
+import numpy as np
+import pytest
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto.wave import WaveReader, WaveWriter
+from quasimoto.wave.codec import CODECS, get_codec
+from quasimoto.wave.protocol import WaveType
+
+
+def test_codecs_round_trip():
+    """Test encoding and decoding blocks with each codec."""
+
+    for (kind, bits), codec in CODECS.items():
+        assert get_codec(kind, bits) is codec
+
+        full_scale = codec.full_scale
+        values = np.linspace(-1.0, 1.0 - 1.0 / full_scale, 1000)
+        samples = codec.from_float(values)
+
+        data = codec.encode(samples)
+        assert len(data) == len(values) * codec.sample_bytes
+
+        decoded = codec.decode(data)
+        assert (decoded == samples).all()
+        assert np.abs(codec.to_float(decoded) - values).max() <= (
+            1.0 / full_scale
+        )
+
+        if not codec.is_float:
+            with pytest.raises(AssertionError):
+                codec.encode(np.array([int(full_scale)]))
+
+    # Spot-check encodings.
+    assert get_codec(WaveType.PCM, 8).encode(np.array([-128, 0, 127])) == (
+        bytes([0, 128, 255])
+    )
+
+    # Narrow integer input is widened before it's offset.
+    codec = get_codec(WaveType.PCM, 8)
+    samples = np.array([-128, -1, 0, 127], dtype=np.int8)
+    assert (codec.decode(codec.encode(samples)) == samples).all()
+    assert codec.encode(np.array([0, 127], dtype=np.uint8)) == bytes(
+        [128, 255]
+    )
+
+    assert get_codec(WaveType.PCM, 24).encode(np.array([-2, 1])) == bytes(
+        [0xFE, 0xFF, 0xFF, 0x01, 0x00, 0x00]
+    )
+
+    with pytest.raises(AssertionError):
+        get_codec(WaveType.IEEE_FLOAT, 16)
+
+
+@pytest.mark.parametrize(
+    "bits,is_float,channels",
+    [
+        (8, False, 1),
+        (16, False, 2),
+        (24, False, 2),
+        (32, False, 6),
+        (32, True, 2),
+        (64, True, 4),
+    ],
+)
+def test_wave_formats(bits: int, is_float: bool, channels: int):
+    """Test writing and reading each sample format."""
+
+    values = np.linspace(-0.99, 0.99, 1000 * channels).reshape(-1, channels)
+
+    with tempfile(suffix=".wav") as path:
+        with WaveWriter.from_path(
+            path,
+            num_channels=channels,
+            bits_per_sample=bits,
+            is_float=is_float,
+        ) as writer:
+            samples = writer.codec.from_float(values)
+            writer.write(samples)
+
+        for mmap in [False, True]:
+            with WaveReader.from_path(path, mmap=mmap) as wave:
+                assert wave.format_type is (
+                    WaveType.IEEE_FLOAT if is_float else WaveType.PCM
+                )
+                assert wave.sample_bits == bits
+                assert wave.channels == channels
+
+                assert (wave.as_array() == samples).all()
+                assert (
+                    np.concatenate(list(wave.blocks(300))) == samples
+                ).all()
@@ -0,0 +1,120 @@
+"""
+Test the 'waveform' module.
+"""
+
+# third-party
+import numpy as np
+from vcorelib.paths.context import tempfile
+
+# module under test
+from quasimoto import PKG_NAME
+from quasimoto.entry import main as package_main
+from quasimoto.enums import Waveform
+from quasimoto.sampler import Sampler
+from quasimoto.sampler.waveform import WaveformSampler
+from quasimoto.wave import WaveReader
+from quasimoto.waveform import noise, pulse
+
+
+def alias_db(values: np.ndarray, frequency: float, sample_rate: int) -> float:
+    """Get the energy between harmonics relative to the harmonics."""
+
+    spectrum = np.abs(np.fft.rfft(values * np.hanning(len(values))))
+    bins = np.fft.rfftfreq(len(values), 1.0 / sample_rate)
+
+    harmonics = np.zeros(len(bins), dtype=bool)
+    for harmonic in np.arange(frequency, sample_rate / 2, frequency):
+        harmonics |= np.abs(bins - harmonic) < 8.0
+
+    return float(
+        20.0 * np.log10(spectrum[~harmonics].sum() / spectrum[harmonics].sum())
+    )
+
+
+def test_waveform_band_limited():
+    """Test that waveforms with discontinuities don't alias."""
+
+    sample_rate = 48000
+    frequency = 3111.7
+    phase = np.mod(np.arange(sample_rate) * frequency / sample_rate, 1.0)
+
+    naive = {
+        Waveform.SQUARE: np.where(phase < 0.5, 1.0, -1.0),
+        Waveform.SAW: 2.0 * phase - 1.0,
+        Waveform.TRIANGLE: 1.0 - 4.0 * np.abs(np.mod(phase + 0.25, 1.0) - 0.5),
+    }
+
+    for waveform, reference in naive.items():
+        sampler = WaveformSampler(
+            waveform=waveform, sample_rate=sample_rate, frequency=frequency
+        )
+        values = sampler.block(sample_rate) / sampler.scalar
+
+        assert np.abs(values).max() <= 1.0
+        assert alias_db(values, frequency, sample_rate) < min(
+            alias_db(reference, frequency, sample_rate) - 15.0, -20.0
+        )
+
+    # Sine waves are the same as the base sampler's.
+    assert (WaveformSampler().render(1000) == Sampler().render(1000)).all()
+
+
+def test_waveform_sampler():
+    """Test other waveform-sampler behavior."""
+
+    # Iterating matches block rendering.
+    for waveform in Waveform:
+        sampler = WaveformSampler(waveform=waveform, frequency=1000.0)
+        reference = sampler.copy()
+        assert [next(sampler) for _ in range(100)] == reference.render(
+            100
+        ).tolist()
+
+    # Noise only depends on sample index (and seed).
+    assert (noise(np.arange(100, 200)) == noise(np.arange(300))[100:200]).all()
+    assert (noise(np.arange(100)) != noise(np.arange(100), seed=1)).all()
+    values = noise(np.arange(100000))
+    assert -1.0 <= values.min() and values.max() < 1.0
+    assert abs(values.mean()) < 0.01
+
+    # Pulse width can be automated.
+    sampler = WaveformSampler(waveform=Waveform.PULSE, frequency=100.0)
+    sampler.automate("pulse_width").ramp(1.0, 0.1)
+    values = sampler.block(sampler.sample_rate)
+    assert 0.45 < (values[:441] > 0).mean() <= 0.55
+    assert (values[-441:] > 0).mean() < 0.15
+
+    # Automated frequency accumulates phase (a ramp from 440 Hz to 880 Hz
+    # starting late averages about 462 Hz over its first 100 ms).
+    for waveform in [Waveform.SAW, Waveform.TRIANGLE]:
+        samplers = [
+            WaveformSampler(waveform=waveform, frequency=440.0, time=100.0)
+            for _ in range(2)
+        ]
+        for sampler in samplers:
+            sampler.automate("frequency").ramp(101.0, 880.0)
+
+        count = sampler.sample_rate // 10
+        values = samplers[0].render(count)
+        assert 45 <= ((values[:-1] < 0) & (values[1:] >= 0)).sum() <= 47
+        assert [next(samplers[1]) for _ in range(count)] == values.tolist()
+
+    # Narrow pulses don't overshoot.
+    phase = np.mod(np.arange(1000) * 0.3, 1.0)
+    assert np.abs(pulse(phase, 0.3, width=0.01)).max() <= 1.0
+
+
+def test_gen_waveform():
+    """Test generating different waveforms."""
+
+    with tempfile(suffix=".wav") as tmp:
+        for waveform in Waveform:
+            assert (
+                package_main(
+                    [PKG_NAME, "gen", "-j", "1", "-w", str(waveform)]
+                    + ["-d", "0.1", "-o", str(tmp)]
+                )
+                == 0
+            )
+            with WaveReader.from_path(tmp) as wave:
+                assert wave.as_array().any()